@@ -98,27 +98,21 @@ class ResetTideUseCase:
             logger.info("[DRY-RUN] Would delete %d event(s)", total_found)
             return ResetResult(total_found=total_found, total_deleted=0, total_failed=0)
 
-        # 2. Delete events
-        total_deleted = 0
-        total_failed = 0
-
-        for event in events:
-            try:
-                deleted = self._calendar_repo.delete_event(event.event_id)
-                if deleted:
-                    total_deleted += 1
-                    logger.debug("Deleted event: %s (%s)", event.event_id, event.date)
-                else:
-                    logger.warning(
-                        "Event already deleted or not found: %s (%s)",
-                        event.event_id,
-                        event.date,
-                    )
-                    # Not found counts as success (idempotent)
-                    total_deleted += 1
-            except Exception as e:
-                total_failed += 1
-                logger.error("Failed to delete event %s (%s): %s", event.event_id, event.date, e)
+        # 2. Delete events (batched per location)
+        event_dates = {event.event_id: event.date for event in events}
+        try:
+            failures = self._calendar_repo.delete_events(list(event_dates))
+        except Exception as e:
+            logger.error("Failed to delete events for %s: %s", location.id, e)
+            failures = dict.fromkeys(event_dates, e)
+
+        for event_id, error in failures.items():
+            logger.error(
+                "Failed to delete event %s (%s): %s", event_id, event_dates[event_id], error
+            )
+
+        total_failed = len(failures)
+        total_deleted = total_found - total_failed
 
         logger.info(
             "Reset completed: %d found, %d deleted, %d failed",
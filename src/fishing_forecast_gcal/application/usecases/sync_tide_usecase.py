@@ -11,6 +11,8 @@
 """
 
 import logging
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from pathlib import Path
 
@@ -25,6 +27,9 @@ from fishing_forecast_gcal.infrastructure.clients.google_drive_client import Goo
 
 logger = logging.getLogger(__name__)
 
+# タイドグラフのアップロードを並行させるスレッド数（Drive API のレート制限を考慮）
+_GRAPH_UPLOAD_WORKERS = 4
+
 
 class SyncTideUseCase:
     """天文潮同期のユースケース
@@ -74,13 +79,16 @@ class SyncTideUseCase:
         self,
         location: Location,
         target_date: date,
-    ) -> None:
+    ) -> CalendarEvent:
         """天文潮を同期
 
         Args:
             location: 対象地点
             target_date: 対象日
 
+        Returns:
+            CalendarEvent: カレンダーに登録したイベント（再取得せずに内容を確認できる）
+
         Raises:
             RuntimeError: 潮汐データ取得またはカレンダー更新に失敗した場合
         """
@@ -88,62 +96,23 @@ class SyncTideUseCase:
 
         try:
             # 1. 前後数日分の潮汐データを取得（期間判定用）
-            date_range = self._get_date_range(target_date, days_before=3, days_after=3)
-            tide_data_list: list[tuple[date, Tide]] = []
-            for d in date_range:
-                try:
-                    tide_data = self._tide_repo.get_tide_data(location, d)
-                    tide_data_list.append((d, tide_data))
-                except Exception as e:
-                    # 前後データ取得失敗はログのみ（対象日以外はスキップ）
-                    if d == target_date:
-                        raise
-                    logger.warning(f"Failed to get tide data for {d}: {e}")
-
-            # 2. 対象日のデータを抽出
-            tide = next((tide for d, tide in tide_data_list if d == target_date), None)
-            if tide is None:
-                raise RuntimeError(f"Target date {target_date} not found in retrieved data")
-            logger.debug(f"Tide data retrieved: {tide.tide_type.value}")
-
-            # 3. 中央日判定
-            is_midpoint = TidePeriodAnalyzer.is_midpoint_day(
-                target_date,
-                [(d, t.tide_type) for d, t in tide_data_list],
-            )
-            logger.debug(f"Is midpoint day: {is_midpoint}")
+            tide_by_date, tide_errors = self._fetch_tide_data(location, target_date, target_date)
+            if target_date in tide_errors:
+                raise tide_errors[target_date]
 
-            # 4. イベントID生成（ドメインロジック）
+            # 2. イベントID生成（ドメインロジック）
             event_id = CalendarEvent.generate_event_id(location.id, target_date)
 
-            # 5. イベント本文生成（中央日フラグを渡す）
-            tide_section = self._format_tide_section(tide, is_midpoint=is_midpoint)
-
-            # 6. 既存イベント取得
+            # 3. 既存イベント取得
             existing_event = self._calendar_repo.get_event(event_id)
 
-            # 7. 既存の[NOTES]を保持
-            existing_notes = None
-            if existing_event:
-                existing_notes = existing_event.extract_section("NOTES")
-                logger.debug("Existing event found, preserving [NOTES] section")
-
-            # 8. イベント本文を構築
-            description = self._build_description(tide_section, existing_notes)
-
-            # 9. CalendarEvent作成
-            event = CalendarEvent(
-                event_id=event_id,
-                title=f"{tide.tide_type.to_emoji()}{location.name} ({tide.tide_type.value})",
-                description=description,
-                date=target_date,
-                location_id=location.id,
-            )
+            # 4. CalendarEvent作成（既存の[NOTES]を保持）
+            event, tide = self._build_event(location, target_date, tide_by_date, existing_event)
 
-            # 10. タイドグラフ画像の生成・アップロード（有効な場合）
+            # 5. タイドグラフ画像の生成・アップロード（有効な場合）
             attachments = self._generate_and_upload_graph(location, target_date, tide)
 
-            # 11. カレンダーに登録（既存イベント情報を渡して重複API呼び出しを回避）
+            # 6. カレンダーに登録（既存イベント情報を渡して重複API呼び出しを回避）
             self._calendar_repo.upsert_event(
                 event, existing=existing_event, attachments=attachments
             )
@@ -153,11 +122,227 @@ class SyncTideUseCase:
             logger.error(f"Failed to sync tide: {e}")
             raise RuntimeError(f"Failed to sync tide for {location.name} on {target_date}") from e
 
+        return event
+
+    def execute_batch(
+        self,
+        location: Location,
+        dates: Sequence[date],
+    ) -> dict[date, Exception]:
+        """複数日分の天文潮をまとめて同期
+
+        潮汐データは対象期間全体（前後3日を含む）を1回ずつ取得し、
+        既存イベントは list_events の1回の呼び出しで取得します。
+        カレンダーへの書き込みは ``upsert_events`` でまとめて送信します。
+
+        Args:
+            location: 対象地点
+            dates: 対象日のリスト
+
+        Returns:
+            dict[date, Exception]: 同期に失敗した日付とその例外（全件成功時は空）
+
+        Raises:
+            RuntimeError: 既存イベントの取得に失敗した場合
+        """
+        if not dates:
+            return {}
+
+        first_date, last_date = min(dates), max(dates)
+        logger.info(
+            f"Syncing tide for {location.name} from {first_date} to {last_date} ({len(dates)} days)"
+        )
+
+        failures: dict[date, Exception] = {}
+
+        # 1. 対象期間全体の潮汐データを取得（各日1回のみ）
+        tide_by_date, tide_errors = self._fetch_tide_data(location, first_date, last_date)
+
+        # 2. 既存イベントを一括取得
+        try:
+            existing_events = {
+                e.event_id: e
+                for e in self._calendar_repo.list_events(first_date, last_date, location.id)
+            }
+        except Exception as e:
+            logger.error(f"Failed to list existing events: {e}")
+            raise RuntimeError(f"Failed to sync tide for {location.name}") from e
+
+        # 3. 各日のイベントを構築
+        events: list[CalendarEvent] = []
+        graph_targets: list[tuple[str, date, Tide]] = []
+        date_by_id: dict[str, date] = {}
+        for target_date in dates:
+            if target_date in tide_errors:
+                failures[target_date] = tide_errors[target_date]
+                continue
+            try:
+                event_id = CalendarEvent.generate_event_id(location.id, target_date)
+                event, tide = self._build_event(
+                    location, target_date, tide_by_date, existing_events.get(event_id)
+                )
+            except Exception as e:
+                failures[target_date] = e
+                continue
+
+            events.append(event)
+            graph_targets.append((event.event_id, target_date, tide))
+            date_by_id[event.event_id] = target_date
+
+        # 4. タイドグラフの生成・アップロード（有効な場合）
+        attachments_by_id = self._generate_and_upload_graphs(location, graph_targets)
+
+        # 5. カレンダーにまとめて登録
+        if events:
+            upsert_failures = self._calendar_repo.upsert_events(
+                events, existing=existing_events, attachments=attachments_by_id
+            )
+            for event_id, error in upsert_failures.items():
+                failures[date_by_id[event_id]] = error
+
+        logger.info(f"Batch sync finished: {len(dates) - len(failures)}/{len(dates)} succeeded")
+
+        return failures
+
+    def _fetch_tide_data(
+        self,
+        location: Location,
+        first_date: date,
+        last_date: date,
+    ) -> tuple[dict[date, Tide], dict[date, Exception]]:
+        """対象期間（前後3日を含む）の潮汐データを取得
+
+        Args:
+            location: 対象地点
+            first_date: 対象期間の開始日
+            last_date: 対象期間の終了日
+
+        Returns:
+            (日付→潮汐データ, 対象期間内で取得に失敗した日付→例外)
+        """
+        tide_by_date, range_errors = self._tide_repo.get_tide_data_range(
+            location, first_date - timedelta(days=3), last_date + timedelta(days=3)
+        )
+
+        errors: dict[date, Exception] = {}
+        for d, e in range_errors.items():
+            # 前後データ取得失敗はログのみ（対象日以外はスキップ）
+            if first_date <= d <= last_date:
+                errors[d] = e
+            else:
+                logger.warning(f"Failed to get tide data for {d}: {e}")
+
+        return tide_by_date, errors
+
+    def _build_event(
+        self,
+        location: Location,
+        target_date: date,
+        tide_by_date: dict[date, Tide],
+        existing_event: CalendarEvent | None,
+    ) -> tuple[CalendarEvent, Tide]:
+        """対象日の CalendarEvent を構築
+
+        Args:
+            location: 対象地点
+            target_date: 対象日
+            tide_by_date: 前後3日を含む潮汐データ
+            existing_event: 既存イベント（存在する場合）
+
+        Returns:
+            (CalendarEvent, 対象日の潮汐データ)
+
+        Raises:
+            RuntimeError: 対象日の潮汐データが存在しない場合
+        """
+        # 1. 対象日のデータを抽出
+        tide = tide_by_date.get(target_date)
+        if tide is None:
+            raise RuntimeError(f"Target date {target_date} not found in retrieved data")
+        logger.debug(f"Tide data retrieved: {tide.tide_type.value}")
+
+        # 2. 中央日判定（前後3日の範囲で判定）
+        window = self._get_date_range(target_date, days_before=3, days_after=3)
+        is_midpoint = TidePeriodAnalyzer.is_midpoint_day(
+            target_date,
+            [(d, tide_by_date[d].tide_type) for d in window if d in tide_by_date],
+        )
+        logger.debug(f"Is midpoint day: {is_midpoint}")
+
+        # 3. イベント本文生成（中央日フラグを渡す）
+        tide_section = self._format_tide_section(tide, is_midpoint=is_midpoint)
+
+        # 4. 既存の[NOTES]を保持
+        existing_notes = None
+        if existing_event:
+            existing_notes = existing_event.extract_section("NOTES")
+            logger.debug("Existing event found, preserving [NOTES] section")
+
+        # 5. イベント本文を構築
+        description = self._build_description(tide_section, existing_notes)
+
+        event = CalendarEvent(
+            event_id=CalendarEvent.generate_event_id(location.id, target_date),
+            title=f"{tide.tide_type.to_emoji()}{location.name} ({tide.tide_type.value})",
+            description=description,
+            date=target_date,
+            location_id=location.id,
+        )
+        return event, tide
+
+    def _generate_and_upload_graphs(
+        self,
+        location: Location,
+        targets: list[tuple[str, date, Tide]],
+    ) -> dict[str, list[dict[str, str]]]:
+        """複数日のタイドグラフを生成・アップロードし、イベントIDごとの attachments を返す
+
+        Drive フォルダは1回だけ取得し、各日のアップロードはスレッドで並行させます
+        （描画はレンダラー側のロックで直列化されます）。
+
+        Args:
+            location: 対象地点
+            targets: (イベントID, 対象日, 潮汐データ) のリスト
+
+        Returns:
+            dict[str, list[dict[str, str]]]: 添付に成功したイベントIDと attachments
+        """
+        if not self._tide_graph_enabled or not targets:
+            return {}
+
+        assert self._drive_client is not None
+
+        try:
+            folder_id = self._drive_client.get_or_create_folder(self._drive_folder_name)
+        except Exception as e:
+            logger.warning(
+                f"Drive folder lookup failed for {location.name}: {e}. "
+                "Continuing without image attachments."
+            )
+            return {}
+
+        def generate_and_upload(
+            target: tuple[str, date, Tide],
+        ) -> tuple[str, list[dict[str, str]] | None]:
+            event_id, target_date, tide = target
+            return event_id, self._generate_and_upload_graph(
+                location, target_date, tide, folder_id=folder_id
+            )
+
+        workers = min(_GRAPH_UPLOAD_WORKERS, len(targets))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return {
+                event_id: attachments
+                for event_id, attachments in executor.map(generate_and_upload, targets)
+                if attachments is not None
+            }
+
     def _generate_and_upload_graph(
         self,
         location: Location,
         target_date: date,
         tide: Tide,
+        folder_id: str | None = None,
     ) -> list[dict[str, str]] | None:
         """タイドグラフ画像を生成・Drive にアップロードし、attachments を返す
 
@@ -167,6 +352,7 @@ class SyncTideUseCase:
             location: 対象地点
             target_date: 対象日
             tide: 潮汐データ
+            folder_id: アップロード先の Drive フォルダID（None の場合はここで取得）
 
         Returns:
             list[dict[str, str]] | None: Calendar attachments（失敗時は None）
@@ -194,8 +380,9 @@ class SyncTideUseCase:
             )
             logger.info(f"Tide graph generated: {image_path}")
 
-            # 4. Drive フォルダを取得/作成
-            folder_id = self._drive_client.get_or_create_folder(self._drive_folder_name)
+            # 4. Drive フォルダを取得/作成（未取得の場合のみ）
+            if folder_id is None:
+                folder_id = self._drive_client.get_or_create_folder(self._drive_folder_name)
 
             # 5. Drive にアップロード（同名ファイルがあれば上書き更新）
             upload_result = self._drive_client.upload_or_update_file(
@@ -247,13 +434,7 @@ class SyncTideUseCase:
             日付のリスト（昇順）
         """
         start_date = target_date - timedelta(days=days_before)
-        end_date = target_date + timedelta(days=days_after)
-        date_range = []
-        current = start_date
-        while current <= end_date:
-            date_range.append(current)
-            current += timedelta(days=1)
-        return date_range
+        return [start_date + timedelta(days=i) for i in range(days_before + days_after + 1)]
 
     @staticmethod
     def _format_tide_section(tide: Tide, is_midpoint: bool = False) -> str:
@@ -7,8 +7,7 @@
 from __future__ import annotations
 
 import hashlib
-import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import date
 
 
@@ -114,11 +113,11 @@ class CalendarEvent:
             >>> event.extract_section("TIDE")
             "- 満潮: 06:12 (162cm)\\n- 干潮: 12:34 (58cm)\\n- 時合い: 04:12-08:12"
         """
-        pattern = rf"\[{section_name}\](.*?)(?=\n\[|$)"
-        match = re.search(pattern, self.description, re.DOTALL)
-        if match:
-            return match.group(1).strip()
-        return None
+        bounds = _find_section(self.description, section_name)
+        if bounds is None:
+            return None
+        content_start, content_end = bounds
+        return self.description[content_start:content_end].strip()
 
     def update_section(self, section_name: str, new_content: str) -> CalendarEvent:
         """指定されたセクションの内容を更新した新しいインスタンスを返す
@@ -139,13 +138,44 @@ class CalendarEvent:
         if not self.extract_section(section_name):
             raise ValueError(f"Section [{section_name}] does not exist in description")
 
-        # セクションを更新
-        pattern = rf"(\[{section_name}\])(.*?)(?=\n\[|$)"
-        updated_description = re.sub(
-            pattern, rf"\1\n{new_content}", self.description, flags=re.DOTALL
-        )
+        # セクション本文を差し替えながら 1 回の走査で本文を組み立てる
+        description = self.description
+        parts: list[str] = []
+        position = 0
+        while (bounds := _find_section(description, section_name, position)) is not None:
+            content_start, content_end = bounds
+            parts.append(description[position:content_start])
+            parts.append(f"\n{new_content}")
+            position = content_end
+        parts.append(description[position:])
 
         # 新しいインスタンスを返す（dataclassのreplaceを使用）
-        from dataclasses import replace
+        return replace(self, description="".join(parts))
+
+
+def _find_section(description: str, section_name: str, start: int = 0) -> tuple[int, int] | None:
+    """セクション本文の範囲を探す
+
+    ``[セクション名]`` の直後から、次のセクション見出し（改行 + ``[``）または
+    本文末尾までを本文とします。本文末尾の改行 1 つはセクションに含めません。
+
+    Args:
+        description: イベント本文
+        section_name: セクション名（例: "TIDE", "NOTES"）
+        start: 探索開始位置
+
+    Returns:
+        (本文開始位置, 本文終了位置)。セクションが存在しない場合は None。
+    """
+    marker = f"[{section_name}]"
+    marker_start = description.find(marker, start)
+    if marker_start < 0:
+        return None
 
-        return replace(self, description=updated_description)
+    content_start = marker_start + len(marker)
+    content_end = description.find("\n[", content_start)
+    if content_end < 0:
+        content_end = len(description)
+        if description.endswith("\n") and content_end > content_start:
+            content_end -= 1
+    return content_start, content_end
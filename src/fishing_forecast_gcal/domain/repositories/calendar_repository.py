@@ -5,6 +5,7 @@ Infrastructure層で具体的な実装（Google Calendar API クライアント
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from datetime import date
 
 from ..models.calendar_event import CalendarEvent
@@ -77,6 +78,44 @@ class ICalendarRepository(ABC):
         """
         ...
 
+    def upsert_events(
+        self,
+        events: list[CalendarEvent],
+        *,
+        existing: Mapping[str, CalendarEvent] | None = None,
+        attachments: Mapping[str, list[dict[str, str]]] | None = None,
+    ) -> dict[str, Exception]:
+        """Create or update multiple calendar events.
+
+        複数のイベントをまとめて作成/更新します。
+        デフォルト実装は upsert_event を 1 件ずつ呼び出します。
+        一括送信に対応した実装ではオーバーライドしてください。
+
+        Args:
+            events: Events to create or update. (作成または更新するイベント)
+            existing: Pre-fetched existing events keyed by event_id.
+                When provided, events missing from the mapping are created.
+                Pass None to let the implementation check existence itself.
+                (event_id をキーとする事前取得済みの既存イベント)
+            attachments: File attachments keyed by event_id.
+                (event_id をキーとする添付ファイル情報)
+
+        Returns:
+            dict[str, Exception]: Failed event IDs and their errors
+            (empty if all succeeded / 失敗したイベントIDと例外)
+        """
+        failures: dict[str, Exception] = {}
+        for event in events:
+            try:
+                self.upsert_event(
+                    event,
+                    existing=existing.get(event.event_id) if existing is not None else None,
+                    attachments=attachments.get(event.event_id) if attachments else None,
+                )
+            except Exception as e:
+                failures[event.event_id] = e
+        return failures
+
     @abstractmethod
     def list_events(
         self, start_date: date, end_date: date, location_id: str
@@ -119,3 +158,26 @@ class ICalendarRepository(ABC):
             RuntimeError: If API call fails (認証エラー、ネットワークエラー等)
         """
         ...
+
+    def delete_events(self, event_ids: list[str]) -> dict[str, Exception]:
+        """Delete multiple calendar events by ID (idempotent).
+
+        複数のイベントをまとめて削除します（冪等操作）。
+        デフォルト実装は delete_event を 1 件ずつ呼び出します。
+        一括送信に対応した実装ではオーバーライドしてください。
+
+        Args:
+            event_ids: Event IDs to delete. (削除するイベントID)
+
+        Returns:
+            dict[str, Exception]: Failed event IDs and their errors.
+            Events that did not exist count as deleted.
+            (empty if all succeeded / 失敗したイベントIDと例外。存在しないイベントは成功扱い)
+        """
+        failures: dict[str, Exception] = {}
+        for event_id in event_ids:
+            try:
+                self.delete_event(event_id)
+            except Exception as e:
+                failures[event_id] = e
+        return failures
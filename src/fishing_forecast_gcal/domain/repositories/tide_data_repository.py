@@ -5,7 +5,7 @@ Infrastructure層で具体的な実装（UTideライブラリ、APIクライア
 """
 
 from abc import ABC, abstractmethod
-from datetime import date
+from datetime import date, timedelta
 
 from ..models.location import Location
 from ..models.tide import Tide
@@ -44,6 +44,32 @@ class ITideDataRepository(ABC):
         """
         ...
 
+    def get_tide_data_range(
+        self, location: Location, start_date: date, end_date: date
+    ) -> tuple[dict[date, Tide], dict[date, Exception]]:
+        """指定地点・期間の潮汐データをまとめて取得
+
+        デフォルト実装は get_tide_data を1日ずつ呼び出します。
+        期間をまとめて計算できる実装ではオーバーライドしてください。
+
+        Args:
+            location: 対象地点の情報
+            start_date: 期間の開始日（この日を含む）
+            end_date: 期間の終了日（この日を含む）
+
+        Returns:
+            (日付→潮汐データ, 取得に失敗した日付→例外) のタプル
+        """
+        tides: dict[date, Tide] = {}
+        errors: dict[date, Exception] = {}
+        for offset in range((end_date - start_date).days + 1):
+            target_date = start_date + timedelta(days=offset)
+            try:
+                tides[target_date] = self.get_tide_data(location, target_date)
+            except Exception as e:
+                errors[target_date] = e
+        return tides, errors
+
     @abstractmethod
     def get_hourly_heights(
         self, location: Location, target_date: date
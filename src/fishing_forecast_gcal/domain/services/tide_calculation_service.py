@@ -45,71 +45,41 @@ class TideCalculationService:
 
         events: list[TideEvent] = []
 
-        prev_sign = self._trend_sign(data[1][1] - data[0][1])
-        index = 1
+        # 隣接点の差分の符号を 1 回だけ計算する（signs[i] は i → i+1 の傾き）
+        heights = [height for _, height in data]
+        signs = [(b > a) - (b < a) for a, b in zip(heights, heights[1:], strict=False)]
 
-        while index < len(data) - 1:
-            curr_height = data[index][1]
-            next_height = data[index + 1][1]
-            curr_sign = self._trend_sign(next_height - curr_height)
+        prev_sign = signs[0]
+        plateau_start: int | None = None
 
-            if curr_sign == 0:
-                plateau_start = index
-                while (
-                    index < len(data) - 1
-                    and self._trend_sign(data[index + 1][1] - data[index][1]) == 0
-                ):
-                    index += 1
-                plateau_end = index
-                if index >= len(data) - 1:
-                    break
-                next_sign = self._trend_sign(data[index + 1][1] - data[index][1])
-
-                if prev_sign > 0 and next_sign < 0:
-                    midpoint_index = (plateau_start + plateau_end) // 2
-                    time, height_cm = data[midpoint_index]
-                    self._add_event_if_valid(events, time, height_cm, "high")
-                elif prev_sign < 0 and next_sign > 0:
-                    midpoint_index = (plateau_start + plateau_end) // 2
-                    time, height_cm = data[midpoint_index]
-                    self._add_event_if_valid(events, time, height_cm, "low")
-
-                if next_sign != 0:
-                    prev_sign = next_sign
+        for index in range(1, len(signs)):
+            curr_sign = signs[index]
 
-                index += 1
+            if curr_sign == 0:
+                # 平坦区間の開始（終端まで平坦なら極値なし）
+                if plateau_start is None:
+                    plateau_start = index
                 continue
 
-            if prev_sign > 0 and curr_sign < 0:
-                time, height_cm = data[index]
-                self._add_event_if_valid(events, time, height_cm, "high")
-            elif prev_sign < 0 and curr_sign > 0:
+            if plateau_start is not None:
+                # 平坦区間の前後で傾きが反転していれば中点を極値とする
+                if prev_sign != curr_sign and prev_sign != 0:
+                    midpoint_index = (plateau_start + index) // 2
+                    time, height_cm = data[midpoint_index]
+                    self._add_event_if_valid(
+                        events, time, height_cm, "high" if prev_sign > 0 else "low"
+                    )
+                plateau_start = None
+            elif curr_sign != prev_sign and prev_sign != 0:
                 time, height_cm = data[index]
-                self._add_event_if_valid(events, time, height_cm, "low")
+                self._add_event_if_valid(
+                    events, time, height_cm, "high" if prev_sign > 0 else "low"
+                )
 
             prev_sign = curr_sign
-            index += 1
 
         return events
 
-    @staticmethod
-    def _trend_sign(delta: float) -> int:
-        """Return the sign of a delta value.
-
-        差分の符号を返します。
-
-        Args:
-            delta: 連続データ間の差分値
-
-        Returns:
-            差分の符号（正なら1、負なら-1、ゼロなら0）
-        """
-        if delta > 0:
-            return 1
-        if delta < 0:
-            return -1
-        return 0
-
     def _add_event_if_valid(
         self,
         events: list[TideEvent],
@@ -151,15 +121,21 @@ class TideCalculationService:
         Returns:
             Tide range in cm. Returns 0.0 if no high or low tides.
         """
-        high_tides = [e for e in events if e.event_type == "high"]
-        low_tides = [e for e in events if e.event_type == "low"]
-
-        if not high_tides or not low_tides:
+        # 1 パスで満潮の最大値と干潮の最小値を同時に求める
+        max_high: float | None = None
+        min_low: float | None = None
+        for e in events:
+            height = e.height_cm
+            if e.event_type == "high":
+                if max_high is None or height > max_high:
+                    max_high = height
+            elif min_low is None or height < min_low:
+                min_low = height
+
+        if max_high is None or min_low is None:
             logger.warning("Cannot calculate tide range: missing high or low tide")
             return 0.0
 
-        max_high = max(e.height_cm for e in high_tides)
-        min_low = min(e.height_cm for e in low_tides)
         tide_range = max_high - min_low
 
         logger.debug(
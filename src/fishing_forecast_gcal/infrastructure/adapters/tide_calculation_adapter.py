@@ -9,13 +9,14 @@ UTideライブラリをラップし、調和定数に基づく潮汐予測を提
 
 import logging
 import pickle
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import numpy as np
 import pandas as pd
 import utide
+from pandas.arrays import DatetimeArray
 
 from fishing_forecast_gcal.domain.models.location import Location
 
@@ -24,6 +25,10 @@ logger = logging.getLogger(__name__)
 # UTide coef の型エイリアス（utide.utilities.Bunch は辞書ライクなオブジェクト）
 type UTideCoefficients = dict[str, Any]
 
+# プロセス内で共有する調和定数キャッシュ（キー: pickle ファイルのパス、値: ((mtime_ns, size), coef)）
+# 同じプロセスで複数のアダプターを作っても読み直さない。ファイル更新は stamp で検出する
+_process_coef_cache: dict[Path, tuple[tuple[int, int], UTideCoefficients]] = {}
+
 
 class TideCalculationAdapter:
     """Tide calculation adapter using UTide harmonic analysis.
@@ -66,6 +71,24 @@ class TideCalculationAdapter:
         """Return the harmonics directory path."""
         return self._harmonics_dir
 
+    def prepare(self, location: Location) -> None:
+        """Load and cache harmonic coefficients for a location in advance.
+
+        地点の調和定数を事前に読み込み、キャッシュします。
+        同期ループの開始前に呼び出すことで、ファイル欠落や破損を早期に検出できます。
+
+        Args:
+            location (Location): Target location. (対象地点情報)
+
+        Raises:
+            FileNotFoundError: If harmonic coefficient file for the location
+                               is not found.
+                               (地点の調和定数ファイルが見つからない場合)
+            RuntimeError: If the coefficient file is corrupted or invalid.
+                          (調和定数ファイルが破損・不正な場合)
+        """
+        self._load_coefficients(location.station_id)
+
     def calculate_tide(
         self,
         location: Location,
@@ -106,10 +129,50 @@ class TideCalculationAdapter:
             RuntimeError: If tidal prediction fails.
                           (潮汐予測の計算に失敗した場合)
         """
+        return self.calculate_tide_range(location, target_date, target_date)[target_date]
+
+    def calculate_tide_range(
+        self,
+        location: Location,
+        start_date: date,
+        end_date: date,
+    ) -> dict[date, list[tuple[datetime, float]]]:
+        """Calculate tidal heights for every date in a range with one prediction.
+
+        期間全体の予測時刻をまとめて UTide reconstruct に渡し、日付ごとに分割して返します。
+        各日のデータは ``calculate_tide`` と同じ時刻列（前後1区間の補助点を含む）です。
+        日ごとに reconstruct を呼び出す場合に比べ、呼び出しごとの固定コストを削減できます。
+
+        Args:
+            location (Location): Target location with id, lat, lon.
+                                 (対象地点情報)
+            start_date (date): First date of the range (inclusive).
+                               (期間の開始日)
+            end_date (date): Last date of the range (inclusive).
+                             (期間の終了日)
+
+        Returns:
+            dict[date, list[tuple[datetime, float]]]: (timezone-aware datetime, height_cm)
+                tuples keyed by date, in ascending date order.
+                (日付をキーとする時刻と潮位cmのタプルリスト)
+
+        Raises:
+            ValueError: If end_date is before start_date.
+                        (終了日が開始日より前の場合)
+            FileNotFoundError: If harmonic coefficient file for the location
+                               is not found.
+                               (地点の調和定数ファイルが見つからない場合)
+            RuntimeError: If tidal prediction fails.
+                          (潮汐予測の計算に失敗した場合)
+        """
+        n_days = (end_date - start_date).days + 1
+        if n_days < 1:
+            raise ValueError(f"終了日が開始日より前です: {start_date} > {end_date}")
+
         # 調和定数を読み込み（キャッシュあり）
         coef = self._load_coefficients(location.station_id)
 
-        # 予測時刻の生成（JST、分単位、日付境界の補助点を含む）
+        # 予測時刻の生成（JST、分単位、期間両端の補助点を含む）
         minutes_per_day = 24 * 60
         interval_minutes = self.PREDICTION_INTERVAL_MINUTES
         if minutes_per_day % interval_minutes != 0:
@@ -119,40 +182,61 @@ class TideCalculationAdapter:
         periods = minutes_per_day // interval_minutes
         interval_delta = pd.Timedelta(minutes=interval_minutes)
         predict_times = pd.date_range(
-            start=pd.Timestamp(target_date, tz="Asia/Tokyo") - interval_delta,
-            periods=periods + 2,
+            start=pd.Timestamp(start_date, tz="Asia/Tokyo") - interval_delta,
+            periods=periods * n_days + 2,
             freq=f"{interval_minutes}min",
         )
 
+        # UTide には UTC の naive datetime64 配列を渡す（tz 付きのままだと Timestamp の
+        # object 配列になり、要素ごとの変換とタイムゾーン警告が発生する）
+        predict_times_utc = predict_times.tz_convert("UTC").tz_localize(None).to_numpy()
+
         try:
-            # UTide reconstruct で潮汐予測を実行
+            # UTide reconstruct で期間全体の潮汐予測を 1 回で実行
             prediction = utide.reconstruct(
-                predict_times.to_numpy(),
+                predict_times_utc,
                 coef,  # type: ignore[arg-type]
+                verbose=False,
             )
         except Exception as e:
+            period = start_date if n_days == 1 else f"{start_date}〜{end_date}"
             raise RuntimeError(
                 f"潮汐予測の計算に失敗しました (地点: {location.id}, 観測点: {location.station_id}, "
-                f"日付: {target_date}): {e}"
+                f"日付: {period}): {e}"
             ) from e
 
-        # 結果をリストに変換
-        tide_heights: np.ndarray[Any, np.dtype[np.floating[Any]]] = prediction.h
+        # UTideの出力は平均値からの偏差なので、平均潮位を配列全体に一括で加算する
         mean_height: float = float(coef.get("mean", 0.0))
+        tide_heights: np.ndarray[Any, np.dtype[np.float64]] = (
+            np.asarray(prediction.h, dtype=np.float64) + mean_height
+        )
 
-        result: list[tuple[datetime, float]] = []
-        for timestamp, height in zip(predict_times, tide_heights, strict=True):
-            # UTideの出力は平均値からの偏差なので、平均潮位を加算
-            absolute_height = float(height) + mean_height
-            aware_dt: datetime = timestamp.to_pydatetime()
-            result.append((aware_dt, absolute_height))
+        # 結果をリストに変換し、日ごとに分割（隣接日と境界の補助点を共有する）
+        # ドメイン層は標準ライブラリのみに依存するため、境界は numpy 配列ではなく
+        # (時刻, 潮位) のリストで渡す。系列は日ごとの Tide 構築で消費される一時データで、
+        # 5 分間隔なら 1 日 290 点程度のため、配列化によるメモリ削減の効果は小さい
+        # DatetimeIndex.to_pydatetime は委譲メソッドで型が解決されないため、
+        # 実体の DatetimeArray から一括変換する
+        sample_times: list[datetime] = (
+            cast(DatetimeArray, predict_times.array).to_pydatetime().tolist()
+        )
+        samples: list[tuple[datetime, float]] = list(
+            zip(sample_times, tide_heights.tolist(), strict=True)
+        )
+        result: dict[date, list[tuple[datetime, float]]] = {}
+        for offset in range(n_days):
+            day_start = offset * periods
+            result[start_date + timedelta(days=offset)] = samples[
+                day_start : day_start + periods + 2
+            ]
 
         logger.info(
-            "潮汐予測完了: 地点=%s, 観測点=%s, 日付=%s, データ数=%d",
+            "潮汐予測完了: 地点=%s, 観測点=%s, 期間=%s〜%s, データ数=%d",
             location.id,
             location.station_id,
-            target_date,
-            len(result),
+            start_date,
+            end_date,
+            len(samples),
         )
 
         return result
@@ -162,6 +246,7 @@ class TideCalculationAdapter:
 
         調和定数をpickleファイルから読み込みます。
         一度読み込んだ調和定数はキャッシュに保持し、再利用します。
+        ファイルが更新されていなければ、他のアダプターが同じプロセスで読み込んだ結果も再利用します。
 
         Args:
             station_id (str): Station identifier matching the pickle filename.
@@ -187,11 +272,20 @@ class TideCalculationAdapter:
         # ファイルパスの構築
         coef_path = self._harmonics_dir / f"{station_key}{self.HARMONICS_FILE_EXTENSION}"
 
-        if not coef_path.exists():
+        try:
+            stat = coef_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"調和定数ファイルが見つかりません: {coef_path}. "
                 f"観測点 '{station_id}' の調和解析を事前に実行してください。"
-            )
+            ) from None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        shared = _process_coef_cache.get(coef_path)
+        if shared is not None and shared[0] == stamp:
+            logger.debug("プロセス内キャッシュから調和定数を取得: %s", station_key)
+            self._coef_cache[station_key] = shared[1]
+            return shared[1]
 
         try:
             with open(coef_path, "rb") as f:
@@ -204,6 +298,7 @@ class TideCalculationAdapter:
 
         # キャッシュに保持
         self._coef_cache[station_key] = coef
+        _process_coef_cache[coef_path] = (stamp, coef)
         logger.info(
             "調和定数を読み込みました: 観測点=%s, 分潮数=%d",
             station_id,
@@ -244,9 +339,13 @@ class TideCalculationAdapter:
         """Clear the cached harmonic coefficients.
 
         キャッシュされた調和定数をすべてクリアします。
+        同じディレクトリについてプロセス内で共有しているキャッシュも破棄します。
         調和定数ファイルを更新した場合に呼び出してください。
         """
         self._coef_cache.clear()
+        for coef_path in list(_process_coef_cache):
+            if coef_path.parent == self._harmonics_dir:
+                _process_coef_cache.pop(coef_path, None)
         logger.debug("調和定数キャッシュをクリアしました")
 
 
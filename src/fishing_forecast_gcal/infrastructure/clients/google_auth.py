@@ -9,6 +9,8 @@ duplication across Google API clients.
 Main Components:
     - SCOPES: Combined OAuth2 scopes for Calendar and Drive APIs.
     - authenticate: Perform OAuth2 flow and return valid Credentials.
+    - clear_credentials_cache: Drop credentials cached in this process.
+    - authorized_http: Build a persistent authorized HTTP transport.
 
 Project Context:
     Part of the infrastructure/clients layer. All Google API clients
@@ -22,11 +24,16 @@ Example:
 """
 
 import logging
+import os
 import pathlib
+import tempfile
+import threading
 
+import httplib2
 from google.auth.exceptions import RefreshError
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 
 logger = logging.getLogger(__name__)
@@ -38,6 +45,15 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive.file",
 ]
 
+# 認証済み Credentials のプロセス内キャッシュ（キー: (credentials_path, token_path)）
+# Calendar / Drive クライアントや複数スレッドからの認証で、トークンの再読み込み・
+# 再リフレッシュを避ける。ロックはトークンファイルの同時更新も防ぐ
+_credentials_cache: dict[tuple[str, str], Credentials] = {}
+_credentials_lock = threading.Lock()
+
+# Google API 呼び出しの HTTP タイムアウト（秒）
+HTTP_TIMEOUT_SECONDS = 30
+
 
 def _scopes_match(creds: Credentials) -> bool:
     """Check if token scopes match the required SCOPES.
@@ -99,7 +115,9 @@ def _run_oauth_flow(creds_path: pathlib.Path) -> Credentials:
 def authenticate(credentials_path: str, token_path: str) -> Credentials:
     """Perform OAuth2 authentication and return valid Credentials.
 
-    Executes the standard Google OAuth2 flow:
+    Credentials obtained earlier in the same process for the same paths
+    are reused while they remain valid; otherwise the standard Google
+    OAuth2 flow is executed:
     1. Load existing token if available.
     2. Verify scopes match current SCOPES definition.
     3. Refresh token if expired (with RefreshError fallback).
@@ -123,8 +141,69 @@ def authenticate(credentials_path: str, token_path: str) -> Credentials:
             new authorization is needed.
             (新規認証が必要な際に credentials ファイルが存在しない場合)
     """
-    creds_path = pathlib.Path(credentials_path)
-    tok_path = pathlib.Path(token_path)
+    key = (credentials_path, token_path)
+    with _credentials_lock:
+        cached = _credentials_cache.get(key)
+        if cached is not None and cached.valid and _scopes_match(cached):
+            return cached
+
+        creds = _load_credentials(pathlib.Path(credentials_path), pathlib.Path(token_path))
+        _credentials_cache[key] = creds
+        return creds
+
+
+def clear_credentials_cache() -> None:
+    """Drop all credentials cached in this process.
+
+    (プロセス内にキャッシュした認証情報を破棄する)
+    """
+    with _credentials_lock:
+        _credentials_cache.clear()
+
+
+def authorized_http(creds: Credentials) -> AuthorizedHttp:
+    """Build an authorized HTTP transport for a Google API service.
+
+    The wrapped ``httplib2.Http`` keeps its connections alive, so every
+    request made through one service reuses the same TLS connection
+    instead of repeating the handshake. ``httplib2.Http`` is not
+    thread-safe; build one transport per thread.
+
+    (認証済み HTTP トランスポートを構築する。内部の httplib2.Http が
+    接続を保持するため、同じサービス経由のリクエストは TLS 接続を再利用する。
+    スレッドセーフではないため、スレッドごとに構築すること)
+
+    Args:
+        creds (Credentials): Valid Google OAuth2 credentials.
+                             (有効な Google OAuth2 認証情報)
+
+    Returns:
+        AuthorizedHttp: Transport to pass as ``http`` to ``build()``.
+                        (``build()`` の ``http`` に渡すトランスポート)
+    """
+    return AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT_SECONDS))
+
+
+def _load_credentials(creds_path: pathlib.Path, tok_path: pathlib.Path) -> Credentials:
+    """Load, refresh or newly authorize credentials and persist the token.
+
+    (トークンの読み込み・リフレッシュ・新規認証を行い、トークンを保存する)
+
+    Args:
+        creds_path (pathlib.Path): Path to OAuth2 credentials JSON.
+                                   (OAuth2 認証情報 JSON ファイルのパス)
+        tok_path (pathlib.Path): Path to OAuth2 token JSON.
+                                 (OAuth2 トークン JSON ファイルのパス)
+
+    Returns:
+        Credentials: Valid Google OAuth2 credentials.
+                     (有効な Google OAuth2 認証情報)
+
+    Raises:
+        FileNotFoundError: If credentials file does not exist when
+            new authorization is needed.
+            (新規認証が必要な際に credentials ファイルが存在しない場合)
+    """
     creds: Credentials | None = None
 
     # Load existing token
@@ -160,9 +239,34 @@ def authenticate(credentials_path: str, token_path: str) -> Credentials:
 
         # Save token for future use
         assert creds is not None
-        tok_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(tok_path, "w") as token_file:
-            token_file.write(creds.to_json())
+        _save_token(tok_path, creds)
         logger.info("Token saved to: %s", tok_path)
 
     return creds
+
+
+def _save_token(tok_path: pathlib.Path, creds: Credentials) -> None:
+    """Atomically write the OAuth2 token JSON.
+
+    The token is written to a temporary file in the same directory and
+    then renamed over ``tok_path``, so another process reading the token
+    never sees a partially written file.
+
+    (トークンを一時ファイルに書き込んでから置き換え、他プロセスが書き込み途中の
+    ファイルを読まないようにする)
+
+    Args:
+        tok_path (pathlib.Path): Path to OAuth2 token JSON.
+                                 (OAuth2 トークン JSON ファイルのパス)
+        creds (Credentials): Credentials to persist.
+                             (保存する認証情報)
+    """
+    tok_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=tok_path.parent, prefix=f".{tok_path.name}.")
+    try:
+        with os.fdopen(fd, "w") as token_file:
+            token_file.write(creds.to_json())
+        os.replace(tmp_path, tok_path)
+    except BaseException:
+        pathlib.Path(tmp_path).unlink(missing_ok=True)
+        raise
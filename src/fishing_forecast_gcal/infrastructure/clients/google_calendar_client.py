@@ -14,6 +14,7 @@ Project Context:
 """
 
 import logging
+from collections.abc import Iterator, Mapping
 from datetime import UTC
 from typing import Any
 
@@ -22,14 +23,31 @@ from googleapiclient.discovery import build
 from fishing_forecast_gcal.infrastructure.clients.google_auth import (
     authenticate as _authenticate,
 )
+from fishing_forecast_gcal.infrastructure.clients.google_auth import authorized_http
+from fishing_forecast_gcal.infrastructure.clients.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# 削除済みとみなす HTTP ステータス (404: 存在しない, 410: 既に削除済み)
+_ALREADY_DELETED_STATUSES = frozenset({404, 410})
+
 
 class GoogleCalendarClient:
     """Client for Google Calendar API with OAuth2 authentication."""
 
-    def __init__(self, credentials_path: str, token_path: str) -> None:
+    # Maximum number of requests per batch (Google Calendar API limit)
+    BATCH_MAX_REQUESTS = 50
+
+    # Retries for 429 / 403 rate limit and 5xx responses (exponential backoff
+    # handled by googleapiclient)
+    NUM_RETRIES = 3
+
+    def __init__(
+        self,
+        credentials_path: str,
+        token_path: str,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
         """Initialize Google Calendar client.
 
         Args:
@@ -37,9 +55,12 @@ class GoogleCalendarClient:
                               (OAuth2 認証情報 JSON ファイルのパス)
             token_path: Path to store OAuth2 token JSON file.
                         (OAuth2 トークン JSON ファイルの保存パス)
+            rate_limiter: Limiter paced before each API request (optional).
+                          (API リクエスト前に待機するレートリミッター)
         """
         self._credentials_path = credentials_path
         self._token_path = token_path
+        self._rate_limiter = rate_limiter
         self._service: Any = None
 
     def authenticate(self) -> None:
@@ -51,7 +72,14 @@ class GoogleCalendarClient:
         (OAuth2 認証を共通モジュールに委譲し、Calendar API サービスを構築する)
         """
         creds = _authenticate(self._credentials_path, self._token_path)
-        self._service = build("calendar", "v3", credentials=creds)
+        # 同梱の静的ディスカバリ文書を使い、ディスカバリキャッシュの自動検出を省く
+        self._service = build(
+            "calendar",
+            "v3",
+            http=authorized_http(creds),
+            static_discovery=True,
+            cache_discovery=False,
+        )
 
     def get_service(self) -> Any:
         """Get authenticated Calendar API service.
@@ -66,6 +94,21 @@ class GoogleCalendarClient:
             raise RuntimeError("Calendar service not initialized. Call authenticate() first.")
         return self._service
 
+    def _execute(self, request: Any) -> Any:
+        """Execute a single API request with rate limiting and retries.
+
+        (レートリミットを適用し、再試行付きでリクエストを実行する)
+
+        Args:
+            request: Unexecuted HttpRequest
+
+        Returns:
+            Response body from Google Calendar API
+        """
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        return request.execute(num_retries=self.NUM_RETRIES)
+
     def test_connection(self) -> bool:
         """Test Calendar API connection by fetching calendar list.
 
@@ -74,7 +117,7 @@ class GoogleCalendarClient:
         """
         try:
             service = self.get_service()
-            result = service.calendarList().list(maxResults=10).execute()
+            result = self._execute(service.calendarList().list(maxResults=10))
             calendars = result.get("items", [])
 
             logger.info("=== Available Calendars ===")
@@ -120,47 +163,19 @@ class GoogleCalendarClient:
             RuntimeError: If calendar service is not initialized
             HttpError: If API call fails
         """
-        from datetime import date
-
-        service = self.get_service()
-
-        # Convert date objects to ISO string format
-        if isinstance(start_date, date):
-            start_date_str = start_date.isoformat()
-        else:
-            start_date_str = str(start_date)
-
-        if isinstance(end_date, date):
-            end_date_str = end_date.isoformat()
-        else:
-            end_date_str = str(end_date)
-
-        event_body: dict[str, Any] = {
-            "id": event_id,
-            "summary": summary,
-            "description": description,
-            "start": {"date": start_date_str, "timeZone": timezone},
-            "end": {"date": end_date_str, "timeZone": timezone},
-        }
-
-        # Add extended properties if provided
-        if extended_properties:
-            event_body["extendedProperties"] = {"private": extended_properties}
-
-        # Add attachments if provided
-        if attachments:
-            event_body["attachments"] = attachments
-
-        result = (
-            service.events()
-            .insert(
-                calendarId=calendar_id,
-                body=event_body,
-                supportsAttachments=True,
+        return self._execute(  # type: ignore[no-any-return]
+            self.build_insert_request(
+                calendar_id=calendar_id,
+                event_id=event_id,
+                summary=summary,
+                description=description,
+                start_date=start_date,
+                end_date=end_date,
+                timezone=timezone,
+                extended_properties=extended_properties,
+                attachments=attachments,
             )
-            .execute()
         )
-        return result  # type: ignore[no-any-return]
 
     def get_event(self, calendar_id: str, event_id: str) -> dict[str, Any] | None:
         """Get a calendar event by ID.
@@ -180,7 +195,7 @@ class GoogleCalendarClient:
         service = self.get_service()
 
         try:
-            result = service.events().get(calendarId=calendar_id, eventId=event_id).execute()
+            result = self._execute(service.events().get(calendarId=calendar_id, eventId=event_id))
             return result  # type: ignore[no-any-return]
         except HttpError as e:
             if e.resp.status == 404:
@@ -222,20 +237,157 @@ class GoogleCalendarClient:
             RuntimeError: If event not found or calendar service not initialized
             HttpError: If API call fails
         """
-        from datetime import date
-
         from googleapiclient.errors import HttpError
 
         service = self.get_service()
 
         # First, get the existing event
         try:
-            service.events().get(calendarId=calendar_id, eventId=event_id).execute()
+            self._execute(service.events().get(calendarId=calendar_id, eventId=event_id))
         except HttpError as e:
             if e.resp.status == 404:
                 raise RuntimeError(f"Event not found: {event_id}") from e
             raise
 
+        return self.patch_event(
+            calendar_id=calendar_id,
+            event_id=event_id,
+            summary=summary,
+            description=description,
+            start_date=start_date,
+            end_date=end_date,
+            timezone=timezone,
+            extended_properties=extended_properties,
+            attachments=attachments,
+        )
+
+    def patch_event(
+        self,
+        calendar_id: str,
+        event_id: str,
+        summary: str | None = None,
+        description: str | None = None,
+        start_date: Any = None,
+        end_date: Any = None,
+        timezone: str = "Asia/Tokyo",
+        extended_properties: dict[str, str] | None = None,
+        attachments: list[dict[str, str]] | None = None,
+    ) -> dict[str, Any]:
+        """Patch only the provided fields of an event in one request.
+
+        Unlike :meth:`update_event`, no existence check is made first.
+        Arguments are the same as :meth:`update_event`.
+        (指定したフィールドのみを 1 回のリクエストで部分更新する。存在確認は行わない)
+
+        Returns:
+            Updated event details from Google Calendar API
+
+        Raises:
+            RuntimeError: If calendar service is not initialized
+            HttpError: If API call fails (status 404 when the event does not exist)
+        """
+        return self._execute(  # type: ignore[no-any-return]
+            self.build_patch_request(
+                calendar_id=calendar_id,
+                event_id=event_id,
+                summary=summary,
+                description=description,
+                start_date=start_date,
+                end_date=end_date,
+                timezone=timezone,
+                extended_properties=extended_properties,
+                attachments=attachments,
+            )
+        )
+
+    def build_insert_request(
+        self,
+        calendar_id: str,
+        event_id: str,
+        summary: str,
+        description: str,
+        start_date: Any,
+        end_date: Any,
+        timezone: str = "Asia/Tokyo",
+        extended_properties: dict[str, str] | None = None,
+        attachments: list[dict[str, str]] | None = None,
+    ) -> Any:
+        """Build an events.insert request without executing it.
+
+        Arguments are the same as :meth:`create_event`.
+        (events.insert リクエストを構築する。バッチ送信用)
+
+        Returns:
+            Unexecuted HttpRequest for events.insert
+
+        Raises:
+            RuntimeError: If calendar service is not initialized
+        """
+        from datetime import date
+
+        service = self.get_service()
+
+        # Convert date objects to ISO string format
+        if isinstance(start_date, date):
+            start_date_str = start_date.isoformat()
+        else:
+            start_date_str = str(start_date)
+
+        if isinstance(end_date, date):
+            end_date_str = end_date.isoformat()
+        else:
+            end_date_str = str(end_date)
+
+        event_body: dict[str, Any] = {
+            "id": event_id,
+            "summary": summary,
+            "description": description,
+            "start": {"date": start_date_str, "timeZone": timezone},
+            "end": {"date": end_date_str, "timeZone": timezone},
+        }
+
+        # Add extended properties if provided
+        if extended_properties:
+            event_body["extendedProperties"] = {"private": extended_properties}
+
+        # Add attachments if provided
+        if attachments:
+            event_body["attachments"] = attachments
+
+        return service.events().insert(
+            calendarId=calendar_id,
+            body=event_body,
+            supportsAttachments=True,
+        )
+
+    def build_patch_request(
+        self,
+        calendar_id: str,
+        event_id: str,
+        summary: str | None = None,
+        description: str | None = None,
+        start_date: Any = None,
+        end_date: Any = None,
+        timezone: str = "Asia/Tokyo",
+        extended_properties: dict[str, str] | None = None,
+        attachments: list[dict[str, str]] | None = None,
+    ) -> Any:
+        """Build an events.patch request without executing it.
+
+        Only the provided fields are included in the patch body.
+        Arguments are the same as :meth:`update_event`.
+        (events.patch リクエストを構築する。バッチ送信用)
+
+        Returns:
+            Unexecuted HttpRequest for events.patch
+
+        Raises:
+            RuntimeError: If calendar service is not initialized
+        """
+        from datetime import date
+
+        service = self.get_service()
+
         # Build update body with only provided fields
         update_body: dict[str, Any] = {}
 
@@ -268,23 +420,94 @@ class GoogleCalendarClient:
             update_body["attachments"] = attachments
 
         # Use patch for partial update
-        result = (
-            service.events()
-            .patch(
-                calendarId=calendar_id,
-                eventId=event_id,
-                body=update_body,
-                supportsAttachments=True,
-            )
-            .execute()
+        return service.events().patch(
+            calendarId=calendar_id,
+            eventId=event_id,
+            body=update_body,
+            supportsAttachments=True,
         )
-        return result  # type: ignore[no-any-return]
+
+    def execute_batch(self, requests: Mapping[str, Any]) -> dict[str, Exception | None]:
+        """Execute requests using Google API batch requests.
+
+        Requests are sent in chunks of ``BATCH_MAX_REQUESTS`` (API limit: 50).
+        Failures of individual requests are returned, not raised.
+        (リクエストを最大50件ずつバッチ送信し、個別の結果を返す)
+
+        Args:
+            requests: Unexecuted HttpRequest objects keyed by a unique request ID
+                (e.g. event ID)
+
+        Returns:
+            Mapping of request ID to exception (None if the request succeeded)
+
+        Raises:
+            RuntimeError: If calendar service is not initialized
+            HttpError: If the batch request itself fails
+        """
+        service = self.get_service()
+        results: dict[str, Exception | None] = {}
+
+        def _callback(request_id: str, _response: Any, exception: Exception | None) -> None:
+            results[request_id] = exception
+
+        items = list(requests.items())
+        for offset in range(0, len(items), self.BATCH_MAX_REQUESTS):
+            chunk = items[offset : offset + self.BATCH_MAX_REQUESTS]
+            batch = service.new_batch_http_request(callback=_callback)
+            for request_id, request in chunk:
+                batch.add(request, request_id=request_id)
+            # バッチ内の各リクエストがクォータを消費するため件数分のトークンを取得
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire(len(chunk))
+            batch.execute()
+
+        return results
+
+    def delete_events(self, calendar_id: str, event_ids: list[str]) -> dict[str, Exception | None]:
+        """Delete multiple calendar events using batch requests (idempotent).
+
+        Events that do not exist (404) or were already deleted (410) are
+        reported as successful.
+        (複数イベントをバッチ送信で削除する。存在しない・削除済みのイベントは成功扱い)
+
+        Args:
+            calendar_id: Calendar ID containing the events
+            event_ids: Event IDs to delete
+
+        Returns:
+            Mapping of event ID to exception (None if deleted or not found)
+
+        Raises:
+            RuntimeError: If calendar service is not initialized
+            HttpError: If the batch request itself fails
+        """
+        from googleapiclient.errors import HttpError
+
+        service = self.get_service()
+        events = service.events()
+        results = self.execute_batch(
+            {
+                event_id: events.delete(calendarId=calendar_id, eventId=event_id)
+                for event_id in event_ids
+            }
+        )
+
+        return {
+            event_id: (
+                None
+                if isinstance(error, HttpError) and error.resp.status in _ALREADY_DELETED_STATUSES
+                else error
+            )
+            for event_id, error in results.items()
+        }
 
     def delete_event(self, calendar_id: str, event_id: str) -> bool:
         """Delete a calendar event by ID (idempotent).
 
-        If the event does not exist (404), returns False without raising.
-        (削除対象が存在しない場合は False を返し、エラーにしない)
+        If the event does not exist (404) or was already deleted (410),
+        returns False without raising.
+        (削除対象が存在しない・削除済みの場合は False を返し、エラーにしない)
 
         Args:
             calendar_id: Calendar ID containing the event
@@ -295,17 +518,17 @@ class GoogleCalendarClient:
 
         Raises:
             RuntimeError: If calendar service is not initialized
-            HttpError: If API call fails (except 404)
+            HttpError: If API call fails (except 404/410)
         """
         from googleapiclient.errors import HttpError
 
         service = self.get_service()
 
         try:
-            service.events().delete(calendarId=calendar_id, eventId=event_id).execute()
+            self._execute(service.events().delete(calendarId=calendar_id, eventId=event_id))
             return True
         except HttpError as e:
-            if e.resp.status == 404:
+            if e.resp.status in _ALREADY_DELETED_STATUSES:
                 return False
             raise
 
@@ -316,6 +539,7 @@ class GoogleCalendarClient:
         end_date: Any,
         private_extended_property: str | None = None,
         max_results: int = 2500,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """List calendar events within a date range.
 
@@ -330,10 +554,55 @@ class GoogleCalendarClient:
             private_extended_property: Filter by private extended property
                 (format: "key=value", e.g. "location_id=tk")
             max_results: Maximum number of results per page (default: 2500)
+            fields: Partial response projection (e.g. "items(id),nextPageToken").
+                Must include nextPageToken. Full resources when omitted.
 
         Returns:
             List of event dictionaries from Google Calendar API
 
+        Raises:
+            RuntimeError: If calendar service is not initialized
+            HttpError: If API call fails
+        """
+        return list(
+            self.iter_events(
+                calendar_id=calendar_id,
+                start_date=start_date,
+                end_date=end_date,
+                private_extended_property=private_extended_property,
+                max_results=max_results,
+                fields=fields,
+            )
+        )
+
+    def iter_events(
+        self,
+        calendar_id: str,
+        start_date: Any,
+        end_date: Any,
+        private_extended_property: str | None = None,
+        max_results: int = 2500,
+        fields: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate calendar events within a date range page by page.
+
+        Yields events in API order, fetching the next page only after the
+        current one has been consumed.
+        (指定期間のイベントをページ単位で逐次取得)
+
+        Args:
+            calendar_id: Calendar ID to search in
+            start_date: Start date (inclusive, date object)
+            end_date: End date (inclusive, date object)
+            private_extended_property: Filter by private extended property
+                (format: "key=value", e.g. "location_id=tk")
+            max_results: Maximum number of results per page (default: 2500)
+            fields: Partial response projection (e.g. "items(id),nextPageToken").
+                Must include nextPageToken. Full resources when omitted.
+
+        Yields:
+            Event dictionaries from Google Calendar API
+
         Raises:
             RuntimeError: If calendar service is not initialized
             HttpError: If API call fails
@@ -359,7 +628,6 @@ class GoogleCalendarClient:
         else:
             time_max = str(end_date)
 
-        all_events: list[dict[str, Any]] = []
         page_token: str | None = None
 
         while True:
@@ -375,15 +643,74 @@ class GoogleCalendarClient:
             if private_extended_property:
                 kwargs["privateExtendedProperty"] = private_extended_property
 
+            if fields:
+                kwargs["fields"] = fields
+
             if page_token:
                 kwargs["pageToken"] = page_token
 
-            result = service.events().list(**kwargs).execute()
-            events = result.get("items", [])
-            all_events.extend(events)
+            result = self._execute(service.events().list(**kwargs))
+            yield from result.get("items", [])
 
             page_token = result.get("nextPageToken")
             if not page_token:
                 break
 
-        return all_events
+    def list_event_changes(
+        self,
+        calendar_id: str,
+        sync_token: str | None = None,
+        max_results: int = 2500,
+        fields: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """List events changed since a sync token (incremental sync).
+
+        Without a sync token, all events of the calendar are listed.
+        With one, only events created, updated or deleted since the token
+        was issued are returned; deleted events have ``status: "cancelled"``.
+        The Calendar API does not allow time or property filters together
+        with ``syncToken``, so neither call is filtered. Recurring events
+        are returned as series (``singleEvents=False``); without a time
+        bound, expanding them would list every instance.
+        (同期トークン以降に変更されたイベントを取得。トークンなしの場合は全件)
+
+        Args:
+            calendar_id: Calendar ID to list
+            sync_token: Token from a previous call, or None for a full listing
+            max_results: Maximum number of results per page (default: 2500)
+            fields: Partial response projection. Must include nextPageToken
+                and nextSyncToken. Full resources when omitted.
+
+        Returns:
+            Tuple of (changed events, token for the next incremental call)
+
+        Raises:
+            RuntimeError: If calendar service is not initialized
+            HttpError: If API call fails (status 410 when the token expired)
+        """
+        service = self.get_service()
+        items: list[dict[str, Any]] = []
+        page_token: str | None = None
+
+        while True:
+            kwargs: dict[str, Any] = {
+                "calendarId": calendar_id,
+                "maxResults": max_results,
+                "singleEvents": False,
+            }
+
+            if sync_token:
+                kwargs["syncToken"] = sync_token
+
+            if fields:
+                kwargs["fields"] = fields
+
+            if page_token:
+                kwargs["pageToken"] = page_token
+
+            result = self._execute(service.events().list(**kwargs))
+            items.extend(result.get("items", []))
+
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                return items, result.get("nextSyncToken")
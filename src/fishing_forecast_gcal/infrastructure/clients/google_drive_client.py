@@ -9,14 +9,17 @@ Authentication is delegated to the shared ``google_auth`` module.
 
 import logging
 import pathlib
+import threading
 from typing import Any
 
+from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
 
 from fishing_forecast_gcal.infrastructure.clients.google_auth import (
     authenticate as _authenticate,
 )
+from fishing_forecast_gcal.infrastructure.clients.google_auth import authorized_http
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +27,24 @@ logger = logging.getLogger(__name__)
 DEFAULT_FOLDER_NAME = "fishing-forecast-tide-graphs"
 
 
+def _build_drive_service(creds: Credentials) -> Any:
+    """Build a Drive API service from the bundled discovery document.
+
+    The service gets its own keep-alive HTTP transport.
+
+    (同梱の静的ディスカバリ文書から Drive API サービスを構築する。
+    ディスカバリキャッシュの自動検出は行わず、接続を保持する
+    HTTP トランスポートをサービスごとに用意する)
+    """
+    return build(
+        "drive",
+        "v3",
+        http=authorized_http(creds),
+        static_discovery=True,
+        cache_discovery=False,
+    )
+
+
 class GoogleDriveClient:
     """Client for Google Drive API with OAuth2 authentication.
 
@@ -43,6 +64,9 @@ class GoogleDriveClient:
         self._credentials_path = credentials_path
         self._token_path = token_path
         self._service: Any = None
+        self._credentials: Credentials | None = None
+        self._owner_thread = threading.get_ident()
+        self._local = threading.local()
 
     def authenticate(self) -> None:
         """Perform OAuth2 authentication and build Drive API service.
@@ -56,11 +80,20 @@ class GoogleDriveClient:
             FileNotFoundError: If credentials file does not exist.
         """
         creds = _authenticate(self._credentials_path, self._token_path)
-        self._service = build("drive", "v3", credentials=creds)
+        self._credentials = creds
+        self._service = _build_drive_service(creds)
+        self._owner_thread = threading.get_ident()
 
     def get_service(self) -> Any:
         """Get authenticated Drive API service.
 
+        The underlying httplib2 transport is not thread-safe, so threads
+        other than the authenticating one get their own service instance
+        built from the same credentials.
+
+        (httplib2 はスレッドセーフではないため、認証したスレッド以外には
+        同じ認証情報からスレッドごとのサービスを構築して返す)
+
         Returns:
             Authenticated Google Drive API service instance
 
@@ -69,7 +102,14 @@ class GoogleDriveClient:
         """
         if self._service is None:
             raise RuntimeError("Drive service not initialized. Call authenticate() first.")
-        return self._service
+        if self._credentials is None or threading.get_ident() == self._owner_thread:
+            return self._service
+
+        service = getattr(self._local, "service", None)
+        if service is None:
+            service = _build_drive_service(self._credentials)
+            self._local.service = service
+        return service
 
     def upload_file(
         self,
@@ -0,0 +1,84 @@
+"""Token-bucket rate limiter for Google API calls.
+
+Paces API requests so that bursts proceed immediately while the
+sustained request rate stays under the per-user quota.
+
+Main Components:
+    - RateLimiter: Thread-safe token bucket.
+
+Project Context:
+    Part of the infrastructure/clients layer. Passed to
+    GoogleCalendarClient to throttle its API calls.
+
+Example:
+    >>> limiter = RateLimiter(rate_per_sec=8.0, burst=5)
+    >>> limiter.acquire()
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe token bucket rate limiter.
+
+    The bucket holds up to ``burst`` tokens and refills at
+    ``rate_per_sec``. Each request consumes tokens; when the bucket is
+    empty the caller sleeps until its tokens have been refilled.
+    Tokens are reserved under the lock and the wait happens outside
+    it, so concurrent callers are queued in order without blocking
+    each other's bookkeeping.
+
+    (トークンバケット方式のレートリミッター。バースト分は即時に通し、
+    持続レートを上限以下に抑える)
+    """
+
+    def __init__(self, rate_per_sec: float, burst: int) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            rate_per_sec: Sustained requests per second.
+                          (1 秒あたりの持続リクエスト数)
+            burst: Maximum number of requests sent without waiting.
+                   (待機なしで送信できる最大リクエスト数)
+
+        Raises:
+            ValueError: If rate_per_sec or burst is not positive.
+                        (rate_per_sec または burst が正でない場合)
+        """
+        if rate_per_sec <= 0:
+            raise ValueError(f"rate_per_sec must be positive: {rate_per_sec}")
+        if burst <= 0:
+            raise ValueError(f"burst must be positive: {burst}")
+
+        self._rate = rate_per_sec
+        self._burst = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1) -> float:
+        """Consume tokens, sleeping until they are available.
+
+        Requests larger than the burst size are allowed; the bucket goes
+        into debt and later callers wait for it to be repaid.
+        (トークンを消費し、不足している場合は補充まで待機する)
+
+        Args:
+            tokens: Number of tokens to consume (default: 1).
+                    (消費するトークン数)
+
+        Returns:
+            float: Seconds slept before the request may proceed.
+                   (待機した秒数)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
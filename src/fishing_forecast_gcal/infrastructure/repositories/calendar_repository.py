@@ -4,6 +4,13 @@
 Google Calendar API を使用してカレンダーイベントの作成・取得・更新を行います。
 """
 
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import threading
+from collections.abc import Callable, Iterator, Mapping
 from datetime import date
 from typing import Any
 
@@ -11,6 +18,125 @@ from ...domain.models.calendar_event import CalendarEvent
 from ...domain.repositories.calendar_repository import ICalendarRepository
 from ..clients.google_calendar_client import GoogleCalendarClient
 
+logger = logging.getLogger(__name__)
+
+# イベント一覧で取得するフィールド（_convert_to_domain_model が参照するもののみ）
+# 応答サイズと JSON パースのコストを抑える。nextPageToken はページングに必須
+_EVENT_LIST_FIELDS = "items(id,summary,description,start,extendedProperties/private),nextPageToken"
+
+# 増分同期で取得するフィールド（削除判定の status と次回用の nextSyncToken を含む）
+_EVENT_SYNC_FIELDS = (
+    "items(id,status,summary,description,start,extendedProperties/private),"
+    "nextPageToken,nextSyncToken"
+)
+
+# 増分同期キャッシュのフォーマットバージョン（形式を変えたら上げる）
+_SYNC_CACHE_VERSION = 2
+
+# 同じキャッシュファイルの読み込み・書き込みを直列化する（API 呼び出し中は保持しない）
+_SYNC_CACHE_LOCK = threading.Lock()
+
+
+def _event_date(event: CalendarEvent) -> date:
+    """ソートキー: イベントの日付"""
+    return event.date
+
+
+class CalendarEventReplica:
+    """カレンダー全体のイベントのローカル複製
+
+    同期トークン（syncToken）による増分同期の結果を JSON ファイルに保存し、
+    次回の実行では前回からの変更分だけを取得します。保存するのは本ツールが作成した
+    イベント（extendedProperties.private に location_id を持つもの）だけで、
+    ユーザーの個人的な予定は保持しません。1 回の実行で全地点の
+    リポジトリが同じインスタンスを共有し、同期は最初の参照時に 1 回だけ行います
+    （以降はその時点の複製を返し、削除したイベントは複製からも取り除きます）。
+
+    Attributes:
+        cache_path: 増分同期キャッシュ（JSON）のパス
+        calendar_id: 対象カレンダーID
+    """
+
+    def __init__(self, cache_path: pathlib.Path, calendar_id: str) -> None:
+        """コンストラクタ
+
+        Args:
+            cache_path: 増分同期キャッシュ（JSON）のパス
+            calendar_id: 対象カレンダーID
+        """
+        self.cache_path = cache_path
+        self.calendar_id = calendar_id
+        self._events: dict[str, dict[str, Any]] | None = None
+        # 同期を 1 回に限るためのロック（同期中は他地点のスレッドが完了を待つ）
+        self._lock = threading.Lock()
+
+    def events(
+        self,
+        fetch_changes: Callable[[str | None], tuple[list[dict[str, Any]], str | None]],
+    ) -> Mapping[str, dict[str, Any]]:
+        """同期済みの複製を返す（未同期なら差分更新する）
+
+        トークンが失効している（410 Gone）場合は全件を取得し直します。
+
+        Args:
+            fetch_changes: 同期トークン以降の変更を取得する関数
+                （呼び出し元リポジトリの list_events_incremental）
+
+        Returns:
+            イベントID → API 形式のイベント
+        """
+        with self._lock:
+            if self._events is None:
+                self._events = self._sync(fetch_changes)
+            return self._events
+
+    def discard(self, event_ids: list[str]) -> None:
+        """削除したイベントを複製から取り除く
+
+        Args:
+            event_ids: 削除済みのイベントID
+        """
+        with self._lock:
+            if self._events is not None:
+                for event_id in event_ids:
+                    self._events.pop(event_id, None)
+
+    def _sync(
+        self,
+        fetch_changes: Callable[[str | None], tuple[list[dict[str, Any]], str | None]],
+    ) -> dict[str, dict[str, Any]]:
+        """キャッシュファイルを差分更新する"""
+        from googleapiclient.errors import HttpError
+
+        with _SYNC_CACHE_LOCK:
+            sync_token, events = _read_sync_cache(self.cache_path, self.calendar_id)
+
+        try:
+            changes, new_token = fetch_changes(sync_token)
+        except HttpError as e:
+            if sync_token is None or e.resp.status != 410:
+                raise
+            logger.info("同期トークンが失効したため、イベントを全件取得し直します")
+            sync_token = None
+            changes, new_token = fetch_changes(None)
+
+        with _SYNC_CACHE_LOCK:
+            if sync_token is None:
+                events = {}
+            for item in changes:
+                if item.get("status") != "cancelled" and _location_id_of(item):
+                    events[item["id"]] = item
+                else:
+                    # 削除されたイベントと本ツール以外のイベントは保持しない
+                    events.pop(item["id"], None)
+
+            logger.debug(
+                "Incremental sync: %d change(s), %d event(s) cached", len(changes), len(events)
+            )
+            if new_token:
+                _write_sync_cache(self.cache_path, self.calendar_id, new_token, events)
+        return events
+
 
 class CalendarRepository(ICalendarRepository):
     """カレンダーリポジトリの実装
@@ -18,14 +144,23 @@ class CalendarRepository(ICalendarRepository):
     Google Calendar API を使用してカレンダーイベントの作成・取得・更新を行います。
     冪等性を保証し、複数回実行しても結果が同じになるよう設計します。
 
+    ``event_replica`` を指定すると、イベント一覧はカレンダー全体のローカル複製
+    （CalendarEventReplica）から期間・地点で絞り込みます。複製は同期トークンで
+    差分更新されるため、前回の実行からの変更分だけの通信で済みます。
+
     Attributes:
         client: GoogleCalendarClient インスタンス
         calendar_id: Google Calendar のカレンダーID
         timezone: タイムゾーン（デフォルト: Asia/Tokyo）
+        event_replica: イベントのローカル複製。None なら毎回 API で絞り込む
     """
 
     def __init__(
-        self, client: GoogleCalendarClient, calendar_id: str, timezone: str = "Asia/Tokyo"
+        self,
+        client: GoogleCalendarClient,
+        calendar_id: str,
+        timezone: str = "Asia/Tokyo",
+        event_replica: CalendarEventReplica | None = None,
     ) -> None:
         """コンストラクタ
 
@@ -33,10 +168,12 @@ class CalendarRepository(ICalendarRepository):
             client: GoogleCalendarClient インスタンス
             calendar_id: Google Calendar のカレンダーID
             timezone: タイムゾーン（デフォルト: Asia/Tokyo）
+            event_replica: イベントのローカル複製（省略時は増分同期しない）
         """
         self.client = client
         self.calendar_id = calendar_id
         self.timezone = timezone
+        self.event_replica = event_replica
 
     def get_event(self, event_id: str) -> CalendarEvent | None:
         """イベントIDでカレンダーイベントを取得
@@ -124,6 +261,65 @@ class CalendarRepository(ICalendarRepository):
         except Exception as e:
             raise RuntimeError(f"Failed to upsert event: {e}") from e
 
+    def upsert_events(
+        self,
+        events: list[CalendarEvent],
+        *,
+        existing: Mapping[str, CalendarEvent] | None = None,
+        attachments: Mapping[str, list[dict[str, str]]] | None = None,
+    ) -> dict[str, Exception]:
+        """Create or update multiple calendar events in batched API calls.
+
+        複数イベントの作成/更新を Google Calendar API のバッチリクエストで
+        まとめて送信します（1 バッチ最大 50 件）。
+
+        Args:
+            events: Events to create or update.
+            existing: Pre-fetched existing events keyed by event_id.
+                Events missing from the mapping are created.
+                Pass None to check existence with get_event() per event.
+            attachments: File attachments keyed by event_id.
+
+        Returns:
+            dict[str, Exception]: Failed event IDs and their errors.
+
+        Raises:
+            RuntimeError: If building or sending the batch fails as a whole.
+        """
+        try:
+            requests: dict[str, Any] = {}
+            for event in events:
+                if existing is not None:
+                    exists = event.event_id in existing
+                else:
+                    exists = self.get_event(event.event_id) is not None
+
+                build_request = (
+                    self.client.build_patch_request if exists else self.client.build_insert_request
+                )
+                requests[event.event_id] = build_request(
+                    calendar_id=self.calendar_id,
+                    event_id=event.event_id,
+                    summary=event.title,
+                    description=event.description,
+                    start_date=event.date,
+                    end_date=self._get_next_day(event.date),
+                    timezone=self.timezone,
+                    extended_properties={"location_id": event.location_id},
+                    attachments=attachments.get(event.event_id) if attachments else None,
+                )
+
+            results = self.client.execute_batch(requests)
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to upsert events: {e}") from e
+
+        return {
+            event_id: RuntimeError(f"Failed to upsert event: {error}")
+            for event_id, error in results.items()
+            if error is not None
+        }
+
     def list_events(
         self, start_date: date, end_date: date, location_id: str
     ) -> list[CalendarEvent]:
@@ -139,34 +335,77 @@ class CalendarRepository(ICalendarRepository):
         Returns:
             list[CalendarEvent]: List of calendar events (empty list if none found)
 
+        Raises:
+            RuntimeError: If API call fails
+        """
+        return sorted(self.iter_events(start_date, end_date, location_id), key=_event_date)
+
+    def iter_events(
+        self, start_date: date, end_date: date, location_id: str
+    ) -> Iterator[CalendarEvent]:
+        """Iterate calendar events for a given period and location.
+
+        指定期間・地点のカレンダーイベントを API のページ順に逐次返します。
+        中間リストの生成とソートを行わないため、1 件ずつ処理する用途向けです。
+
+        Args:
+            start_date: Search start date (inclusive)
+            end_date: Search end date (inclusive)
+            location_id: Immutable location ID
+
+        Yields:
+            CalendarEvent: Calendar events in API order (not sorted)
+
         Raises:
             RuntimeError: If API call fails
         """
         try:
-            api_events = self.client.list_events(
-                calendar_id=self.calendar_id,
-                start_date=start_date,
-                end_date=end_date,
-                private_extended_property=f"location_id={location_id}",
-            )
+            if self.event_replica is not None:
+                api_events = _filter_synced_events(
+                    self.event_replica.events(self.list_events_incremental),
+                    start_date,
+                    end_date,
+                    location_id,
+                )
+            else:
+                api_events = self.client.iter_events(
+                    calendar_id=self.calendar_id,
+                    start_date=start_date,
+                    end_date=end_date,
+                    private_extended_property=f"location_id={location_id}",
+                    fields=_EVENT_LIST_FIELDS,
+                )
 
-            result: list[CalendarEvent] = []
             for api_event in api_events:
                 try:
                     event = self._convert_to_domain_model(api_event)
-                    result.append(event)
                 except (ValueError, KeyError) as e:
-                    import logging
-
-                    logging.getLogger(__name__).warning("Skipping event with invalid format: %s", e)
-
-            # Sort by date
-            result.sort(key=lambda e: e.date)
-            return result
+                    logger.warning("Skipping event with invalid format: %s", e)
+                    continue
+                yield event
 
         except Exception as e:
             raise RuntimeError(f"Failed to list events: {e}") from e
 
+    def list_events_incremental(
+        self, last_sync_token: str | None
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """同期トークン以降に変更された API 形式のイベントを取得
+
+        Args:
+            last_sync_token: 前回の同期トークン（None なら全件取得）
+
+        Returns:
+            (変更されたイベント, 次回用の同期トークン)。削除されたイベントは
+            ``status: "cancelled"`` で返る
+
+        Raises:
+            HttpError: API 呼び出しに失敗した場合（トークン失効時は 410）
+        """
+        return self.client.list_event_changes(
+            self.calendar_id, sync_token=last_sync_token, fields=_EVENT_SYNC_FIELDS
+        )
+
     def delete_event(self, event_id: str) -> bool:
         """Delete a calendar event by ID (idempotent).
 
@@ -182,10 +421,44 @@ class CalendarRepository(ICalendarRepository):
             RuntimeError: If API call fails
         """
         try:
-            return self.client.delete_event(self.calendar_id, event_id)
+            deleted = self.client.delete_event(self.calendar_id, event_id)
         except Exception as e:
             raise RuntimeError(f"Failed to delete event: {e}") from e
 
+        if self.event_replica is not None:
+            self.event_replica.discard([event_id])
+        return deleted
+
+    def delete_events(self, event_ids: list[str]) -> dict[str, Exception]:
+        """Delete multiple calendar events in batched API calls (idempotent).
+
+        複数イベントの削除を Google Calendar API のバッチリクエストで
+        まとめて送信します（1 バッチ最大 50 件）。存在しないイベントは成功扱いです。
+
+        Args:
+            event_ids: Event IDs to delete
+
+        Returns:
+            dict[str, Exception]: Failed event IDs and their errors.
+
+        Raises:
+            RuntimeError: If building or sending the batch fails as a whole.
+        """
+        try:
+            results = self.client.delete_events(self.calendar_id, event_ids)
+        except Exception as e:
+            raise RuntimeError(f"Failed to delete events: {e}") from e
+
+        if self.event_replica is not None:
+            self.event_replica.discard(
+                [event_id for event_id in event_ids if results.get(event_id) is None]
+            )
+        return {
+            event_id: RuntimeError(f"Failed to delete event: {error}")
+            for event_id, error in results.items()
+            if error is not None
+        }
+
     def _convert_to_domain_model(self, api_event: dict[str, Any]) -> CalendarEvent:
         """Google Calendar API形式をDomainモデルに変換
 
@@ -245,3 +518,106 @@ class CalendarRepository(ICalendarRepository):
         from datetime import timedelta
 
         return target_date + timedelta(days=1)
+
+
+def _location_id_of(item: Mapping[str, Any]) -> str | None:
+    """API 形式のイベントから本ツールが付与した地点IDを取り出す
+
+    Args:
+        item: API 形式のイベント
+
+    Returns:
+        extendedProperties.private.location_id（本ツール以外のイベントは None）
+    """
+    return item.get("extendedProperties", {}).get("private", {}).get("location_id")
+
+
+def _filter_synced_events(
+    events: Mapping[str, dict[str, Any]], start_date: date, end_date: date, location_id: str
+) -> list[dict[str, Any]]:
+    """ローカル複製から期間・地点に該当するイベントを抽出
+
+    Args:
+        events: イベントID → API 形式のイベント
+        start_date: 検索開始日（この日を含む）
+        end_date: 検索終了日（この日を含む）
+        location_id: 地点の不変ID
+
+    Returns:
+        該当する API 形式のイベント
+    """
+    start, end = start_date.isoformat(), end_date.isoformat()
+    matched = []
+    for item in events.values():
+        if _location_id_of(item) != location_id:
+            continue
+        # 終日イベントの start.date は ISO 形式のため文字列のまま比較できる
+        event_date = item.get("start", {}).get("date")
+        if event_date is not None and start <= event_date <= end:
+            matched.append(item)
+    return matched
+
+
+def _read_sync_cache(
+    cache_file: pathlib.Path, calendar_id: str
+) -> tuple[str | None, dict[str, dict[str, Any]]]:
+    """増分同期キャッシュを読み込む
+
+    Args:
+        cache_file: キャッシュファイルのパス
+        calendar_id: 対象カレンダーID
+
+    Returns:
+        (同期トークン, イベントID → API 形式のイベント)。
+        存在しない・壊れている・別カレンダーの場合は (None, {})
+    """
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            data = json.load(f)
+        if data["version"] != _SYNC_CACHE_VERSION or data["calendar_id"] != calendar_id:
+            return None, {}
+        sync_token = data["sync_token"]
+        events = data["events"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, {}
+
+    if not isinstance(sync_token, str) or not isinstance(events, dict):
+        return None, {}
+    return sync_token, events
+
+
+def _write_sync_cache(
+    cache_file: pathlib.Path,
+    calendar_id: str,
+    sync_token: str,
+    events: Mapping[str, dict[str, Any]],
+) -> None:
+    """増分同期キャッシュをアトミックに書き込む
+
+    書き込みに失敗した場合は無視します（次回は全件取得になります）。
+
+    Args:
+        cache_file: キャッシュファイルのパス
+        calendar_id: 対象カレンダーID
+        sync_token: 次回用の同期トークン
+        events: イベントID → API 形式のイベント
+    """
+    data = {
+        "version": _SYNC_CACHE_VERSION,
+        "calendar_id": calendar_id,
+        "sync_token": sync_token,
+        "events": events,
+    }
+    tmp_path: str | None = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, prefix=f".{cache_file.name}.")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_file)
+        tmp_path = None
+    except OSError as e:
+        logger.warning("増分同期キャッシュの書き込みに失敗しました: %s", e)
+    finally:
+        if tmp_path is not None:
+            pathlib.Path(tmp_path).unlink(missing_ok=True)
@@ -6,7 +6,7 @@ Domainモデルに変換します。
 """
 
 import logging
-from datetime import date
+from datetime import date, datetime, timedelta
 
 from fishing_forecast_gcal.domain.models.location import Location
 from fishing_forecast_gcal.domain.models.tide import Tide
@@ -93,39 +93,8 @@ class TideDataRepository(ITideDataRepository):
             tide_data = self._adapter.calculate_tide(location, target_date)
             logger.debug(f"Received {len(tide_data)} tide data points")
 
-            # 2. 満干潮を抽出
-            events = self._calculation_service.extract_high_low_tides(tide_data)
-            if not events:
-                raise RuntimeError(
-                    f"No high/low tide events found for {location.name} on {target_date}"
-                )
-            logger.debug(f"Extracted {len(events)} tide events")
-
-            # 3. 時合い帯を計算
-            prime_times = self._prime_time_finder.find(events)
-
-            # 4. 潮回りを判定
-            moon_age = self._moon_age_calculator.calculate(target_date)
-            tide_range = self._calculation_service.calculate_tide_range(events)
-            tide_type = self._type_classifier.classify(tide_range, moon_age)
-            logger.debug(
-                f"Calculated tide_type={tide_type.value}, moon_age={moon_age:.2f}, "
-                f"tide_range={tide_range:.1f}cm"
-            )
-
-            # 5. Tideモデルを構築
-            tide = Tide(
-                date=target_date,
-                tide_type=tide_type,
-                events=events,
-                prime_times=prime_times if prime_times else None,
-            )
-
-            logger.info(
-                f"Successfully fetched tide data: {tide_type.value}, "
-                f"{len(events)} events, prime_times={len(prime_times)} slot(s)"
-            )
-            return tide
+            # 2. 満干潮・時合い帯・潮回りを計算
+            return self._build_tide(location, target_date, tide_data)
 
         except FileNotFoundError as e:
             logger.error(f"Harmonics file not found for {location.name}: {e}")
@@ -134,6 +103,107 @@ class TideDataRepository(ITideDataRepository):
             logger.error(f"Failed to fetch tide data for {location.name}: {e}")
             raise RuntimeError(f"Failed to fetch tide data: {e}") from e
 
+    def get_tide_data_range(
+        self, location: Location, start_date: date, end_date: date
+    ) -> tuple[dict[date, Tide], dict[date, Exception]]:
+        """指定地点・期間の潮汐データをまとめて取得
+
+        期間全体の時系列潮位をアダプターの1回の呼び出しで計算し、
+        日ごとに満干潮・時合い帯・潮回りを求めます。
+
+        Args:
+            location: 対象地点の情報
+            start_date: 期間の開始日（この日を含む）
+            end_date: 期間の終了日（この日を含む）
+
+        Returns:
+            (日付→潮汐データ, 取得に失敗した日付→例外) のタプル。
+            予測計算自体に失敗した場合は、期間内の全日付に同じ例外が記録されます。
+        """
+        logger.info(f"Fetching tide data for {location.name} from {start_date} to {end_date}")
+
+        tides: dict[date, Tide] = {}
+        errors: dict[date, Exception] = {}
+
+        try:
+            series_by_date = self._adapter.calculate_tide_range(location, start_date, end_date)
+        except Exception as e:
+            error: Exception
+            if isinstance(e, FileNotFoundError):
+                logger.error(f"Harmonics file not found for {location.name}: {e}")
+                error = e
+            else:
+                logger.error(f"Failed to fetch tide data for {location.name}: {e}")
+                error = RuntimeError(f"Failed to fetch tide data: {e}")
+                error.__cause__ = e
+            for offset in range((end_date - start_date).days + 1):
+                errors[start_date + timedelta(days=offset)] = error
+            return tides, errors
+
+        for target_date, tide_data in series_by_date.items():
+            try:
+                tides[target_date] = self._build_tide(location, target_date, tide_data)
+            except Exception as e:
+                logger.error(f"Failed to fetch tide data for {location.name}: {e}")
+                wrapped = RuntimeError(f"Failed to fetch tide data: {e}")
+                wrapped.__cause__ = e
+                errors[target_date] = wrapped
+
+        return tides, errors
+
+    def _build_tide(
+        self,
+        location: Location,
+        target_date: date,
+        tide_data: list[tuple[datetime, float]],
+    ) -> Tide:
+        """時系列潮位データから Tide モデルを構築
+
+        Args:
+            location: 対象地点の情報
+            target_date: 対象日
+            tide_data: 対象日の (時刻, 潮位cm) のリスト
+
+        Returns:
+            Tide: 潮汐データ
+
+        Raises:
+            RuntimeError: 満干潮が見つからない場合
+        """
+        # 1. 満干潮を抽出
+        events = self._calculation_service.extract_high_low_tides(tide_data)
+        if not events:
+            raise RuntimeError(
+                f"No high/low tide events found for {location.name} on {target_date}"
+            )
+        logger.debug(f"Extracted {len(events)} tide events")
+
+        # 2. 時合い帯を計算
+        prime_times = self._prime_time_finder.find(events)
+
+        # 3. 潮回りを判定
+        moon_age = self._moon_age_calculator.calculate(target_date)
+        tide_range = self._calculation_service.calculate_tide_range(events)
+        tide_type = self._type_classifier.classify(tide_range, moon_age)
+        logger.debug(
+            f"Calculated tide_type={tide_type.value}, moon_age={moon_age:.2f}, "
+            f"tide_range={tide_range:.1f}cm"
+        )
+
+        # 4. Tideモデルを構築
+        tide = Tide(
+            date=target_date,
+            tide_type=tide_type,
+            events=events,
+            prime_times=prime_times if prime_times else None,
+        )
+
+        logger.info(
+            f"Successfully fetched tide data: {tide_type.value}, "
+            f"{len(events)} events, prime_times={len(prime_times)} slot(s)"
+        )
+        return tide
+
     def get_hourly_heights(
         self, location: Location, target_date: date
     ) -> list[tuple[float, float]]:
@@ -7,8 +7,11 @@ matplotlib + seaborn + matplotlib-fontja を使用し、
 Domain 層の ``ITideGraphService`` Protocol を実装しています。
 """
 
+import functools
+import io
 import logging
 import tempfile
+import threading
 from datetime import date, datetime
 from pathlib import Path
 
@@ -17,6 +20,10 @@ import matplotlib.pyplot as plt
 import matplotlib_fontja
 import numpy as np
 import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
 from numpy.typing import NDArray
 
 from fishing_forecast_gcal.domain.models.tide import TideEvent, TideType
@@ -29,9 +36,43 @@ logger = logging.getLogger(__name__)
 # matplotlib バックエンドを非表示に設定（サーバー環境対応）
 matplotlib.use("Agg")
 
-# seaborn テーマ適用後に日本語フォントを再適用
-sns.set_theme(style="darkgrid")
-matplotlib_fontja.japanize()
+# rc_context は rcParams（プロセス全体の状態）を書き換えるため、
+# 複数のレンダラーがスレッドから使われても描画が重ならないよう全インスタンスで共有する
+_RENDER_LOCK = threading.Lock()
+
+
+@functools.cache
+def _ensure_style() -> matplotlib.RcParams:
+    """Build the rcParams overrides for the tide graph style once.
+
+    seaborn テーマ適用後に日本語フォントを再適用した rcParams の差分を返します。
+    グローバルな rcParams は変更せず、描画時に ``rc_context`` で適用します。
+
+    Returns:
+        matplotlib.RcParams: デフォルトから変更された rcParams
+            （``rc_context`` が受け付けるキー型のまま保持する）
+    """
+    with matplotlib.rc_context():
+        base = dict(matplotlib.rcParams)
+        sns.set_theme(style="darkgrid")
+        matplotlib_fontja.japanize()
+        return matplotlib.RcParams(
+            {k: v for k, v in matplotlib.rcParams.items() if base.get(k) != v}
+        )
+
+
+@functools.cache
+def _annotation_font() -> FontProperties:
+    """Build the bold font used for high/low tide annotations once.
+
+    フォントファミリーはスタイル適用後の rcParams から解決する必要があるため、
+    ``_ensure_style`` の rcParams 下で生成します。
+
+    Returns:
+        FontProperties: 満干潮ラベル用の太字フォント
+    """
+    with matplotlib.rc_context(_ensure_style()):
+        return FontProperties(weight="bold", size=10)
 
 
 class _DarkPalette:
@@ -69,6 +110,37 @@ class TideGraphRenderer:
     DPI: int = 150
     FIGSIZE: tuple[int, int] = (6, 6)
 
+    # 余白（Figure 比率）: レイアウトは常に同じため、bbox_inches="tight" による
+    # 計測用の事前描画を行わず固定値で指定する
+    _SUBPLOT_MARGINS: dict[str, float] = {
+        "left": 0.13,
+        "right": 0.96,
+        "top": 0.90,
+        "bottom": 0.11,
+    }
+
+    # PNG エンコード設定: ベタ塗り主体のグラフでは zlib レベルを下げても
+    # サイズはほぼ変わらず、エンコード時間を大きく短縮できる
+    _PNG_PIL_KWARGS: dict[str, object] = {"compress_level": 3, "optimize": False}
+
+    # X 軸目盛り（0〜24 時、3 時間刻み）: 全グラフ共通の定数
+    _XTICKS: tuple[int, ...] = tuple(range(0, 25, 3))
+    _XTICKLABELS: tuple[str, ...] = tuple(f"{h:02d}:00" for h in _XTICKS)
+
+    def __init__(self) -> None:
+        """Initialize renderer.
+
+        描画スタイルは初回のみ構築してプロセス内で共有します。
+        Figure/Axes は初回描画時に生成し、以降の呼び出しで再利用します。
+        Agg・rcParams はスレッドセーフではないため、描画〜保存は
+        全インスタンス共通のロックで直列化します。
+        """
+        self._style = _ensure_style()
+        self._fig: Figure | None = None
+        self._ax: plt.Axes | None = None
+        self._canvas: FigureCanvasAgg | None = None
+        self._lock = _RENDER_LOCK
+
     def generate_graph(
         self,
         target_date: date,
@@ -117,49 +189,69 @@ class TideGraphRenderer:
             output_dir = Path(tempfile.mkdtemp(prefix="tide_graph_"))
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        filename = f"tide_graph_{location_id}_{target_date.strftime('%Y%m%d')}.png"
+        filename = (
+            f"tide_graph_{location_id}_"
+            f"{target_date.year:04d}{target_date.month:02d}{target_date.day:02d}.png"
+        )
         output_path = output_dir / filename
 
-        # データ準備
-        hours = np.array([h for h, _ in hourly_heights])
-        heights = np.array([ht for _, ht in hourly_heights])
-
-        # 描画
-        fig, ax = self._create_figure()
-        self._plot_tide_curve(ax, hours, heights)
-        self._plot_tide_events(ax, tide_events, target_date)
-        self._plot_prime_time_bands(ax, prime_times, target_date)
-        self._configure_axes(ax, heights, target_date, location_name, tide_type)
-
-        # 保存
-        fig.savefig(
-            output_path,
-            dpi=self.DPI,
-            bbox_inches="tight",
-            facecolor=fig.get_facecolor(),
-            pad_inches=0.3,
-        )
-        plt.close(fig)
-
-        file_size_kb = output_path.stat().st_size / 1024
-        logger.info(
-            "タイドグラフ画像を保存: %s (%.1f KB)",
-            output_path,
-            file_size_kb,
-        )
+        # データ準備（(N, 2) 配列を 1 回で確保し、列ビューとして分解）
+        samples = np.asarray(hourly_heights, dtype=np.float64)
+        hours = samples[:, 0]
+        heights = samples[:, 1]
+
+        with self._lock, matplotlib.rc_context(self._style):
+            # 描画
+            fig, ax = self._create_figure()
+            self._plot_tide_curve(ax, hours, heights)
+            self._plot_tide_events(ax, tide_events, target_date)
+            self._plot_prime_time_bands(ax, prime_times, target_date)
+            self._configure_axes(ax, heights, target_date, location_name, tide_type)
+
+            # 保存（Figure に束縛済みの Agg キャンバスで直接 PNG をエンコードする）
+            buffer = io.BytesIO()
+            canvas = self._canvas or FigureCanvasAgg(fig)
+            canvas.print_png(buffer, pil_kwargs=self._PNG_PIL_KWARGS)
+            written = output_path.write_bytes(buffer.getbuffer())
+
+        # サイズは書き込みバイト数から求め、stat() を呼ばない
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("タイドグラフ画像を保存: %s (%.1f KB)", output_path, written / 1024)
 
         return output_path
 
-    def _create_figure(self) -> tuple[plt.Figure, plt.Axes]:
+    def close(self) -> None:
+        """Release the cached figure.
+
+        キャッシュしている Figure を破棄します。次回の描画時に再生成されます。
+        """
+        with self._lock:
+            self._fig = None
+            self._ax = None
+            self._canvas = None
+
+    def _create_figure(self) -> tuple[Figure, plt.Axes]:
         """Create figure with dark mode styling.
 
+        初回は Figure/Axes を生成し、2 回目以降はキャッシュした Axes を
+        クリアして再利用します。pyplot の Figure 管理には登録しないため、
+        ``plt.close`` は不要です。
+
         Returns:
             tuple[Figure, Axes]: Matplotlib figure and axes.
         """
-        fig, ax = plt.subplots(figsize=self.FIGSIZE)
-        fig.set_facecolor(_DarkPalette.BACKGROUND)
-        ax.set_facecolor(_DarkPalette.BACKGROUND)
-        return fig, ax  # type: ignore[return-value]
+        if self._fig is None or self._ax is None:
+            fig = Figure(figsize=self.FIGSIZE, dpi=self.DPI)
+            # savefig は呼び出しごとにキャンバスを差し替えるため、Agg キャンバスを一度だけ束縛する
+            self._canvas = FigureCanvasAgg(fig)
+            ax = fig.subplots()
+            fig.subplots_adjust(**self._SUBPLOT_MARGINS)
+            fig.set_facecolor(_DarkPalette.BACKGROUND)
+            self._fig, self._ax = fig, ax
+        else:
+            self._ax.clear()
+        self._ax.set_facecolor(_DarkPalette.BACKGROUND)
+        return self._fig, self._ax
 
     def _plot_tide_curve(
         self,
@@ -174,19 +266,30 @@ class TideGraphRenderer:
             hours: Time values in hours (0-24).
             heights: Tide height values in cm.
         """
-        ax.plot(  # type: ignore[call-overload]
-            hours,
-            heights,
-            color=_DarkPalette.TIDE_CURVE,
-            linewidth=2.5,
-            zorder=3,
+        curve = np.column_stack((hours, heights))
+
+        # 潮位曲線と 0cm の間を塗りつぶす（fill_between 相当の単一ポリゴン）
+        fill_verts = np.concatenate((curve, np.column_stack((hours[::-1], np.zeros_like(hours)))))
+        ax.add_collection(
+            PolyCollection(
+                [fill_verts],
+                facecolors=_DarkPalette.TIDE_CURVE,
+                edgecolors="none",
+                alpha=_DarkPalette.FILL_ALPHA,
+                zorder=2,
+            ),
+            autolim=False,
         )
-        ax.fill_between(  # type: ignore[call-overload]
-            hours,
-            heights,
-            alpha=_DarkPalette.FILL_ALPHA,
-            color=_DarkPalette.TIDE_CURVE,
-            zorder=2,
+        ax.add_collection(
+            LineCollection(
+                [curve],
+                colors=_DarkPalette.TIDE_CURVE,
+                linewidths=2.5,
+                capstyle="projecting",
+                joinstyle="round",
+                zorder=3,
+            ),
+            autolim=False,
         )
 
     def _plot_tide_events(
@@ -202,15 +305,32 @@ class TideGraphRenderer:
             tide_events: List of high/low tide events.
             target_date: Target date for filtering events.
         """
-        for event in tide_events:
-            # 対象日のイベントのみ描画
-            if event.time.date() != target_date:
-                continue
-
-            hour = event.time.hour + event.time.minute / 60.0
-            height = event.height_cm
+        # 対象日のイベントのみ描画（date オブジェクトを生成せず通日番号で比較）
+        target_ord = target_date.toordinal()
+        events = [e for e in tide_events if e.time.toordinal() == target_ord]
+        if not events:
+            return
 
-            if event.event_type == "high":
+        count = len(events)
+        hours = np.fromiter(
+            (self._datetime_to_hours(e.time, target_date) for e in events),
+            dtype=np.float64,
+            count=count,
+        )
+        heights = np.fromiter((e.height_cm for e in events), dtype=np.float64, count=count)
+        is_high = np.fromiter((e.event_type == "high" for e in events), dtype=bool, count=count)
+
+        # マーカー描画（満潮・干潮それぞれ 1 回の scatter にまとめる）
+        for mask, color in (
+            (is_high, _DarkPalette.HIGH_TIDE_MARKER),
+            (~is_high, _DarkPalette.LOW_TIDE_MARKER),
+        ):
+            if mask.any():
+                ax.scatter(hours[mask], heights[mask], color=color, s=100, zorder=5)
+
+        font = _annotation_font()
+        for index, event in enumerate(events):
+            if is_high[index]:
                 color = _DarkPalette.HIGH_TIDE_MARKER
                 label_prefix = "満"
                 va = "bottom"
@@ -221,27 +341,17 @@ class TideGraphRenderer:
                 va = "top"
                 y_offset = -8
 
-            # マーカー描画
-            ax.plot(  # type: ignore[call-overload]
-                hour,
-                height,
-                "o",
-                color=color,
-                markersize=10,
-                zorder=5,
-            )
-
             # アノテーション（時刻 + 潮位の 2 行ラベル）
-            label = f"{label_prefix} {event.time.strftime('%H:%M')}\n{int(event.height_cm)}cm"
+            t = event.time
+            label = f"{label_prefix} {t.hour:02d}:{t.minute:02d}\n{int(event.height_cm)}cm"
             ax.annotate(
                 label,
-                xy=(hour, height),
+                xy=(float(hours[index]), float(heights[index])),
                 xytext=(0, y_offset),
                 textcoords="offset points",
                 ha="center",
                 va=va,
-                fontsize=10,
-                fontweight="bold",
+                fontproperties=font,
                 color=color,
                 zorder=6,
             )
@@ -300,16 +410,12 @@ class TideGraphRenderer:
         """
         # X 軸: 0〜24 時（3 時間刻み）
         ax.set_xlim(0, 24)
-        ax.set_xticks(range(0, 25, 3))
-        ax.set_xticklabels(
-            [f"{h:02d}:00" for h in range(0, 25, 3)],
-            fontsize=9,
-            color=_DarkPalette.TEXT,
-        )
+        ax.set_xticks(self._XTICKS)
+        ax.set_xticklabels(self._XTICKLABELS, fontsize=9, color=_DarkPalette.TEXT)
 
         # Y 軸: 潮位範囲にマージン追加
-        height_min = float(np.min(heights))
-        height_max = float(np.max(heights))
+        height_min = float(heights.min())
+        height_max = float(heights.max())
         margin = (height_max - height_min) * 0.15
         ax.set_ylim(height_min - margin, height_max + margin)
         ax.tick_params(axis="y", colors=_DarkPalette.TEXT, labelsize=9)
@@ -326,13 +432,19 @@ class TideGraphRenderer:
             spine.set_color(_DarkPalette.GRID)
 
         # タイトル（絵文字はフォントに含まれない場合があるため、テキストのみ使用）
-        title = f"{location_name} {target_date.strftime('%Y年%m月%d日')}  [{tide_type.value}]"
+        # 日付は strftime（ロケール依存の C 呼び出し）を経由せず属性から組み立てる
+        title = (
+            f"{location_name} "
+            f"{target_date.year}年{target_date.month:02d}月{target_date.day:02d}日"
+            f"  [{tide_type.value}]"
+        )
         ax.set_title(
             title,
             fontsize=14,
             fontweight="bold",
             color=_DarkPalette.TITLE,
             pad=15,
+            wrap=True,
         )
 
     @staticmethod
@@ -346,6 +458,7 @@ class TideGraphRenderer:
         Returns:
             float: Hours from midnight of target_date.
         """
-        midnight = datetime.combine(target_date, datetime.min.time(), tzinfo=dt.tzinfo)
-        delta = dt - midnight
-        return delta.total_seconds() / 3600.0
+        # 同一タイムゾーンの壁時計時刻として差を取る（midnight の datetime を生成しない）
+        days = dt.toordinal() - target_date.toordinal()
+        seconds = ((days * 24 + dt.hour) * 60 + dt.minute) * 60 + dt.second
+        return (seconds + dt.microsecond / 1_000_000) / 3600.0
@@ -5,15 +5,15 @@
 """
 
 import argparse
+import functools
 import logging
 import sys
+from collections.abc import Sequence
 from datetime import date, timedelta
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 from fishing_forecast_gcal.presentation.commands import common
 from fishing_forecast_gcal.presentation.commands.common import parse_date, setup_logging
-from fishing_forecast_gcal.presentation.config_loader import load_config
 
 if TYPE_CHECKING:
     from fishing_forecast_gcal.domain.models.location import Location
@@ -24,13 +24,14 @@ logger = logging.getLogger(__name__)
 __all__ = ["main", "parse_args", "parse_date", "setup_logging"]
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command-line arguments.
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once per process.
 
-    コマンドライン引数をパースします。
+    引数パーサーを構築します。構築結果はプロセス内でキャッシュします。
 
     Returns:
-        Parsed arguments namespace.
+        ArgumentParser with all subcommands registered.
     """
     parser = argparse.ArgumentParser(
         prog="fishing-forecast-gcal",
@@ -50,6 +51,18 @@ def parse_args() -> argparse.Namespace:
     reset_tide.add_arguments(subparsers)
     cleanup_images.add_arguments(subparsers)
 
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    コマンドライン引数をパースします。
+
+    Returns:
+        Parsed arguments namespace.
+    """
+    parser = _build_parser()
     parsed = parser.parse_args()
 
     # --days と --end-date の排他チェック
@@ -68,6 +81,10 @@ def parse_args() -> argparse.Namespace:
     ):
         parser.error("--days must be a positive integer (>= 1)")
 
+    # --workers の値バリデーション
+    if parsed.command == "sync-tide" and parsed.workers < 1:
+        parser.error("--workers must be a positive integer (>= 1)")
+
     # --retention-days の値バリデーション
     if (
         parsed.command == "cleanup-images"
@@ -80,7 +97,7 @@ def parse_args() -> argparse.Namespace:
 
 
 def _resolve_locations(
-    config_locations: list["Location"],
+    config_locations: Sequence["Location"],
     location_id: str | None,
 ) -> list["Location"]:
     """Resolve target locations from config and CLI argument.
@@ -95,16 +112,15 @@ def _resolve_locations(
         List of target locations.
     """
     if location_id:
-        target_locations = [loc for loc in config_locations if loc.id == location_id]
-        if not target_locations:
+        locations_by_id = {loc.id: loc for loc in config_locations}
+        location = locations_by_id.get(location_id)
+        if location is None:
             logger.error("Location ID not found in config: %s", location_id)
-            logger.error(
-                "Available locations: %s",
-                ", ".join(loc.id for loc in config_locations),
-            )
+            logger.error("Available locations: %s", ", ".join(locations_by_id))
             sys.exit(1)
-        return target_locations
-    return config_locations
+        return [location]
+    # 設定は呼び出し元間で共有されるため、コマンドには新しいリストを渡す
+    return list(config_locations)
 
 
 def _resolve_period(
@@ -156,14 +172,22 @@ def main() -> None:
 
         # 設定ファイル読み込み
         logger.info("Loading configuration from: %s", args.config)
-        config_path = Path(args.config)
 
-        if not config_path.exists():
-            logger.error("Configuration file not found: %s", config_path)
+        # 設定ローダー（PyYAML）は --help・引数エラー時に読み込まないよう、ここでインポートする
+        from fishing_forecast_gcal.presentation.config_loader import (
+            load_config,
+            validate_runtime_paths,
+        )
+
+        # 存在確認を別に行わず、読み込み時の FileNotFoundError で判定する（確認〜読み込み間の競合も防ぐ）
+        try:
+            config = load_config(args.config)
+        except FileNotFoundError:
+            logger.error("Configuration file not found: %s", args.config)
             logger.error("Please create config/config.yaml from config/config.yaml.template")
             sys.exit(1)
+        validate_runtime_paths(config)
 
-        config = load_config(str(config_path))
         settings = config.settings
         logger.info("Configuration loaded successfully")
         logger.info("  Timezone: %s", settings.timezone)
@@ -180,10 +204,11 @@ def main() -> None:
 
         # 対象地点の決定
         target_locations = _resolve_locations(config.locations, args.location_id)
-        logger.info(
-            "Target locations: %s",
-            ", ".join(f"{loc.name} ({loc.id})" for loc in target_locations),
-        )
+        if args.location_id:
+            location_labels = f"{target_locations[0].name} ({target_locations[0].id})"
+        else:
+            location_labels = config.location_labels
+        logger.info("Target locations: %s", location_labels)
 
         # 対象期間の決定
         start_date, end_date = _resolve_period(args, settings.tide_register_months)
@@ -212,6 +237,9 @@ def main() -> None:
         logger.error("Unexpected error: %s", e, exc_info=True)
         sys.exit(1)
 
+    finally:
+        common.flush_logging()
+
 
 if __name__ == "__main__":
     main()
@@ -8,12 +8,6 @@ import logging
 import sys
 from typing import TYPE_CHECKING, Any
 
-from fishing_forecast_gcal.application.usecases.cleanup_drive_images_usecase import (
-    CleanupDriveImagesUseCase,
-)
-from fishing_forecast_gcal.infrastructure.clients.google_drive_client import (
-    GoogleDriveClient,
-)
 from fishing_forecast_gcal.presentation.commands.common import add_common_arguments
 
 if TYPE_CHECKING:
@@ -67,7 +61,14 @@ def run(
     if args.dry_run:
         logger.warning("[DRY-RUN] No files will be deleted")
 
-    # 依存オブジェクトの構築
+    # 依存オブジェクトの構築（Google API クライアントはコマンド実行時に読み込む）
+    from fishing_forecast_gcal.application.usecases.cleanup_drive_images_usecase import (
+        CleanupDriveImagesUseCase,
+    )
+    from fishing_forecast_gcal.infrastructure.clients.google_drive_client import (
+        GoogleDriveClient,
+    )
+
     logger.info("Initializing dependencies...")
 
     drive_client = GoogleDriveClient(
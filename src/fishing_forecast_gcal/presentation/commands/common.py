@@ -4,30 +4,66 @@
 """
 
 import argparse
+import functools
 import logging
 from datetime import date
+from logging.handlers import MemoryHandler
+
+# ログをまとめて書き出す件数（ERROR 以上は即時出力）
+_LOG_BUFFER_CAPACITY = 256
 
 
 def setup_logging(verbose: bool = False) -> None:
     """Initialize logging configuration.
 
     ロギング設定を初期化します。
+    出力はメモリ上にバッファし、一定件数ごと・ERROR 以上の記録時・終了時にまとめて書き出します。
 
     Args:
         verbose: If True, set log level to DEBUG. (詳細ログを出力する場合True)
     """
     level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format="[%(asctime)s] %(levelname)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("[%(asctime)s] %(levelname)s: %(message)s", "%Y-%m-%d %H:%M:%S")
+    )
+    buffer_handler = MemoryHandler(
+        _LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=stream_handler
     )
+    logging.basicConfig(level=level, handlers=[buffer_handler])
+
+
+def flush_logging() -> None:
+    """Write out buffered log records.
+
+    バッファ中のログを書き出します（入力待ちの前やコマンド終了時に使用）。
+    """
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
+def unbuffer_logging() -> None:
+    """Replace buffered handlers with their targets in a worker process.
+
+    ワーカープロセスは atexit を経ずに終了するため、バッファ付きハンドラーのままだと
+    未出力のログが失われます。フォークで親から引き継いだバッファは親が出力するため破棄し、
+    出力先ハンドラーへ直接書き込むよう差し替えます。
+    """
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, MemoryHandler) and handler.target is not None:
+            handler.buffer.clear()
+            root.removeHandler(handler)
+            root.addHandler(handler.target)
 
 
+@functools.lru_cache(maxsize=32)
 def parse_date(date_str: str) -> date:
     """Parse a date string in YYYY-MM-DD format.
 
     日付文字列をパースします。
+    結果（不変な date）はキャッシュされ、同じ文字列の再パースを省きます。
+    不正な文字列は例外となるためキャッシュされません。
 
     Args:
         date_str: Date string in YYYY-MM-DD format.
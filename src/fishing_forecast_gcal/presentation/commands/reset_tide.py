@@ -5,28 +5,39 @@
 
 import argparse
 import logging
+import queue
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from fishing_forecast_gcal.application.usecases.reset_tide_usecase import ResetTideUseCase
-from fishing_forecast_gcal.infrastructure.clients.google_calendar_client import (
-    GoogleCalendarClient,
-)
-from fishing_forecast_gcal.infrastructure.repositories.calendar_repository import (
-    CalendarRepository,
-)
 from fishing_forecast_gcal.presentation.commands.common import (
     add_common_arguments,
     add_period_arguments,
+    flush_logging,
 )
 
 if TYPE_CHECKING:
+    from fishing_forecast_gcal.application.usecases.reset_tide_usecase import (
+        ResetResult,
+        ResetTideUseCase,
+    )
     from fishing_forecast_gcal.domain.models.location import Location
+    from fishing_forecast_gcal.infrastructure.repositories.calendar_repository import (
+        CalendarEventReplica,
+    )
     from fishing_forecast_gcal.presentation.config_loader import AppSettings
 
 logger = logging.getLogger(__name__)
 
+# 地点並列削除のスレッド数上限（API のレート制限を考慮）
+_MAX_LOCATION_THREADS = 8
+
+# イベント一覧の増分同期キャッシュの保存先（実行ディレクトリ基準）
+_SYNC_CACHE_DIR = Path(".cache")
+
 
 def add_arguments(subparsers: Any) -> None:
     """Add reset-tide subcommand and its arguments.
@@ -78,6 +89,8 @@ def run(
         print(f"  Locations: {location_names}")
         print(f"  Period: {start_date} to {end_date} ({total_days} days)")
         print()
+        # 入力待ちの前にバッファ中のログを出力しておく
+        flush_logging()
 
         try:
             answer = input("Are you sure? (y/N): ").strip().lower()
@@ -88,40 +101,40 @@ def run(
             logger.info("Operation cancelled by user")
             sys.exit(0)
 
-    # 依存オブジェクトの構築
+    # 依存オブジェクトの構築（Google API クライアントは確認後に読み込む）
     logger.info("Initializing dependencies...")
-
-    calendar_client = GoogleCalendarClient(
-        credentials_path=settings.google_credentials_path,
-        token_path=settings.google_token_path,
+    from fishing_forecast_gcal.infrastructure.repositories.calendar_repository import (
+        CalendarEventReplica,
     )
-    calendar_client.authenticate()
-    logger.info("Google Calendar authentication successful")
 
-    calendar_repo = CalendarRepository(
-        client=calendar_client,
+    # イベント一覧の増分同期は全地点で共有し、1 回の実行につき 1 回だけ行う
+    event_replica = CalendarEventReplica(
+        cache_path=_SYNC_CACHE_DIR / f"sync_token_{settings.calendar_id}.json",
         calendar_id=settings.calendar_id,
     )
-
-    # UseCase
-    reset_usecase = ResetTideUseCase(calendar_repo=calendar_repo)
+    reset_usecase = _build_usecase(settings, event_replica)
 
     # メイン処理
     logger.info("Starting reset process...")
-    grand_total_found = 0
-    grand_total_deleted = 0
-    grand_total_failed = 0
 
-    for location in target_locations:
-        result = reset_usecase.execute(
+    def reset_location(usecase: "ResetTideUseCase", location: "Location") -> "ResetResult":
+        return usecase.execute(
             location=location,
             start_date=start_date,
             end_date=end_date,
             dry_run=args.dry_run,
         )
-        grand_total_found += result.total_found
-        grand_total_deleted += result.total_deleted
-        grand_total_failed += result.total_failed
+
+    if len(target_locations) == 1:
+        results = [reset_location(reset_usecase, target_locations[0])]
+    else:
+        results = _run_threaded(
+            settings, target_locations, reset_usecase, reset_location, event_replica
+        )
+
+    grand_total_found = sum(result.total_found for result in results)
+    grand_total_deleted = sum(result.total_deleted for result in results)
+    grand_total_failed = sum(result.total_failed for result in results)
 
     # 結果サマリー
     logger.info("=" * 70)
@@ -137,3 +150,83 @@ def run(
 
     if grand_total_failed > 0:
         sys.exit(1)
+
+
+def _build_usecase(
+    settings: "AppSettings", event_replica: "CalendarEventReplica"
+) -> "ResetTideUseCase":
+    """Build ResetTideUseCase with an authenticated calendar client.
+
+    認証済みのカレンダークライアントとリポジトリから UseCase を構築します。
+
+    Args:
+        settings: Application settings.
+        event_replica: Local event replica shared by all locations.
+
+    Returns:
+        ResetTideUseCase instance.
+    """
+    from fishing_forecast_gcal.application.usecases.reset_tide_usecase import ResetTideUseCase
+    from fishing_forecast_gcal.infrastructure.clients.google_calendar_client import (
+        GoogleCalendarClient,
+    )
+    from fishing_forecast_gcal.infrastructure.repositories.calendar_repository import (
+        CalendarRepository,
+    )
+
+    calendar_client = GoogleCalendarClient(
+        credentials_path=settings.google_credentials_path,
+        token_path=settings.google_token_path,
+    )
+    calendar_client.authenticate()
+    logger.info("Google Calendar authentication successful")
+
+    # 前回実行からの変更分だけを取得するよう、イベント一覧は増分同期した複製を使う
+    calendar_repo = CalendarRepository(
+        client=calendar_client,
+        calendar_id=settings.calendar_id,
+        event_replica=event_replica,
+    )
+    return ResetTideUseCase(calendar_repo=calendar_repo)
+
+
+def _run_threaded(
+    settings: "AppSettings",
+    target_locations: list["Location"],
+    reset_usecase: "ResetTideUseCase",
+    reset_location: Callable[["ResetTideUseCase", "Location"], "ResetResult"],
+    event_replica: "CalendarEventReplica",
+) -> list["ResetResult"]:
+    """Reset locations concurrently with a thread pool.
+
+    地点単位でスレッドに振り分け、API 呼び出しの待ち時間を重ね合わせます。
+    httplib2 の Http はスレッドセーフではないため、UseCase（API クライアント）は
+    スレッド数ぶん事前に構築し、同時に 1 スレッドだけが使うようキューで貸し出します。
+
+    Args:
+        settings: Application settings.
+        target_locations: List of target locations.
+        reset_usecase: Already built UseCase, reused as one of the pool members.
+        reset_location: Resets one location with the given UseCase.
+        event_replica: Local event replica shared by all locations.
+
+    Returns:
+        Reset results in the order of target_locations.
+    """
+    n_threads = min(_MAX_LOCATION_THREADS, len(target_locations))
+
+    # 認証（トークン更新）が並行しないよう、構築はメインスレッドで行う
+    usecases: queue.SimpleQueue[ResetTideUseCase] = queue.SimpleQueue()
+    usecases.put(reset_usecase)
+    for _ in range(n_threads - 1):
+        usecases.put(_build_usecase(settings, event_replica))
+
+    def reset_with_pooled_usecase(location: "Location") -> "ResetResult":
+        usecase = usecases.get()
+        try:
+            return reset_location(usecase, location)
+        finally:
+            usecases.put(usecase)
+
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        return list(executor.map(reset_with_pooled_usecase, target_locations))
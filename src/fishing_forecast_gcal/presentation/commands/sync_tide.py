@@ -4,44 +4,46 @@
 """
 
 import argparse
+import itertools
 import logging
+import math
+import queue
 import sys
+from collections.abc import Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import date, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from fishing_forecast_gcal.application.usecases.sync_tide_usecase import SyncTideUseCase
-from fishing_forecast_gcal.domain.services.moon_age_calculator import MoonAgeCalculator
-from fishing_forecast_gcal.domain.services.prime_time_finder import PrimeTimeFinder
-from fishing_forecast_gcal.domain.services.tide_calculation_service import TideCalculationService
-from fishing_forecast_gcal.domain.services.tide_type_classifier import TideTypeClassifier
-from fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter import (
-    TideCalculationAdapter,
-)
-from fishing_forecast_gcal.infrastructure.clients.google_calendar_client import (
-    GoogleCalendarClient,
-)
-from fishing_forecast_gcal.infrastructure.clients.google_drive_client import (
-    GoogleDriveClient,
-)
-from fishing_forecast_gcal.infrastructure.repositories.calendar_repository import (
-    CalendarRepository,
-)
-from fishing_forecast_gcal.infrastructure.repositories.tide_data_repository import (
-    TideDataRepository,
-)
-from fishing_forecast_gcal.infrastructure.services.tide_graph_renderer import TideGraphRenderer
 from fishing_forecast_gcal.presentation.commands.common import (
     add_common_arguments,
     add_period_arguments,
+    flush_logging,
+    setup_logging,
+    unbuffer_logging,
 )
 
+# 重い依存（UTide / matplotlib / Google API クライアント）は、--help や引数エラー時に
+# 読み込まないよう、実際に使用する関数内でインポートする
 if TYPE_CHECKING:
+    from fishing_forecast_gcal.application.usecases.sync_tide_usecase import SyncTideUseCase
     from fishing_forecast_gcal.domain.models.location import Location
+    from fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter import (
+        TideCalculationAdapter,
+    )
+    from fishing_forecast_gcal.infrastructure.clients.google_drive_client import (
+        GoogleDriveClient,
+    )
     from fishing_forecast_gcal.presentation.config_loader import AppConfig
 
 logger = logging.getLogger(__name__)
 
+# 地点並列同期のスレッド数上限（API のレート制限を考慮）
+_MAX_LOCATION_THREADS = 8
+
+# プロセス並列時のワーカーあたりのタスク数の目安（負荷の偏りをならす）
+_TASKS_PER_WORKER = 4
+
 
 def add_arguments(subparsers: Any) -> None:
     """Add sync-tide subcommand and its arguments.
@@ -57,6 +59,13 @@ def add_arguments(subparsers: Any) -> None:
     )
     add_common_arguments(parser)
     add_period_arguments(parser)
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=1,
+        help="Number of worker processes for syncing (default: 1, sequential)",
+    )
 
 
 def run(
@@ -77,10 +86,120 @@ def run(
         start_date: Start date (inclusive).
         end_date: End date (inclusive).
     """
-    settings = config.settings
+    # 調和定数は同期開始前に読み込み、ファイル欠損などを早期に検出する
+    tide_adapter = _prepare_tide_adapter(target_locations)
     if args.dry_run:
+        # dry-run は API を呼ばないため認証を省き、調和定数の読み込み確認のみ行う
         logger.warning("[DRY-RUN] No events will be created")
 
+    # メイン処理
+    logger.info("Starting sync process...")
+    total_processed = 0
+    total_errors = 0
+
+    # 対象日を一度だけ生成し、全地点・全スレッドで共有する（共有するため不変のタプルにする）
+    n_days = (end_date - start_date).days + 1
+    dates = tuple(start_date + timedelta(days=i) for i in range(n_days))
+
+    if args.dry_run:
+        # 地点 × 日数ぶんの LogRecord 生成を、INFO が無効なときは丸ごと省く
+        if logger.isEnabledFor(logging.INFO):
+            for location in target_locations:
+                for current_date in dates:
+                    logger.info("[DRY-RUN] Would sync: %s %s", location.id, current_date)
+        total_processed = len(dates) * len(target_locations)
+    elif args.workers > 1:
+        # 各ワーカーが _init_worker で自前の UseCase を構築するため、親プロセスでは構築しない
+        total_processed, total_errors = _run_parallel(config, target_locations, dates, args.workers)
+    else:
+        drive_client = _build_drive_client(config)
+        sync_usecase = _build_usecase(config, target_locations, tide_adapter, drive_client)
+        if len(target_locations) == 1:
+            total_processed, total_errors = _sync_location(sync_usecase, target_locations[0], dates)
+        else:
+            total_processed, total_errors = _run_threaded(
+                config, target_locations, dates, sync_usecase, tide_adapter, drive_client
+            )
+
+    # 結果サマリー
+    logger.info("=" * 70)
+    logger.info("Sync completed")
+    logger.info("  Locations: %s", ", ".join(location.id for location in target_locations))
+    logger.info("  Processed: %d days", total_processed)
+    logger.info("  Errors: %d", total_errors)
+    logger.info("=" * 70)
+
+    if total_errors > 0:
+        sys.exit(1)
+
+
+def _prepare_tide_adapter(target_locations: list["Location"]) -> "TideCalculationAdapter":
+    """Create the tide adapter and load harmonics for the target locations.
+
+    調和定数を事前に読み込み、ファイル欠損などを同期開始前に検出します。
+
+    Args:
+        target_locations: Locations whose harmonics are loaded up front.
+
+    Returns:
+        TideCalculationAdapter with the harmonics cached.
+    """
+    from fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter import (
+        TideCalculationAdapter,
+    )
+
+    tide_adapter = TideCalculationAdapter(Path("config/harmonics"))
+    for location in target_locations:
+        tide_adapter.prepare(location)
+    return tide_adapter
+
+
+def _build_usecase(
+    config: "AppConfig",
+    target_locations: list["Location"],
+    tide_adapter: "TideCalculationAdapter | None" = None,
+    drive_client: "GoogleDriveClient | None" = None,
+) -> "SyncTideUseCase":
+    """Build SyncTideUseCase and its dependencies.
+
+    依存オブジェクト（認証済みクライアント・リポジトリ等）を構築します。
+    並列実行時は各ワーカープロセスでも呼び出されます。
+    対象地点の調和定数はここで事前に読み込み、読み込みエラーを同期開始前に検出します。
+    調和定数は読み取り専用のため、読み込み済みのアダプターを渡すと複数の UseCase で共有します。
+    Drive クライアントもスレッドごとにサービスを構築するため、認証済みのものを渡すと共有します。
+
+    Args:
+        config: Application configuration.
+        target_locations: Locations whose harmonics are loaded up front.
+        tide_adapter: Already prepared adapter to share. Created when omitted.
+        drive_client: Authenticated Drive client to share. Created when omitted
+            and tide graphs are enabled.
+
+    Returns:
+        SyncTideUseCase instance.
+    """
+    from fishing_forecast_gcal.application.usecases.sync_tide_usecase import SyncTideUseCase
+    from fishing_forecast_gcal.domain.services.moon_age_calculator import MoonAgeCalculator
+    from fishing_forecast_gcal.domain.services.prime_time_finder import PrimeTimeFinder
+    from fishing_forecast_gcal.domain.services.tide_calculation_service import (
+        TideCalculationService,
+    )
+    from fishing_forecast_gcal.domain.services.tide_type_classifier import TideTypeClassifier
+    from fishing_forecast_gcal.infrastructure.clients.google_calendar_client import (
+        GoogleCalendarClient,
+    )
+    from fishing_forecast_gcal.infrastructure.repositories.calendar_repository import (
+        CalendarRepository,
+    )
+    from fishing_forecast_gcal.infrastructure.repositories.tide_data_repository import (
+        TideDataRepository,
+    )
+    from fishing_forecast_gcal.infrastructure.services.tide_graph_renderer import (
+        TideGraphRenderer,
+    )
+
+    settings = config.settings
+
     # 依存オブジェクトの構築
     logger.info("Initializing dependencies...")
 
@@ -99,8 +218,8 @@ def run(
     moon_age_calculator = MoonAgeCalculator()
 
     # リポジトリ
-    harmonics_dir = Path("config/harmonics")
-    tide_adapter = TideCalculationAdapter(harmonics_dir)
+    if tide_adapter is None:
+        tide_adapter = _prepare_tide_adapter(target_locations)
     tide_repo = TideDataRepository(
         adapter=tide_adapter,
         tide_calc_service=tide_calc_service,
@@ -115,24 +234,19 @@ def run(
 
     # タイドグラフ関連の依存（有効な場合のみ構築）
     tide_graph_service: TideGraphRenderer | None = None
-    drive_client: GoogleDriveClient | None = None
     drive_folder_name: str = "fishing-forecast-tide-graphs"
 
     if config.tide_graph.enabled:
         logger.info("Tide graph attachment is enabled")
         tide_graph_service = TideGraphRenderer()
-
-        drive_client = GoogleDriveClient(
-            credentials_path=settings.google_credentials_path,
-            token_path=settings.google_token_path,
-        )
-        drive_client.authenticate()
-        logger.info("Google Drive authentication successful")
-
+        if drive_client is None:
+            drive_client = _build_drive_client(config)
         drive_folder_name = config.tide_graph.drive_folder_name
+    else:
+        drive_client = None
 
     # UseCase
-    sync_usecase = SyncTideUseCase(
+    return SyncTideUseCase(
         tide_repo=tide_repo,
         calendar_repo=calendar_repo,
         tide_graph_service=tide_graph_service,
@@ -140,37 +254,220 @@ def run(
         drive_folder_name=drive_folder_name,
     )
 
-    # メイン処理
-    logger.info("Starting sync process...")
+
+def _build_drive_client(config: "AppConfig") -> "GoogleDriveClient | None":
+    """Build an authenticated Drive client when tide graphs are enabled.
+
+    タイドグラフが有効な場合のみ、認証済みの Drive クライアントを構築します。
+
+    Args:
+        config: Application configuration.
+
+    Returns:
+        Authenticated GoogleDriveClient, or None when tide graphs are disabled.
+    """
+    if not config.tide_graph.enabled:
+        return None
+
+    from fishing_forecast_gcal.infrastructure.clients.google_drive_client import (
+        GoogleDriveClient,
+    )
+
+    settings = config.settings
+    drive_client = GoogleDriveClient(
+        credentials_path=settings.google_credentials_path,
+        token_path=settings.google_token_path,
+    )
+    drive_client.authenticate()
+    logger.info("Google Drive authentication successful")
+    return drive_client
+
+
+def _sync_location(
+    usecase: "SyncTideUseCase", location: "Location", dates: Sequence[date]
+) -> tuple[int, int]:
+    """Sync all dates of one location.
+
+    地点ごとに全日付をまとめて同期します（カレンダー書き込みはバッチ送信）。
+
+    Args:
+        usecase: SyncTideUseCase used for this location.
+        location: Target location.
+        dates: Target dates.
+
+    Returns:
+        Tuple of (processed days, error days).
+    """
+    try:
+        failures = usecase.execute_batch(location, dates)
+    except Exception as e:
+        logger.error("Failed to sync %s: %s", location.id, e)
+        return 0, len(dates)
+
+    for failed_date, error in sorted(failures.items()):
+        logger.error("Failed to sync %s: %s", failed_date, error)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Synced: %s (%d days)", location.id, len(dates) - len(failures))
+    return len(dates) - len(failures), len(failures)
+
+
+def _run_threaded(
+    config: "AppConfig",
+    target_locations: list["Location"],
+    dates: Sequence[date],
+    sync_usecase: "SyncTideUseCase",
+    tide_adapter: "TideCalculationAdapter",
+    drive_client: "GoogleDriveClient | None" = None,
+) -> tuple[int, int]:
+    """Sync locations concurrently with a thread pool.
+
+    地点単位でスレッドに振り分け、API 呼び出しの待ち時間を重ね合わせます。
+    httplib2 の Http はスレッドセーフではないため、UseCase（API クライアント）は
+    スレッド数ぶん事前に構築し、同時に 1 スレッドだけが使うようキューで貸し出します。
+
+    Args:
+        config: Application configuration.
+        target_locations: List of target locations.
+        dates: Target dates.
+        sync_usecase: Already built UseCase, reused as one of the pool members.
+        tide_adapter: Prepared adapter shared by all pool members.
+        drive_client: Authenticated Drive client shared by all pool members.
+
+    Returns:
+        Tuple of (processed days, error days).
+    """
+    n_threads = min(_MAX_LOCATION_THREADS, len(target_locations))
+
+    # 認証（トークン更新）が並行しないよう、構築はメインスレッドで行う
+    usecases: queue.SimpleQueue[SyncTideUseCase] = queue.SimpleQueue()
+    usecases.put(sync_usecase)
+    for _ in range(n_threads - 1):
+        usecases.put(_build_usecase(config, target_locations, tide_adapter, drive_client))
+
+    def sync_with_pooled_usecase(location: "Location") -> tuple[int, int]:
+        usecase = usecases.get()
+        try:
+            return _sync_location(usecase, location, dates)
+        finally:
+            usecases.put(usecase)
+
+    processed = 0
+    errors = 0
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        for location_processed, location_errors in executor.map(
+            sync_with_pooled_usecase, target_locations
+        ):
+            processed += location_processed
+            errors += location_errors
+    return processed, errors
+
+
+# ワーカープロセス内で再利用する UseCase（_init_worker で構築）
+_worker_usecase: "SyncTideUseCase | None" = None
+
+
+def _init_worker(config: "AppConfig", target_locations: list["Location"], verbose: bool) -> None:
+    """Initialize a worker process with its own dependencies.
+
+    ワーカープロセスごとに API クライアント・レンダラー等を構築します
+    （matplotlib や HTTP クライアントの状態をプロセス間で共有しないため）。
+
+    Args:
+        config: Application configuration.
+        target_locations: List of target locations.
+        verbose: Whether DEBUG logging is enabled in the parent.
+    """
+    global _worker_usecase
+    # spawn / forkserver で起動したワーカーはロギング設定を引き継がないため設定し直す
+    # （fork の場合は親のハンドラーが残っているので何もしない）
+    setup_logging(verbose)
+    unbuffer_logging()
+    _worker_usecase = _build_usecase(config, target_locations)
+
+
+def _sync_chunk(location: "Location", dates: Sequence[date]) -> dict[date, str]:
+    """Sync consecutive dates of one location in a worker process.
+
+    日付の連続区間を execute_batch でまとめて同期します（イベント一覧の取得・
+    登録が区間ごとに 1 回のバッチで済み、プロセス間通信もタスク単位に減る）。
+
+    Args:
+        location: Target location.
+        dates: Consecutive target dates.
+
+    Returns:
+        Failed dates mapped to their error messages
+        (例外はプロセス間で pickle できない場合があるため文字列で返す).
+    """
+    assert _worker_usecase is not None
+    failures = _worker_usecase.execute_batch(location, dates)
+    return {target_date: str(error) for target_date, error in failures.items()}
+
+
+def _run_parallel(
+    config: "AppConfig",
+    target_locations: list["Location"],
+    dates: Sequence[date],
+    workers: int,
+) -> tuple[int, int]:
+    """Sync all (location, date) pairs using a process pool.
+
+    地点ごとの日付を連続した区間に分け、ProcessPoolExecutor に分配して同期します。
+    区間の大きさはワーカーあたり約 _TASKS_PER_WORKER 個のタスクになるよう決めます。
+
+    Args:
+        config: Application configuration.
+        target_locations: List of target locations.
+        dates: Target dates in ascending order.
+        workers: Number of worker processes.
+
+    Returns:
+        Tuple of (processed count, error count).
+    """
+    from fishing_forecast_gcal.infrastructure.clients import google_auth
+
+    # トークンの更新（失敗時の対話的な再認証を含む）は親プロセスで一度だけ行う。
+    # ワーカーは更新済みのトークンを読み込むだけになり、同時更新による書き込み競合を避けられる
+    google_auth.authenticate(
+        config.settings.google_credentials_path, config.settings.google_token_path
+    )
+
     total_processed = 0
     total_errors = 0
+    # 完了ごとのログ判定を避けるため、DEBUG 有効かどうかはループ前に一度だけ確認する
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    verbose = logging.getLogger().isEnabledFor(logging.DEBUG)
 
-    for location in target_locations:
-        logger.info("Processing location: %s (%s)", location.name, location.id)
+    # フォーク時にバッファ中のログがワーカーへ複製されないよう、先に書き出す
+    flush_logging()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(config, target_locations, verbose),
+    ) as executor:
+        chunk_size = max(
+            1, math.ceil(len(target_locations) * len(dates) / (workers * _TASKS_PER_WORKER))
+        )
+        futures: dict[Future[dict[date, str]], tuple[Location, tuple[date, ...]]] = {
+            executor.submit(_sync_chunk, location, chunk): (location, chunk)
+            for location in target_locations
+            for chunk in itertools.batched(dates, chunk_size, strict=False)
+        }
 
-        current_date = start_date
-        while current_date <= end_date:
+        for future in as_completed(futures):
+            location, chunk = futures[future]
             try:
-                if args.dry_run:
-                    logger.info("[DRY-RUN] Would sync: %s", current_date)
-                else:
-                    sync_usecase.execute(location, current_date)
-                    logger.debug("Synced: %s", current_date)
-
-                total_processed += 1
-
+                failures = future.result()
             except Exception as e:
-                logger.error("Failed to sync %s: %s", current_date, e)
-                total_errors += 1
+                logger.error("Failed to sync %s %s to %s: %s", location.id, chunk[0], chunk[-1], e)
+                total_errors += len(chunk)
+                continue
 
-            current_date += timedelta(days=1)
+            for target_date, message in failures.items():
+                logger.error("Failed to sync %s %s: %s", location.id, target_date, message)
+            if debug_enabled:
+                logger.debug("Synced: %s %s to %s", location.id, chunk[0], chunk[-1])
+            total_processed += len(chunk) - len(failures)
+            total_errors += len(failures)
 
-    # 結果サマリー
-    logger.info("=" * 70)
-    logger.info("Sync completed")
-    logger.info("  Processed: %d days", total_processed)
-    logger.info("  Errors: %d", total_errors)
-    logger.info("=" * 70)
-
-    if total_errors > 0:
-        sys.exit(1)
+    return total_processed, total_errors
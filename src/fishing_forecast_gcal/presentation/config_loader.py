@@ -1,6 +1,10 @@
 """Configuration file loader."""
 
+import functools
+import json
+import os
 import pathlib
+import tempfile
 from dataclasses import dataclass
 from typing import Any
 
@@ -8,6 +12,13 @@ import yaml
 
 from fishing_forecast_gcal.domain.models.location import Location
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one if
+# PyYAML was built without libyaml.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 @dataclass(frozen=True)
 class AppSettings:
@@ -18,7 +29,7 @@ class AppSettings:
         update_interval_hours: Update interval in hours
         forecast_window_days: Forecast window in days
         tide_register_months: How many months ahead to register tide events
-        high_priority_hours: List of high priority hours (0-23)
+        high_priority_hours: High priority hours (0-23)
         google_credentials_path: Path to OAuth credentials JSON
         google_token_path: Path to OAuth token JSON
         calendar_id: Google Calendar ID
@@ -28,11 +39,30 @@ class AppSettings:
     update_interval_hours: int
     forecast_window_days: int
     tide_register_months: int
-    high_priority_hours: list[int]
+    high_priority_hours: tuple[int, ...]
     google_credentials_path: str
     google_token_path: str
     calendar_id: str
 
+    def __post_init__(self) -> None:
+        """Validate value ranges.
+
+        Raises:
+            ValueError: If a setting is out of range
+        """
+        if self.update_interval_hours < 1:
+            raise ValueError("update_interval_hours must be >= 1")
+
+        if self.forecast_window_days < 1:
+            raise ValueError("forecast_window_days must be >= 1")
+
+        if self.tide_register_months < 1:
+            raise ValueError("tide_register_months must be >= 1")
+
+        for hour in self.high_priority_hours:
+            if not (0 <= hour <= 23):
+                raise ValueError(f"high_priority_hours must be 0-23, got {hour}")
+
 
 @dataclass(frozen=True)
 class FishingConditionSettings:
@@ -41,12 +71,24 @@ class FishingConditionSettings:
     Attributes:
         prime_time_offset_hours: Prime time offset hours around high tide
         max_wind_speed_ms: Maximum wind speed threshold (m/s)
-        preferred_tide_types: Preferred tide types
+        preferred_tide_types: Preferred tide types (set for O(1) membership tests)
     """
 
     prime_time_offset_hours: int
     max_wind_speed_ms: float
-    preferred_tide_types: list[str]
+    preferred_tide_types: frozenset[str]
+
+    def __post_init__(self) -> None:
+        """Validate value ranges.
+
+        Raises:
+            ValueError: If a setting is out of range
+        """
+        if self.prime_time_offset_hours < 1:
+            raise ValueError("prime_time_offset_hours must be >= 1")
+
+        if self.max_wind_speed_ms < 0:
+            raise ValueError("max_wind_speed_ms must be >= 0")
 
 
 @dataclass(frozen=True)
@@ -68,22 +110,49 @@ class AppConfig:
 
     Attributes:
         settings: Application settings
-        locations: List of fishing locations
+        locations: Fishing locations (a tuple, since loaded configs are
+            shared between callers)
         fishing_conditions: Fishing condition settings
         tide_graph: Tide graph image settings
     """
 
     settings: AppSettings
-    locations: list[Location]
+    locations: tuple[Location, ...]
     fishing_conditions: FishingConditionSettings
     tide_graph: TideGraphSettings
 
+    @functools.cached_property
+    def location_labels(self) -> str:
+        """Comma-separated ``name (id)`` labels of all locations, built once."""
+        return ", ".join(f"{loc.name} ({loc.id})" for loc in self.locations)
+
 
-def load_config(config_path: str = "config/config.yaml") -> AppConfig:
+# Sidecar cache of the parsed YAML document (<config>.cache.json).
+# Only plain JSON data is stored; the dataclasses are rebuilt (and
+# validated) on every load, so the sidecar can never execute code.
+_CACHE_SUFFIX = ".cache.json"
+_CACHE_VERSION = 3
+
+# In-process memo of loaded configs, keyed by config path and holding
+# the (mtime_ns, size) stamp the entry was loaded for.
+_loaded_configs: dict[str, tuple[tuple[int, int], AppConfig]] = {}
+
+
+def load_config(config_path: str = "config/config.yaml", use_cache: bool = True) -> AppConfig:
     """Load configuration from YAML file.
 
+    The parsed YAML document is cached as plain JSON in a
+    ``<config_path>.cache.json`` sidecar keyed by the YAML file's mtime and
+    size, so unchanged configs skip YAML parsing on later invocations.
+    Within a process, repeated loads of an unchanged file also skip the
+    sidecar read and return the same AppConfig instance, which is
+    immutable (frozen dataclasses, tuple of locations).
+    Files referenced by the config are not checked here; call
+    :func:`validate_runtime_paths` once before using them.
+
     Args:
         config_path: Path to configuration YAML file
+        use_cache: Whether to use the in-process and sidecar caches
 
     Returns:
         AppConfig instance with validated configuration
@@ -95,15 +164,71 @@ def load_config(config_path: str = "config/config.yaml") -> AppConfig:
     """
     config_file = pathlib.Path(config_path)
 
-    if not config_file.exists():
+    try:
+        stat = config_file.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Configuration file not found: {config_path}\n"
             "Please create config/config.yaml from config/config.yaml.template"
-        )
+        ) from None
+
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cache_file = config_file.with_name(config_file.name + _CACHE_SUFFIX)
+
+    if not use_cache:
+        return _build_config(_read_config_yaml(config_file), config_path)
+
+    loaded = _loaded_configs.get(config_path)
+    if loaded is not None and loaded[0] == stamp:
+        return loaded[1]
+
+    config = _read_config_cache(cache_file, stamp)
+    if config is not None:
+        app_config = _build_config(config, config_path)
+    else:
+        config = _read_config_yaml(config_file)
+        app_config = _build_config(config, config_path)
+        _write_config_cache(cache_file, stamp, config)
+
+    _loaded_configs[config_path] = (stamp, app_config)
+    return app_config
 
+
+def clear_config_cache() -> None:
+    """Drop configs memoized in this process (the sidecar files are kept)."""
+    _loaded_configs.clear()
+
+
+def _read_config_yaml(config_file: pathlib.Path) -> Any:
+    """Read the YAML configuration file into plain Python data.
+
+    Args:
+        config_file: Path object of the configuration file
+
+    Returns:
+        Parsed YAML document (None if the file is empty)
+
+    Raises:
+        yaml.YAMLError: If config file is invalid YAML
+    """
+    # テキストストリームをそのまま渡す（bytes 化や mmap は libyaml ではかえって遅い）
     with open(config_file, encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)  # noqa: S506
+
+
+def _build_config(config: Any, config_path: str) -> AppConfig:
+    """Validate the parsed YAML document and build AppConfig.
+
+    Args:
+        config: Parsed YAML document
+        config_path: Original path string (for error messages)
 
+    Returns:
+        AppConfig instance with validated configuration
+
+    Raises:
+        ValueError: If configuration schema is invalid
+    """
     if config is None:
         raise ValueError(f"Configuration file is empty: {config_path}")
 
@@ -133,6 +258,59 @@ def load_config(config_path: str = "config/config.yaml") -> AppConfig:
     )
 
 
+def _read_config_cache(cache_file: pathlib.Path, stamp: tuple[int, int]) -> Any:
+    """Read the cached YAML document if it matches the config file stamp.
+
+    Args:
+        cache_file: Path to the sidecar cache file
+        stamp: (mtime_ns, size) of the current config file
+
+    Returns:
+        Cached YAML document, or None if missing, stale or unreadable
+    """
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            data = json.load(f)
+        version, cached_stamp, cached = data["version"], data["stamp"], data["config"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if version != _CACHE_VERSION or not isinstance(cached_stamp, list):
+        return None
+    if tuple(cached_stamp) != stamp:
+        return None
+    return cached
+
+
+def _write_config_cache(cache_file: pathlib.Path, stamp: tuple[int, int], config: Any) -> None:
+    """Atomically write the parsed YAML document to the sidecar cache.
+
+    Failures (e.g. read-only config directory, or values JSON cannot
+    represent) are ignored; the next load simply parses the YAML again.
+
+    Args:
+        cache_file: Path to the sidecar cache file
+        stamp: (mtime_ns, size) of the parsed config file
+        config: Parsed YAML document to cache
+    """
+    tmp_path: str | None = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, prefix=f".{cache_file.name}.")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": _CACHE_VERSION, "stamp": list(stamp), "config": config},
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, cache_file)
+        tmp_path = None
+    except (OSError, TypeError, ValueError):
+        pass
+    finally:
+        if tmp_path is not None:
+            pathlib.Path(tmp_path).unlink(missing_ok=True)
+
+
 def _parse_settings(settings_dict: dict[str, Any]) -> AppSettings:
     """Parse and validate settings section.
 
@@ -166,31 +344,14 @@ def _parse_settings(settings_dict: dict[str, Any]) -> AppSettings:
         update_interval_hours = int(settings_dict["update_interval_hours"])
         forecast_window_days = int(settings_dict["forecast_window_days"])
         tide_register_months = int(settings_dict["tide_register_months"])
-        high_priority_hours = [int(h) for h in settings_dict["high_priority_hours"]]
+        high_priority_hours = tuple(int(h) for h in settings_dict["high_priority_hours"])
         google_credentials_path = str(settings_dict["google_credentials_path"])
         google_token_path = str(settings_dict["google_token_path"])
         calendar_id = str(settings_dict["calendar_id"])
     except (TypeError, ValueError) as e:
         raise ValueError(f"Invalid type in settings: {e}") from e
 
-    # Range validation
-    if update_interval_hours < 1:
-        raise ValueError("update_interval_hours must be >= 1")
-
-    if forecast_window_days < 1:
-        raise ValueError("forecast_window_days must be >= 1")
-
-    if tide_register_months < 1:
-        raise ValueError("tide_register_months must be >= 1")
-
-    for hour in high_priority_hours:
-        if not (0 <= hour <= 23):
-            raise ValueError(f"high_priority_hours must be 0-23, got {hour}")
-
-    # Validate credentials path exists
-    if not pathlib.Path(google_credentials_path).exists():
-        raise ValueError(f"Google credentials file not found: {google_credentials_path}")
-
+    # Range validation is done by AppSettings.__post_init__
     return AppSettings(
         timezone=timezone,
         update_interval_hours=update_interval_hours,
@@ -203,14 +364,31 @@ def _parse_settings(settings_dict: dict[str, Any]) -> AppSettings:
     )
 
 
-def _parse_locations(locations_list: list[dict[str, Any]]) -> list[Location]:
+def validate_runtime_paths(config: AppConfig) -> None:
+    """Validate that files referenced by the configuration exist.
+
+    Kept separate from :func:`load_config` so that repeated or cached
+    loads do not stat the filesystem.
+
+    Args:
+        config: Loaded application configuration
+
+    Raises:
+        ValueError: If the Google credentials file does not exist
+    """
+    google_credentials_path = config.settings.google_credentials_path
+    if not pathlib.Path(google_credentials_path).exists():
+        raise ValueError(f"Google credentials file not found: {google_credentials_path}")
+
+
+def _parse_locations(locations_list: list[dict[str, Any]]) -> tuple[Location, ...]:
     """Parse and validate locations section.
 
     Args:
         locations_list: List of location dictionaries
 
     Returns:
-        List of Location instances
+        Tuple of Location instances
 
     Raises:
         ValueError: If locations are invalid
@@ -234,7 +412,7 @@ def _parse_locations(locations_list: list[dict[str, Any]]) -> list[Location]:
         except (TypeError, ValueError) as e:
             raise ValueError(f"Invalid value in locations[{i}]: {e}") from e
 
-    return locations
+    return tuple(locations)
 
 
 def _parse_fishing_conditions(fishing_conditions_dict: dict[str, Any]) -> FishingConditionSettings:
@@ -269,17 +447,11 @@ def _parse_fishing_conditions(fishing_conditions_dict: dict[str, Any]) -> Fishin
 
         if not isinstance(preferred_tide_types_raw, list):
             raise ValueError("preferred_tide_types must be a list")
-        preferred_tide_types = [str(t) for t in preferred_tide_types_raw]
+        preferred_tide_types = frozenset(str(t) for t in preferred_tide_types_raw)
     except (TypeError, ValueError, KeyError) as e:
         raise ValueError(f"Invalid type in fishing_conditions: {e}") from e
 
-    # Range validation
-    if prime_time_offset_hours < 1:
-        raise ValueError("prime_time_offset_hours must be >= 1")
-
-    if max_wind_speed_ms < 0:
-        raise ValueError("max_wind_speed_ms must be >= 0")
-
+    # Range validation is done by FishingConditionSettings.__post_init__
     return FishingConditionSettings(
         prime_time_offset_hours=prime_time_offset_hours,
         max_wind_speed_ms=max_wind_speed_ms,
@@ -0,0 +1,31 @@
+"""Shared fixtures for all test suites.
+
+E2E・統合テストで共有するフィクスチャを定義します。
+調和定数ディレクトリと潮汐計算アダプターをセッション全体で共有し、
+モジュールをまたいで調和定数の読み込みを 1 回にまとめます。
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter import (
+    TideCalculationAdapter,
+)
+
+# プロジェクトルートの参照
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture(scope="session")
+def harmonics_dir() -> Path:
+    """プロジェクトの調和定数ディレクトリ"""
+    return PROJECT_ROOT / "config" / "harmonics"
+
+
+@pytest.fixture(scope="session")
+def tide_adapter(harmonics_dir: Path) -> TideCalculationAdapter:
+    """実データを使用する TideCalculationAdapter（セッション内で共有）"""
+    return TideCalculationAdapter(harmonics_dir=harmonics_dir)
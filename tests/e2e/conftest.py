@@ -23,10 +23,21 @@ from fishing_forecast_gcal.domain.models.location import Location
 from fishing_forecast_gcal.infrastructure.clients.google_calendar_client import (
     GoogleCalendarClient,
 )
+from fishing_forecast_gcal.infrastructure.clients.rate_limiter import RateLimiter
+
+# libyaml があれば C 実装の Dumper を使う
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
 
 # プロジェクトルートの参照
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+# Google Calendar API のレートリミット（ユーザー単位クォータ未満に抑える）
+API_RATE_PER_SEC = 8.0
+API_BURST = 5
+
 
 def _require_env(name: str) -> str:
     """環境変数を取得し、未設定ならスキップ"""
@@ -43,7 +54,7 @@ def _require_file(path: Path, description: str) -> Path:
     return path
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def e2e_calendar_id() -> str:
     """テスト専用の Google Calendar ID を取得
 
@@ -52,7 +63,7 @@ def e2e_calendar_id() -> str:
     return _require_env("E2E_CALENDAR_ID")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def credentials_path() -> Path:
     """OAuth クライアント情報ファイルのパスを取得"""
     return _require_file(
@@ -61,7 +72,7 @@ def credentials_path() -> Path:
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def token_path() -> Path:
     """OAuth トークンファイルのパスを取得"""
     return _require_file(
@@ -70,14 +81,13 @@ def token_path() -> Path:
     )
 
 
-@pytest.fixture(scope="module")
-def harmonics_dir() -> Path:
-    """調和定数ディレクトリのパスを取得"""
-    path = PROJECT_ROOT / "config" / "harmonics"
-    return _require_file(path, "Harmonics directory")
+@pytest.fixture(scope="session")
+def harmonics_dir(harmonics_dir: Path) -> Path:
+    """調和定数ディレクトリのパスを取得（存在しなければスキップ）"""
+    return _require_file(harmonics_dir, "Harmonics directory")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def tk_harmonics(harmonics_dir: Path) -> Path:
     """東京（TK）の調和定数ファイルを取得"""
     return _require_file(harmonics_dir / "tk.pkl", "Tokyo harmonics file (tk.pkl)")
@@ -95,21 +105,26 @@ def tokyo_location() -> Location:
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def calendar_client(
     credentials_path: Path,
     token_path: Path,
 ) -> GoogleCalendarClient:
-    """認証済みの GoogleCalendarClient を返す"""
+    """認証済みの GoogleCalendarClient を返す
+
+    トークン読み込みとサービス構築はセッション全体で 1 回のみ行う。
+    API 呼び出しはトークンバケットで間隔を調整する。
+    """
     client = GoogleCalendarClient(
         credentials_path=str(credentials_path),
         token_path=str(token_path),
+        rate_limiter=RateLimiter(rate_per_sec=API_RATE_PER_SEC, burst=API_BURST),
     )
     client.authenticate()
     return client
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def temp_config_file(
     e2e_calendar_id: str,
     credentials_path: Path,
@@ -118,7 +133,7 @@ def temp_config_file(
     """テスト用の一時設定ファイルを生成
 
     E2Eテスト用に ``config.yaml`` をテンポラリファイルとして作成します。
-    テスト終了後に自動削除されます。
+    内容は全モジュール共通のため、セッションで一度だけ作成し、終了後に自動削除されます。
     """
     config = {
         "settings": {
@@ -154,7 +169,7 @@ def temp_config_file(
         prefix="e2e_config_",
         delete=False,
     ) as f:
-        yaml.dump(config, f, allow_unicode=True)
+        f.write(yaml.dump(config, Dumper=_YamlDumper, allow_unicode=True, sort_keys=False))
         config_path = Path(f.name)
 
     yield config_path
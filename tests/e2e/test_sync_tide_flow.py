@@ -18,7 +18,6 @@
 from __future__ import annotations
 
 import re
-import time
 from datetime import date, timedelta
 from pathlib import Path
 
@@ -41,13 +40,49 @@ from fishing_forecast_gcal.infrastructure.repositories.tide_data_repository impo
     TideDataRepository,
 )
 
-# Google Calendar API のレートリミット対策
-API_DELAY_SEC = 0.5
+# 満潮・干潮行の書式（HH:MM (XXXcm) 形式）
+_TIDE_PATTERN = re.compile(r"(満潮|干潮): \d{2}:\d{2} \(\d+cm\)")
 
+# 有効な潮回り名のいずれか（タイトル検証用）
+_TIDE_TYPE_PATTERN = re.compile("|".join(re.escape(t.value) for t in TideType))
+
+# テスト対象日（将来の日付を固定で使用）
+TARGET_DATE = date(2026, 6, 15)
+TARGET_DATES = (
+    TARGET_DATE,
+    TARGET_DATE + timedelta(days=1),
+    TARGET_DATE + timedelta(days=2),
+)
+
+
+@pytest.fixture(scope="module")
+def tide_repo(tide_adapter: TideCalculationAdapter, tk_harmonics: Path) -> TideDataRepository:
+    """実データを使用した TideDataRepository（アダプターはセッション共有）"""
+    return TideDataRepository(adapter=tide_adapter)
+
+
+@pytest.fixture(scope="module")
+def calendar_repo(
+    calendar_client: GoogleCalendarClient,
+    e2e_calendar_id: str,
+) -> CalendarRepository:
+    """実 API を使用した CalendarRepository"""
+    return CalendarRepository(
+        client=calendar_client,
+        calendar_id=e2e_calendar_id,
+    )
 
-def _api_delay() -> None:
-    """API 呼び出し間のレートリミット対策"""
-    time.sleep(API_DELAY_SEC)
+
+@pytest.fixture(scope="module")
+def usecase(
+    tide_repo: TideDataRepository,
+    calendar_repo: CalendarRepository,
+) -> SyncTideUseCase:
+    """実依存を使用した SyncTideUseCase"""
+    return SyncTideUseCase(
+        tide_repo=tide_repo,
+        calendar_repo=calendar_repo,
+    )
 
 
 @pytest.mark.e2e
@@ -58,46 +93,6 @@ class TestSyncTideE2E:
     SyncTideUseCase の全フローを検証します。
     """
 
-    @pytest.fixture
-    def tide_repo(self, harmonics_dir: Path, tk_harmonics: Path) -> TideDataRepository:
-        """実データを使用した TideDataRepository"""
-        adapter = TideCalculationAdapter(harmonics_dir=harmonics_dir)
-        return TideDataRepository(adapter=adapter)
-
-    @pytest.fixture
-    def calendar_repo(
-        self,
-        calendar_client: GoogleCalendarClient,
-        e2e_calendar_id: str,
-    ) -> CalendarRepository:
-        """実 API を使用した CalendarRepository"""
-        return CalendarRepository(
-            client=calendar_client,
-            calendar_id=e2e_calendar_id,
-        )
-
-    @pytest.fixture
-    def usecase(
-        self,
-        tide_repo: TideDataRepository,
-        calendar_repo: CalendarRepository,
-    ) -> SyncTideUseCase:
-        """実依存を使用した SyncTideUseCase"""
-        return SyncTideUseCase(
-            tide_repo=tide_repo,
-            calendar_repo=calendar_repo,
-        )
-
-    @pytest.fixture
-    def target_date(self) -> date:
-        """テスト対象日（将来の日付を固定で使用）"""
-        return date(2026, 6, 15)
-
-    @pytest.fixture
-    def event_id(self, tokyo_location: Location, target_date: date) -> str:
-        """テスト対象イベント ID"""
-        return CalendarEvent.generate_event_id(tokyo_location.id, target_date)
-
     @pytest.fixture(autouse=True)
     def cleanup_events(
         self,
@@ -110,26 +105,15 @@ class TestSyncTideE2E:
         テスト対象日のイベントが残存している場合に削除します。
         テスト後のクリーンアップは行わず、結果を手動確認可能にします。
         """
-        # テスト対象日の範囲を定義（target_date を含む 3 日間）
-        target_dates = [
-            date(2026, 6, 15),
-            date(2026, 6, 16),
-            date(2026, 6, 17),
-        ]
-
-        for d in target_dates:
-            event_id = CalendarEvent.generate_event_id(tokyo_location.id, d)
-            try:
-                existing = calendar_client.get_event(e2e_calendar_id, event_id)
-                if existing is not None:
-                    calendar_client.get_service().events().delete(
-                        calendarId=e2e_calendar_id,
-                        eventId=event_id,
-                    ).execute()
-                    _api_delay()
-            except Exception:
-                # 削除失敗は無視（存在しない場合を含む）
-                pass
+        # 削除を 1 回のバッチリクエストにまとめる（存在しないイベントは成功扱い）
+        # イベントIDは地点IDと日付から決定的に生成されるため、
+        # events.list で対象を探す往復は不要
+        event_ids = [CalendarEvent.generate_event_id(tokyo_location.id, d) for d in TARGET_DATES]
+        try:
+            calendar_client.delete_events(e2e_calendar_id, event_ids)
+        except Exception:
+            # 削除失敗は無視（通信エラーを含む）
+            pass
 
     # ------------------------------------------------------------------
     # テストケース
@@ -138,10 +122,7 @@ class TestSyncTideE2E:
     def test_create_tide_events(
         self,
         usecase: SyncTideUseCase,
-        calendar_repo: CalendarRepository,
         tokyo_location: Location,
-        target_date: date,
-        event_id: str,
     ) -> None:
         """基本フロー: 潮汐イベントを作成し、内容を検証する
 
@@ -152,20 +133,19 @@ class TestSyncTideE2E:
         - 満潮・干潮情報が正しいフォーマットで記載されること
         - 潮回りが有効な TideType であること
         """
-        # Act
-        usecase.execute(tokyo_location, target_date)
-        _api_delay()
+        event_id = CalendarEvent.generate_event_id(tokyo_location.id, TARGET_DATE)
+
+        # Act: 登録したイベントを戻り値で受け取る（再取得の往復を省く）
+        event = usecase.execute(tokyo_location, TARGET_DATE)
 
         # Assert: イベントが作成されたことを確認
-        event = calendar_repo.get_event(event_id)
-        assert event is not None, "イベントが作成されていません"
+        assert event.event_id == event_id, "イベントが作成されていません"
 
         # タイトルの形式検証（絵文字付き新形式）
         # 絵文字は先頭に来るため、地点名で検証
         assert "東京" in event.title, f"タイトルに地点名が含まれていません: {event.title}"
         # タイトルに有効な潮回りが含まれることを確認
-        tide_type_values = [t.value for t in TideType]
-        assert any(t in event.title for t in tide_type_values), (
+        assert _TIDE_TYPE_PATTERN.search(event.title) is not None, (
             f"タイトルに有効な潮回りが含まれていません: {event.title}"
         )
 
@@ -173,13 +153,12 @@ class TestSyncTideE2E:
         assert "[TIDE]" in event.description, "本文に [TIDE] セクションがありません"
 
         # 満潮・干潮情報の検証（HH:MM (XXXcm) 形式）
-        tide_pattern = re.compile(r"(満潮|干潮): \d{2}:\d{2} \(\d+cm\)")
-        assert tide_pattern.search(event.description), (
+        assert _TIDE_PATTERN.search(event.description), (
             f"満潮・干潮情報のフォーマットが不正:\n{event.description}"
         )
 
         # 日付の検証
-        assert event.date == target_date
+        assert event.date == TARGET_DATE
 
         # location_id の検証
         assert event.location_id == tokyo_location.id
@@ -190,37 +169,54 @@ class TestSyncTideE2E:
         calendar_repo: CalendarRepository,
         tokyo_location: Location,
     ) -> None:
-        """複数日分のイベントを連続作成する
+        """複数日分のイベントをまとめて作成する
 
         検証項目:
         - 3 日分のイベントがすべて作成されること
         - 各イベントの日付が正しいこと
         """
-        dates = [
-            date(2026, 6, 15),
-            date(2026, 6, 16),
-            date(2026, 6, 17),
-        ]
+        dates = list(TARGET_DATES)
 
-        # Act
-        for d in dates:
-            usecase.execute(tokyo_location, d)
-            _api_delay()
+        # Act: 潮汐計算・既存イベント取得・書き込みを期間単位でまとめて実行
+        failures = usecase.execute_batch(tokyo_location, dates)
 
-        # Assert
+        # Assert: 期間内のイベントを 1 回の一覧取得で検証
+        assert failures == {}, f"同期に失敗した日付があります: {failures}"
+        events = {
+            event.event_id: event
+            for event in calendar_repo.list_events(dates[0], dates[-1], tokyo_location.id)
+        }
         for d in dates:
             eid = CalendarEvent.generate_event_id(tokyo_location.id, d)
-            event = calendar_repo.get_event(eid)
+            event = events.get(eid)
             assert event is not None, f"{d} のイベントが作成されていません"
             assert event.date == d
 
+    @pytest.mark.parametrize("day", TARGET_DATES, ids=str)
+    def test_create_single_day(
+        self,
+        usecase: SyncTideUseCase,
+        tokyo_location: Location,
+        day: date,
+    ) -> None:
+        """日単位の同期: 各対象日のイベントを個別に作成する
+
+        検証項目:
+        - 日付ごとにイベントが作成されること（失敗は日付単位で報告）
+        - イベントの日付・地点が正しいこと
+        """
+        # Act
+        event = usecase.execute(tokyo_location, day)
+
+        # Assert
+        assert event.event_id == CalendarEvent.generate_event_id(tokyo_location.id, day)
+        assert event.date == day
+        assert event.location_id == tokyo_location.id
+
     def test_idempotency(
         self,
         usecase: SyncTideUseCase,
-        calendar_repo: CalendarRepository,
         tokyo_location: Location,
-        target_date: date,
-        event_id: str,
     ) -> None:
         """冪等性: 同一イベントを 2 回実行しても重複しない
 
@@ -228,19 +224,14 @@ class TestSyncTideE2E:
         - 2 回目の実行でエラーが発生しないこと
         - イベント内容が 1 回目と同一であること（[NOTES] セクション以外）
         """
-        # Act: 1 回目
-        usecase.execute(tokyo_location, target_date)
-        _api_delay()
+        event_id = CalendarEvent.generate_event_id(tokyo_location.id, TARGET_DATE)
 
-        event_first = calendar_repo.get_event(event_id)
-        assert event_first is not None
+        # Act: 1 回目
+        event_first = usecase.execute(tokyo_location, TARGET_DATE)
+        assert event_first.event_id == event_id
 
         # Act: 2 回目
-        usecase.execute(tokyo_location, target_date)
-        _api_delay()
-
-        event_second = calendar_repo.get_event(event_id)
-        assert event_second is not None
+        event_second = usecase.execute(tokyo_location, TARGET_DATE)
 
         # Assert: イベント内容が一致
         assert event_first.event_id == event_second.event_id
@@ -262,8 +253,6 @@ class TestSyncTideE2E:
         calendar_client: GoogleCalendarClient,
         e2e_calendar_id: str,
         tokyo_location: Location,
-        target_date: date,
-        event_id: str,
     ) -> None:
         """[NOTES] セクション保持: ユーザー追記が再同期後も維持される
 
@@ -271,42 +260,30 @@ class TestSyncTideE2E:
         - [NOTES] セクションに追記した内容が保持されること
         - [TIDE] セクションは正常に更新されること
         """
+        event_id = CalendarEvent.generate_event_id(tokyo_location.id, TARGET_DATE)
+
         # Arrange: 初回イベント作成
-        usecase.execute(tokyo_location, target_date)
-        _api_delay()
+        event = usecase.execute(tokyo_location, TARGET_DATE)
 
         # [NOTES] にユーザー追記をシミュレート
         user_note = "テスト用メモ: 朝マズメ狙い"
-        event = calendar_repo.get_event(event_id)
-        assert event is not None
 
         # 既存の description に [NOTES] セクションを追加/更新
-        original_description = event.description
-        if "[NOTES]" in original_description:
+        if event.extract_section("NOTES"):
             # [NOTES] セクションの内容を置換
-            updated_description = re.sub(
-                r"\[NOTES\]\n(.*?)(?=\n\[|\Z)",
-                f"[NOTES]\n- {user_note}\n",
-                original_description,
-                flags=re.DOTALL,
-            )
+            updated_description = event.update_section("NOTES", f"- {user_note}").description
         else:
-            updated_description = original_description + f"\n[NOTES]\n- {user_note}\n"
+            updated_description = event.description + f"\n[NOTES]\n- {user_note}\n"
 
-        # Google Calendar API で直接更新
-        next_day = target_date + timedelta(days=1)
-        calendar_client.update_event(
+        # Google Calendar API で description のみを部分更新
+        calendar_client.patch_event(
             calendar_id=e2e_calendar_id,
             event_id=event_id,
             description=updated_description,
-            start_date=target_date,
-            end_date=next_day,
         )
-        _api_delay()
 
         # Act: 再同期
-        usecase.execute(tokyo_location, target_date)
-        _api_delay()
+        usecase.execute(tokyo_location, TARGET_DATE)
 
         # Assert: [NOTES] が保持されていること
         updated_event = calendar_repo.get_event(event_id)
@@ -325,7 +302,7 @@ class TestSyncTideE2E:
     def test_error_handling_missing_harmonics(
         self,
         calendar_repo: CalendarRepository,
-        harmonics_dir: Path,
+        tide_adapter: TideCalculationAdapter,
     ) -> None:
         """エラーハンドリング: 調和定数が存在しない地点
 
@@ -341,8 +318,7 @@ class TestSyncTideE2E:
             longitude=139.0,
             station_id="ZZ",
         )
-        adapter = TideCalculationAdapter(harmonics_dir=harmonics_dir)
-        tide_repo = TideDataRepository(adapter=adapter)
+        tide_repo = TideDataRepository(adapter=tide_adapter)
         usecase = SyncTideUseCase(
             tide_repo=tide_repo,
             calendar_repo=calendar_repo,
@@ -26,67 +26,65 @@ from fishing_forecast_gcal.infrastructure.repositories.tide_data_repository impo
     TideDataRepository,
 )
 
+TARGET_DATE = date(2026, 2, 8)
+
+
+@pytest.fixture(scope="module")
+def repository(tide_adapter: TideCalculationAdapter) -> TideDataRepository:
+    """実リポジトリのフィクスチャ（DI注入あり）"""
+    return TideDataRepository(
+        adapter=tide_adapter,
+        tide_calc_service=TideCalculationService(),
+        tide_type_classifier=TideTypeClassifier(),
+        prime_time_finder=PrimeTimeFinder(),
+        moon_age_calculator=MoonAgeCalculator(),
+    )
+
+
+@pytest.fixture(scope="module")
+def yokosuka_location() -> Location:
+    """横須賀地点のフィクスチャ"""
+    return Location(
+        id="yokosuka",
+        name="横須賀",
+        latitude=35.28,
+        longitude=139.67,
+        station_id="TK",
+    )
+
+
+@pytest.fixture(scope="module")
+def yokosuka_tide(
+    repository: TideDataRepository,
+    yokosuka_location: Location,
+    harmonics_dir: Path,
+) -> Tide:
+    """横須賀 2026-02-08 の潮汐データ（モジュール内で1回だけ計算して共有）
+
+    Note:
+        調和定数ファイルが存在しない場合は、利用するテストごとスキップされます。
+    """
+    harmonics_file = harmonics_dir / f"{yokosuka_location.station_id.lower()}.pkl"
+    if not harmonics_file.exists():
+        pytest.skip(f"Harmonics file not found: {harmonics_file}")
+
+    return repository.get_tide_data(yokosuka_location, TARGET_DATE)
+
 
 class TestTideDataRepositoryIntegration:
     """TideDataRepository の統合テスト"""
 
-    @pytest.fixture
-    def harmonics_dir(self) -> Path:
-        """調和定数ディレクトリのフィクスチャ"""
-        return Path(__file__).parent.parent.parent.parent / "config" / "harmonics"
-
-    @pytest.fixture
-    def adapter(self, harmonics_dir: Path) -> TideCalculationAdapter:
-        """実アダプターのフィクスチャ"""
-        return TideCalculationAdapter(harmonics_dir=harmonics_dir)
-
-    @pytest.fixture
-    def repository(self, adapter: TideCalculationAdapter) -> TideDataRepository:
-        """実リポジトリのフィクスチャ（DI注入あり）"""
-        return TideDataRepository(
-            adapter=adapter,
-            tide_calc_service=TideCalculationService(),
-            tide_type_classifier=TideTypeClassifier(),
-            prime_time_finder=PrimeTimeFinder(),
-            moon_age_calculator=MoonAgeCalculator(),
-        )
-
-    @pytest.fixture
-    def yokosuka_location(self) -> Location:
-        """横須賀地点のフィクスチャ"""
-        return Location(
-            id="yokosuka",
-            name="横須賀",
-            latitude=35.28,
-            longitude=139.67,
-            station_id="TK",
-        )
-
-    def test_get_tide_data_with_real_harmonics(
-        self,
-        repository: TideDataRepository,
-        yokosuka_location: Location,
-        harmonics_dir: Path,
-    ) -> None:
+    def test_get_tide_data_with_real_harmonics(self, yokosuka_tide: Tide) -> None:
         """実データでの潮汐データ取得
 
         Note:
             調和定数ファイル（yokosuka.pkl）が存在しない場合はスキップされます。
         """
-        # Skip if harmonics file doesn't exist
-        harmonics_file = harmonics_dir / f"{yokosuka_location.station_id.lower()}.pkl"
-        if not harmonics_file.exists():
-            pytest.skip(f"Harmonics file not found: {harmonics_file}")
-
-        # Arrange
-        target_date = date(2026, 2, 8)
-
-        # Act
-        tide = repository.get_tide_data(yokosuka_location, target_date)
+        tide = yokosuka_tide
 
         # Assert
         assert isinstance(tide, Tide)
-        assert tide.date == target_date
+        assert tide.date == TARGET_DATE
         assert tide.tide_type in TideType
 
         # 潮汐イベントの検証
@@ -114,29 +112,22 @@ class TestTideDataRepositoryIntegration:
         for event in tide.events:
             assert 0 <= event.height_cm <= 500
 
-    def test_tide_prediction_has_minute_resolution(
-        self,
-        adapter: TideCalculationAdapter,
-        yokosuka_location: Location,
-        harmonics_dir: Path,
-    ) -> None:
-        """分単位の時刻が含まれることを確認"""
-        harmonics_file = harmonics_dir / f"{yokosuka_location.station_id.lower()}.pkl"
-        if not harmonics_file.exists():
-            pytest.skip(f"Harmonics file not found: {harmonics_file}")
-
-        target_date = date(2026, 2, 8)
-        tide_data = adapter.calculate_tide(yokosuka_location, target_date)
+    def test_tide_prediction_has_minute_resolution(self, yokosuka_tide: Tide) -> None:
+        """分単位の時刻が含まれることを確認
 
-        assert any(dt.minute != 0 for dt, _height in tide_data)
+        Note:
+            満干潮時刻は予測時系列から抽出されるため、時系列が毎時刻みなら
+            すべて正時になる。分単位の時刻があれば時系列も分解能を持つ。
+        """
+        assert any(event.time.minute != 0 for event in yokosuka_tide.events)
 
     def test_get_tide_data_missing_harmonics_file(
         self,
-        adapter: TideCalculationAdapter,
+        tide_adapter: TideCalculationAdapter,
     ) -> None:
         """調和定数ファイルが存在しない地点でのエラー"""
         # Arrange
-        repository = TideDataRepository(adapter=adapter)
+        repository = TideDataRepository(adapter=tide_adapter)
         unknown_location = Location(
             id="nonexistent_location",
             name="存在しない地点",
@@ -150,12 +141,7 @@ class TestTideDataRepositoryIntegration:
         with pytest.raises(FileNotFoundError):
             repository.get_tide_data(unknown_location, target_date)
 
-    def test_tide_calculation_accuracy(
-        self,
-        repository: TideDataRepository,
-        yokosuka_location: Location,
-        harmonics_dir: Path,
-    ) -> None:
+    def test_tide_calculation_accuracy(self, yokosuka_tide: Tide) -> None:
         """公式潮見表との差分検証
 
         Note:
@@ -167,16 +153,7 @@ class TestTideDataRepositoryIntegration:
             気象庁の潮見表データを取得して比較する必要があります。
             現在は潮位の妥当性のみを検証しています。
         """
-        # Skip if harmonics file doesn't exist
-        harmonics_file = harmonics_dir / f"{yokosuka_location.station_id.lower()}.pkl"
-        if not harmonics_file.exists():
-            pytest.skip(f"Harmonics file not found: {harmonics_file}")
-
-        # Arrange
-        target_date = date(2026, 2, 8)
-
-        # Act
-        tide = repository.get_tide_data(yokosuka_location, target_date)
+        tide = yokosuka_tide
 
         # Assert: 潮位の妥当性確認
         # 横須賀の典型的な潮位範囲（参考値）
@@ -7,10 +7,10 @@ JMA の推算テキストと照合し、満干潮が欠落しないことを確
 from __future__ import annotations
 
 import os
-from datetime import date, datetime, time
+from datetime import date, datetime, time, timedelta
 from pathlib import Path
-from zoneinfo import ZoneInfo
 
+import numpy as np
 import pytest
 
 from fishing_forecast_gcal.domain.models.location import Location
@@ -19,9 +19,8 @@ from fishing_forecast_gcal.domain.services.tide_calculation_service import TideC
 from fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter import (
     TideCalculationAdapter,
 )
-from tests.support.jma_suisan_parser import parse_jma_suisan_text
-
-JST = ZoneInfo("Asia/Tokyo")
+from tests.support import JST
+from tests.support.jma_suisan_parser import JMASuisanDaily, load_jma_suisan_file
 
 DEFAULT_TARGET_DATE = date(2026, 2, 18)
 DEFAULT_TOLERANCE_MINUTES = 10
@@ -29,19 +28,64 @@ BOUNDARY_LOW_TIME = time(23, 55)
 FIXTURE_STATION_ID = "TK"
 FIXTURE_TARGET_DATE = date(2024, 11, 3)
 FIXTURE_FILE = Path(__file__).resolve().parents[1] / "fixtures" / "jma_suisan_TK_2024_11_03.txt"
+FIXTURE_HARMONICS_DIR = Path("config/harmonics")
+FIXTURE_HARMONICS_FILE = FIXTURE_HARMONICS_DIR / f"{FIXTURE_STATION_ID.lower()}.pkl"
 
+# 外部 JMA データによる検証の設定（収集時に 1 回だけ解決する）
+TARGET_SUISAN_PATH = os.getenv("JMA_SUISAN_TEXT_PATH")
+TARGET_STATION_ID = os.getenv("JMA_SUISAN_STATION_ID", "TK").upper()
+TARGET_HARMONICS_DIR = Path(os.getenv("JMA_HARMONICS_DIR", "config/harmonics"))
+TARGET_HARMONICS_FILE = TARGET_HARMONICS_DIR / f"{TARGET_STATION_ID.lower()}.pkl"
 
-@pytest.mark.integration
-def test_suisan_high_low_matches_boundary_fixture() -> None:
-    """Ensure high/low tides match boundary fixture data.
 
-    境界条件の検証用フィクスチャを使い、満干潮が欠落しないことを確認します。
+def _target_skip_reason() -> str | None:
+    """Return why the external JMA data test cannot run, or None.
+
+    外部 JMA データの検証に必要な環境変数・ファイルを確認します。
     """
+    if not TARGET_SUISAN_PATH:
+        return "JMA_SUISAN_TEXT_PATH が未設定のためスキップ"
+    if not Path(TARGET_SUISAN_PATH).exists():
+        return f"指定されたファイルが存在しません: {TARGET_SUISAN_PATH}"
+    if not TARGET_HARMONICS_FILE.exists():
+        return f"調和定数ファイルが存在しません: {TARGET_HARMONICS_FILE}"
+    return None
+
+
+_TARGET_SKIP_REASON = _target_skip_reason()
+
+
+@pytest.fixture(scope="session")
+def jma_fixture_daily_map() -> dict[date, JMASuisanDaily]:
+    """境界条件フィクスチャの満干潮（セッション内で 1 回だけパース）"""
     if not FIXTURE_FILE.exists():
         pytest.fail(f"フィクスチャが存在しません: {FIXTURE_FILE}")
+    return load_jma_suisan_file(FIXTURE_FILE, FIXTURE_STATION_ID)
+
+
+@pytest.fixture(scope="session")
+def jma_target_daily_map() -> dict[date, JMASuisanDaily]:
+    """外部 JMA 推算データの満干潮（セッション内で 1 回だけパース）
+
+    収集時の skipif によりデータが揃っている場合のみ要求されます。
+    """
+    assert TARGET_SUISAN_PATH is not None
+    return load_jma_suisan_file(Path(TARGET_SUISAN_PATH), TARGET_STATION_ID)
 
-    text = FIXTURE_FILE.read_text(encoding="utf-8")
-    daily_map = parse_jma_suisan_text(text, FIXTURE_STATION_ID)
+
+@pytest.mark.integration
+@pytest.mark.skipif(
+    not FIXTURE_HARMONICS_FILE.exists(),
+    reason=f"調和定数ファイルが存在しません: {FIXTURE_HARMONICS_FILE}",
+)
+def test_suisan_high_low_matches_boundary_fixture(
+    jma_fixture_daily_map: dict[date, JMASuisanDaily],
+) -> None:
+    """Ensure high/low tides match boundary fixture data.
+
+    境界条件の検証用フィクスチャを使い、満干潮が欠落しないことを確認します。
+    """
+    daily_map = jma_fixture_daily_map
 
     if FIXTURE_TARGET_DATE not in daily_map:
         pytest.fail(f"フィクスチャに対象日が含まれていません: {FIXTURE_TARGET_DATE}")
@@ -56,11 +100,6 @@ def test_suisan_high_low_matches_boundary_fixture() -> None:
     if not any(low_time >= BOUNDARY_LOW_TIME for low_time, _height in expected.lows):
         pytest.fail("フィクスチャに境界条件(23:55以降の干潮)が含まれていません")
 
-    harmonics_dir = Path("config/harmonics")
-    harmonics_file = harmonics_dir / f"{FIXTURE_STATION_ID.lower()}.pkl"
-    if not harmonics_file.exists():
-        pytest.skip(f"調和定数ファイルが存在しません: {harmonics_file}")
-
     location = Location(
         id="jma_fixture",
         name="JMA Fixture",
@@ -68,14 +107,12 @@ def test_suisan_high_low_matches_boundary_fixture() -> None:
         longitude=139.77,
         station_id=FIXTURE_STATION_ID,
     )
-    adapter = TideCalculationAdapter(harmonics_dir)
+    adapter = TideCalculationAdapter(FIXTURE_HARMONICS_DIR)
     service = TideCalculationService()
 
     tide_data = adapter.calculate_tide(location, FIXTURE_TARGET_DATE)
     events = service.extract_high_low_tides(tide_data)
-    events_for_day = [
-        event for event in events if event.time.astimezone(JST).date() == FIXTURE_TARGET_DATE
-    ]
+    events_for_day = _events_on_date(events, FIXTURE_TARGET_DATE)
 
     highs = [event for event in events_for_day if event.event_type == "high"]
     lows = [event for event in events_for_day if event.event_type == "low"]
@@ -83,49 +120,37 @@ def test_suisan_high_low_matches_boundary_fixture() -> None:
     assert len(highs) >= 2, "満潮が2回未満です"
     assert len(lows) >= 2, "干潮が2回未満です"
 
-    for expected_time, _height in expected.highs[:2]:
-        _assert_time_match(
-            FIXTURE_TARGET_DATE,
-            expected_time,
-            highs,
-            DEFAULT_TOLERANCE_MINUTES,
-            label="満潮",
-        )
+    high_epochs = _event_epochs(highs)
+    low_epochs = _event_epochs(lows)
 
-    for expected_time, _height in expected.lows[:2]:
-        _assert_time_match(
-            FIXTURE_TARGET_DATE,
-            expected_time,
-            lows,
-            DEFAULT_TOLERANCE_MINUTES,
-            label="干潮",
-        )
+    _assert_times_match(
+        FIXTURE_TARGET_DATE,
+        [expected_time for expected_time, _height in expected.highs[:2]],
+        high_epochs,
+        DEFAULT_TOLERANCE_MINUTES,
+        label="満潮",
+    )
+    _assert_times_match(
+        FIXTURE_TARGET_DATE,
+        [expected_time for expected_time, _height in expected.lows[:2]],
+        low_epochs,
+        DEFAULT_TOLERANCE_MINUTES,
+        label="干潮",
+    )
 
 
 @pytest.mark.integration
-def test_suisan_high_low_matches_target_date() -> None:
+@pytest.mark.skipif(_TARGET_SKIP_REASON is not None, reason=_TARGET_SKIP_REASON or "")
+def test_suisan_high_low_matches_target_date(
+    jma_target_daily_map: dict[date, JMASuisanDaily],
+) -> None:
     """Ensure high/low tides match JMA suisan within tolerance.
 
     JMA 推算テキストを用いて、対象日の満干潮が欠落しないことを確認します。
     """
-    suisan_path = os.getenv("JMA_SUISAN_TEXT_PATH")
-    if not suisan_path:
-        pytest.skip("JMA_SUISAN_TEXT_PATH が未設定のためスキップ")
-
-    path = Path(suisan_path)
-    if not path.exists():
-        pytest.skip(f"指定されたファイルが存在しません: {path}")
-
-    station_id = os.getenv("JMA_SUISAN_STATION_ID", "TK").upper()
+    station_id = TARGET_STATION_ID
     tolerance = int(os.getenv("JMA_SUISAN_TOLERANCE_MIN", str(DEFAULT_TOLERANCE_MINUTES)))
-    harmonics_dir = Path(os.getenv("JMA_HARMONICS_DIR", "config/harmonics"))
-    harmonics_file = harmonics_dir / f"{station_id.lower()}.pkl"
-
-    if not harmonics_file.exists():
-        pytest.skip(f"調和定数ファイルが存在しません: {harmonics_file}")
-
-    text = path.read_text(encoding="utf-8")
-    daily_map = parse_jma_suisan_text(text, station_id)
+    daily_map = jma_target_daily_map
 
     target_date = _select_target_date(daily_map, os.getenv("JMA_SUISAN_DATE"))
     if target_date is None:
@@ -149,13 +174,13 @@ def test_suisan_high_low_matches_target_date() -> None:
         longitude=139.77,
         station_id=station_id,
     )
-    adapter = TideCalculationAdapter(harmonics_dir)
+    adapter = TideCalculationAdapter(TARGET_HARMONICS_DIR)
     service = TideCalculationService()
 
     tide_data = adapter.calculate_tide(location, target_date)
     events = service.extract_high_low_tides(tide_data)
 
-    events_for_day = [event for event in events if event.time.astimezone(JST).date() == target_date]
+    events_for_day = _events_on_date(events, target_date)
 
     highs = [event for event in events_for_day if event.event_type == "high"]
     lows = [event for event in events_for_day if event.event_type == "low"]
@@ -163,23 +188,23 @@ def test_suisan_high_low_matches_target_date() -> None:
     assert len(highs) >= 2, "満潮が2回未満です"
     assert len(lows) >= 2, "干潮が2回未満です"
 
-    for expected_time, _height in expected.highs[:2]:
-        _assert_time_match(
-            target_date,
-            expected_time,
-            highs,
-            tolerance,
-            label="満潮",
-        )
+    high_epochs = _event_epochs(highs)
+    low_epochs = _event_epochs(lows)
 
-    for expected_time, _height in expected.lows[:2]:
-        _assert_time_match(
-            target_date,
-            expected_time,
-            lows,
-            tolerance,
-            label="干潮",
-        )
+    _assert_times_match(
+        target_date,
+        [expected_time for expected_time, _height in expected.highs[:2]],
+        high_epochs,
+        tolerance,
+        label="満潮",
+    )
+    _assert_times_match(
+        target_date,
+        [expected_time for expected_time, _height in expected.lows[:2]],
+        low_epochs,
+        tolerance,
+        label="干潮",
+    )
 
 
 def _select_target_date(
@@ -213,33 +238,79 @@ def _select_target_date(
     return None
 
 
-def _assert_time_match(
+def _events_on_date(events: list[TideEvent], target_date: date) -> list[TideEvent]:
+    """Select events that fall on the target date in JST.
+
+    JST の対象日に含まれる満干潮を抽出します。
+    日の境界を 1 回だけ計算し、イベントごとのタイムゾーン変換を省きます。
+
+    Args:
+        events (list[TideEvent]): Timezone-aware tide events.
+                                  (タイムゾーン付きの満干潮)
+        target_date (date): Target date in JST.
+                            (JST の対象日)
+
+    Returns:
+        list[TideEvent]: Events within the target date.
+                         (対象日の満干潮)
+    """
+    day_start = datetime.combine(target_date, time(0, 0), tzinfo=JST)
+    day_end = day_start + timedelta(days=1)
+    return [event for event in events if day_start <= event.time < day_end]
+
+
+def _event_epochs(events: list[TideEvent]) -> np.ndarray:
+    """Convert event times to an array of epoch seconds.
+
+    満干潮の時刻を UNIX 秒の配列に変換します（照合ごとの再変換を避ける）。
+
+    Args:
+        events (list[TideEvent]): Timezone-aware tide events.
+                                  (タイムゾーン付きの満干潮)
+
+    Returns:
+        np.ndarray: Epoch seconds of each event (float64).
+                    (各イベントの UNIX 秒)
+    """
+    return np.fromiter(
+        (event.time.timestamp() for event in events), dtype=np.float64, count=len(events)
+    )
+
+
+def _assert_times_match(
     target_date: date,
-    expected_time: time,
-    events: list[TideEvent],
+    expected_times: list[time],
+    event_epochs: np.ndarray,
     tolerance_minutes: int,
     label: str,
 ) -> None:
-    """Assert that at least one event matches the expected time.
+    """Assert that every expected time has a matching event.
 
-    期待時刻に一致する満干潮が存在することを確認します。
+    各期待時刻に一致する満干潮が存在することを確認します。
+    期待時刻 × イベントの差分を 1 回のブロードキャスト演算で求めます。
 
     Args:
         target_date (date): Target date.
                             (対象日)
-        expected_time (datetime.time): Expected time in JST.
-                                       (JSTの期待時刻)
-        events (list): List of TideEvent.
-                       (TideEventのリスト)
+        expected_times (list[datetime.time]): Expected times in JST.
+                                              (JSTの期待時刻)
+        event_epochs (np.ndarray): Event times in epoch seconds.
+                                   (イベント時刻の UNIX 秒配列)
         tolerance_minutes (int): Allowed minutes difference.
                                  (許容差分)
         label (str): Label for error messages.
                      (エラーメッセージ用ラベル)
     """
-    expected_dt = datetime.combine(target_date, expected_time, tzinfo=JST)
-    min_diff = min(
-        abs((event.time.astimezone(JST) - expected_dt).total_seconds()) / 60.0 for event in events
-    )
-    assert min_diff <= tolerance_minutes, (
-        f"{label}が一致しません: expected={expected_dt.time()}, diff={min_diff:.1f}min"
+    expected_epochs = np.fromiter(
+        (
+            datetime.combine(target_date, expected_time, tzinfo=JST).timestamp()
+            for expected_time in expected_times
+        ),
+        dtype=np.float64,
+        count=len(expected_times),
     )
+    min_diffs = np.abs(event_epochs[np.newaxis, :] - expected_epochs[:, np.newaxis]).min(axis=1)
+    for expected_time, min_diff in zip(expected_times, min_diffs / 60.0, strict=True):
+        assert min_diff <= tolerance_minutes, (
+            f"{label}が一致しません: expected={expected_time}, diff={min_diff:.1f}min"
+        )
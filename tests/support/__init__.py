@@ -6,3 +6,8 @@ including parsers for external data sources (e.g., JMA tide data).
 テスト検証のための支援ユーティリティを提供します。
 外部データソース（気象庁の潮汐データなど）のパーサーを含みます。
 """
+
+from zoneinfo import ZoneInfo
+
+# テストで共通に用いる日本標準時
+JST = ZoneInfo("Asia/Tokyo")
@@ -6,6 +6,12 @@ It is used exclusively for test verification against JMA official data.
 気象庁の推算テキストをパースするテスト支援モジュール。
 JMA公式データとの検証テストでのみ使用されます。
 
+Note:
+    満干潮は JMA が算出済みの固定長カラム（80-136桁）から直接読み取り、
+    毎時潮位（0-72桁）は読み飛ばします。1年分（365行）でもパースは数 ms で、
+    ``load_jma_suisan_file`` によりプロセス内で 1 回に限られるため、
+    mmap や NumPy による一括パースは導入していません。
+
 Data Source:
     https://www.data.jma.go.jp/kaiyou/data/db/tide/suisan/index.php
     Format:
@@ -14,9 +20,11 @@ Data Source:
 
 from __future__ import annotations
 
+import functools
 import logging
 from dataclasses import dataclass
 from datetime import date, time
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +117,26 @@ def parse_jma_suisan_text(text: str, station_id: str) -> dict[date, JMASuisanDai
     return daily_map
 
 
+@functools.lru_cache(maxsize=8)
+def load_jma_suisan_file(path: Path, station_id: str) -> dict[date, JMASuisanDaily]:
+    """Read and parse a JMA suisan text file, memoized per process.
+
+    同一ファイル・地点の読み込みとパースはプロセス内で 1 回のみ行います。
+    戻り値はキャッシュと共有されるため、呼び出し側で変更しないでください。
+
+    Args:
+        path (Path): Path to the JMA suisan text file.
+                     (JMA 推算テキストファイルのパス)
+        station_id (str): Station code used for filtering.
+                          (地点記号)
+
+    Returns:
+        dict[date, JMASuisanDaily]: Mapping of date to daily entries.
+                                    (日付 -> 満干潮情報の辞書)
+    """
+    return parse_jma_suisan_text(path.read_text(encoding="utf-8"), station_id)
+
+
 def _parse_time_height_block(line: str, block_start: int) -> list[tuple[time, int]]:
     """Parse a block of time/height entries.
 
@@ -4,8 +4,10 @@ CleanupDriveImagesUseCase の単体テストです。
 GoogleDriveClient をモック化して削除ロジックを検証します。
 """
 
-from datetime import UTC, datetime
-from unittest.mock import MagicMock
+import functools
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -17,14 +19,40 @@ from fishing_forecast_gcal.infrastructure.clients.google_drive_client import (
     GoogleDriveClient,
 )
 
+# ユースケースが参照する現在時刻（壁時計に依存しないよう固定する）
+NOW = datetime(2026, 2, 18, 12, 0, tzinfo=UTC)
 
-@pytest.fixture
+# 処理対象が 1 件もない場合の結果
+EMPTY_CLEANUP_RESULT = CleanupResult(
+    total_found=0, total_expired=0, total_deleted=0, total_failed=0
+)
+
+
+@pytest.fixture(autouse=True)
+def _freeze_now() -> Iterator[None]:
+    """Pin ``datetime.now`` in the usecase module to NOW."""
+    with patch(f"{CleanupDriveImagesUseCase.__module__}.datetime", wraps=datetime) as mock_dt:
+        mock_dt.now.return_value = NOW
+        yield
+
+
+@pytest.fixture(scope="module")
 def mock_drive_client() -> MagicMock:
-    """Mock GoogleDriveClient instance."""
+    """Mock GoogleDriveClient instance shared across the module.
+
+    spec の解析はモジュールで 1 回のみ行い、状態はテストごとにリセットします。
+    spec は存在しないメソッドの呼び出しを検出するため、手書きスタブには置き換えません。
+    """
     return MagicMock(spec=GoogleDriveClient)
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_mock_drive_client(mock_drive_client: MagicMock) -> None:
+    """Reset configured results and recorded calls before each test."""
+    mock_drive_client.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
 def cleanup_usecase(mock_drive_client: MagicMock) -> CleanupDriveImagesUseCase:
     """CleanupDriveImagesUseCase instance with mock client."""
     return CleanupDriveImagesUseCase(drive_client=mock_drive_client)
@@ -53,241 +81,149 @@ def _make_file(
     }
 
 
-class TestCleanupDriveImagesUseCase:
-    """CleanupDriveImagesUseCase tests."""
+@functools.cache
+def _file_days_ago(days: int, file_id: str, name: str) -> dict[str, str]:
+    """Drive file dict created ``days`` before NOW, built once per arguments.
 
-    def test_execute_deletes_expired_files(
-        self,
-        cleanup_usecase: CleanupDriveImagesUseCase,
-        mock_drive_client: MagicMock,
-    ) -> None:
-        """Normal: deletes files exceeding retention period. (正常系: 期限超過ファイルの削除)"""
-        now = datetime.now(tz=UTC)
-
-        # 45日前と10日前のファイル。retention=30日 → 45日前のみ削除
-        old_file = _make_file(
-            "old_id",
-            "old_graph.png",
-            datetime(now.year, now.month, now.day, tzinfo=UTC).replace(
-                year=now.year, month=now.month, day=now.day
-            ),
-            # 45日前を計算
-        )
-        # datetime計算をより明確に
-        from datetime import timedelta
-
-        old_time = now - timedelta(days=45)
-        recent_time = now - timedelta(days=10)
-
-        old_file = _make_file("old_id", "old_graph.png", old_time)
-        recent_file = _make_file("recent_id", "recent_graph.png", recent_time)
-
-        mock_drive_client.get_or_create_folder.return_value = "folder_123"
-        mock_drive_client.list_files.return_value = [old_file, recent_file]
-        mock_drive_client.delete_file.return_value = True
-
-        result = cleanup_usecase.execute(
-            folder_name="fishing-forecast-tide-graphs",
-            retention_days=30,
-        )
-
-        assert result == CleanupResult(
-            total_found=2, total_expired=1, total_deleted=1, total_failed=0
-        )
-        mock_drive_client.delete_file.assert_called_once_with("old_id")
-
-    def test_execute_no_files_in_folder(
-        self,
-        cleanup_usecase: CleanupDriveImagesUseCase,
-        mock_drive_client: MagicMock,
-    ) -> None:
-        """Normal: no files to process. (正常系: フォルダが空)"""
-        mock_drive_client.get_or_create_folder.return_value = "folder_123"
-        mock_drive_client.list_files.return_value = []
-
-        result = cleanup_usecase.execute(
-            folder_name="fishing-forecast-tide-graphs",
-            retention_days=30,
-        )
-
-        assert result == CleanupResult(
-            total_found=0, total_expired=0, total_deleted=0, total_failed=0
-        )
-        mock_drive_client.delete_file.assert_not_called()
-
-    def test_execute_no_expired_files(
-        self,
-        cleanup_usecase: CleanupDriveImagesUseCase,
-        mock_drive_client: MagicMock,
-    ) -> None:
-        """Normal: all files within retention period. (正常系: 全ファイル保持期間内)"""
-        from datetime import timedelta
-
-        now = datetime.now(tz=UTC)
-        recent_file_1 = _make_file("id1", "graph1.png", now - timedelta(days=5))
-        recent_file_2 = _make_file("id2", "graph2.png", now - timedelta(days=15))
-
-        mock_drive_client.get_or_create_folder.return_value = "folder_123"
-        mock_drive_client.list_files.return_value = [recent_file_1, recent_file_2]
-
-        result = cleanup_usecase.execute(
-            folder_name="fishing-forecast-tide-graphs",
-            retention_days=30,
-        )
-
-        assert result == CleanupResult(
-            total_found=2, total_expired=0, total_deleted=0, total_failed=0
-        )
-        mock_drive_client.delete_file.assert_not_called()
-
-    def test_execute_dry_run(
-        self,
-        cleanup_usecase: CleanupDriveImagesUseCase,
-        mock_drive_client: MagicMock,
-    ) -> None:
-        """Normal: dry-run does not delete. (正常系: dry-run では削除しない)"""
-        from datetime import timedelta
-
-        now = datetime.now(tz=UTC)
-        old_file = _make_file("old_id", "old_graph.png", now - timedelta(days=45))
-
-        mock_drive_client.get_or_create_folder.return_value = "folder_123"
-        mock_drive_client.list_files.return_value = [old_file]
-
-        result = cleanup_usecase.execute(
-            folder_name="fishing-forecast-tide-graphs",
-            retention_days=30,
-            dry_run=True,
-        )
-
-        assert result == CleanupResult(
-            total_found=1, total_expired=1, total_deleted=0, total_failed=0
-        )
-        mock_drive_client.delete_file.assert_not_called()
-
-    def test_execute_delete_failure_counted(
-        self,
-        cleanup_usecase: CleanupDriveImagesUseCase,
-        mock_drive_client: MagicMock,
-    ) -> None:
-        """Error: deletion failure is counted in total_failed. (異常系: 削除失敗のカウント)"""
-        from datetime import timedelta
-
-        now = datetime.now(tz=UTC)
-        old_file_1 = _make_file("id1", "graph1.png", now - timedelta(days=45))
-        old_file_2 = _make_file("id2", "graph2.png", now - timedelta(days=60))
-
-        mock_drive_client.get_or_create_folder.return_value = "folder_123"
-        mock_drive_client.list_files.return_value = [old_file_1, old_file_2]
-        # 1件目は成功、2件目はエラー
-        mock_drive_client.delete_file.side_effect = [True, Exception("API error")]
-
-        result = cleanup_usecase.execute(
-            folder_name="fishing-forecast-tide-graphs",
-            retention_days=30,
-        )
-
-        assert result == CleanupResult(
-            total_found=2, total_expired=2, total_deleted=1, total_failed=1
-        )
-        assert mock_drive_client.delete_file.call_count == 2
-
-    def test_execute_all_files_expired(
-        self,
-        cleanup_usecase: CleanupDriveImagesUseCase,
-        mock_drive_client: MagicMock,
-    ) -> None:
-        """Normal: all files are expired and deleted. (正常系: 全ファイル期限超過で削除)"""
-        from datetime import timedelta
-
-        now = datetime.now(tz=UTC)
-        old_files = [
-            _make_file(f"id{i}", f"graph{i}.png", now - timedelta(days=40 + i)) for i in range(3)
-        ]
-
-        mock_drive_client.get_or_create_folder.return_value = "folder_123"
-        mock_drive_client.list_files.return_value = old_files
-        mock_drive_client.delete_file.return_value = True
-
-        result = cleanup_usecase.execute(
-            folder_name="fishing-forecast-tide-graphs",
-            retention_days=30,
-        )
-
-        assert result == CleanupResult(
-            total_found=3, total_expired=3, total_deleted=3, total_failed=0
-        )
-        assert mock_drive_client.delete_file.call_count == 3
-
-    def test_execute_file_already_deleted(
-        self,
-        cleanup_usecase: CleanupDriveImagesUseCase,
-        mock_drive_client: MagicMock,
-    ) -> None:
-        """Normal: file not found (404) counts as success. (正常系: 既に削除済みは成功扱い)"""
-        from datetime import timedelta
-
-        now = datetime.now(tz=UTC)
-        old_file = _make_file("old_id", "old_graph.png", now - timedelta(days=45))
-
-        mock_drive_client.get_or_create_folder.return_value = "folder_123"
-        mock_drive_client.list_files.return_value = [old_file]
-        mock_drive_client.delete_file.return_value = False  # 404 → False
-
-        result = cleanup_usecase.execute(
-            folder_name="fishing-forecast-tide-graphs",
-            retention_days=30,
-        )
-
-        assert result == CleanupResult(
-            total_found=1, total_expired=1, total_deleted=1, total_failed=0
-        )
-
-    def test_execute_file_without_created_time(
-        self,
-        cleanup_usecase: CleanupDriveImagesUseCase,
-        mock_drive_client: MagicMock,
-    ) -> None:
-        """Edge: file without createdTime is skipped. (境界: createdTimeなしファイルはスキップ)"""
-        mock_drive_client.get_or_create_folder.return_value = "folder_123"
-        mock_drive_client.list_files.return_value = [
-            {"id": "no_time_id", "name": "no_time.png", "mimeType": "image/png"}
-        ]
+    戻り値はキャッシュと共有されるため、呼び出し側で変更しないでください。
+    """
+    return _make_file(file_id, name, NOW - timedelta(days=days))
 
-        result = cleanup_usecase.execute(
-            folder_name="fishing-forecast-tide-graphs",
-            retention_days=30,
-        )
 
-        assert result == CleanupResult(
-            total_found=1, total_expired=0, total_deleted=0, total_failed=0
-        )
-        mock_drive_client.delete_file.assert_not_called()
+class TestCleanupDriveImagesUseCase:
+    """CleanupDriveImagesUseCase tests."""
 
-    def test_execute_custom_retention_days(
+    @pytest.mark.parametrize(
+        ("files", "retention_days", "dry_run", "delete_effect", "expected", "deleted_ids"),
+        [
+            # 45日前と10日前のファイル。retention=30日 → 45日前のみ削除
+            (
+                [
+                    _file_days_ago(45, "old_id", "old_graph.png"),
+                    _file_days_ago(10, "recent_id", "recent_graph.png"),
+                ],
+                30,
+                False,
+                None,
+                CleanupResult(total_found=2, total_expired=1, total_deleted=1, total_failed=0),
+                ["old_id"],
+            ),
+            # フォルダが空
+            (
+                [],
+                30,
+                False,
+                None,
+                EMPTY_CLEANUP_RESULT,
+                [],
+            ),
+            # 全ファイル保持期間内
+            (
+                [
+                    _file_days_ago(5, "id1", "graph1.png"),
+                    _file_days_ago(15, "id2", "graph2.png"),
+                ],
+                30,
+                False,
+                None,
+                CleanupResult(total_found=2, total_expired=0, total_deleted=0, total_failed=0),
+                [],
+            ),
+            # dry-run では削除しない
+            (
+                [_file_days_ago(45, "old_id", "old_graph.png")],
+                30,
+                True,
+                None,
+                CleanupResult(total_found=1, total_expired=1, total_deleted=0, total_failed=0),
+                [],
+            ),
+            # 1件目は成功、2件目はエラー → total_failed にカウント
+            (
+                [
+                    _file_days_ago(45, "id1", "graph1.png"),
+                    _file_days_ago(60, "id2", "graph2.png"),
+                ],
+                30,
+                False,
+                [True, Exception("API error")],
+                CleanupResult(total_found=2, total_expired=2, total_deleted=1, total_failed=1),
+                ["id1", "id2"],
+            ),
+            # 全ファイル期限超過で削除
+            (
+                [_file_days_ago(40 + i, f"id{i}", f"graph{i}.png") for i in range(3)],
+                30,
+                False,
+                None,
+                CleanupResult(total_found=3, total_expired=3, total_deleted=3, total_failed=0),
+                ["id0", "id1", "id2"],
+            ),
+            # 既に削除済み (404 → False) は成功扱い
+            (
+                [_file_days_ago(45, "old_id", "old_graph.png")],
+                30,
+                False,
+                [False],
+                CleanupResult(total_found=1, total_expired=1, total_deleted=1, total_failed=0),
+                ["old_id"],
+            ),
+            # createdTime なしファイルはスキップ
+            (
+                [{"id": "no_time_id", "name": "no_time.png", "mimeType": "image/png"}],
+                30,
+                False,
+                None,
+                CleanupResult(total_found=1, total_expired=0, total_deleted=0, total_failed=0),
+                [],
+            ),
+            # カスタム保持日数: retention=7日 → 8日前は削除、5日前は保持
+            (
+                [
+                    _file_days_ago(8, "id1", "graph1.png"),
+                    _file_days_ago(5, "id2", "graph2.png"),
+                ],
+                7,
+                False,
+                None,
+                CleanupResult(total_found=2, total_expired=1, total_deleted=1, total_failed=0),
+                ["id1"],
+            ),
+        ],
+        ids=[
+            "deletes_expired_files",
+            "no_files_in_folder",
+            "no_expired_files",
+            "dry_run",
+            "delete_failure_counted",
+            "all_files_expired",
+            "file_already_deleted",
+            "file_without_created_time",
+            "custom_retention_days",
+        ],
+    )
+    def test_execute(
         self,
         cleanup_usecase: CleanupDriveImagesUseCase,
         mock_drive_client: MagicMock,
+        files: list[dict[str, str]],
+        retention_days: int,
+        dry_run: bool,
+        delete_effect: list[bool | Exception] | None,
+        expected: CleanupResult,
+        deleted_ids: list[str],
     ) -> None:
-        """Normal: custom retention days respected. (正常系: カスタム保持日数)"""
-        from datetime import timedelta
-
-        now = datetime.now(tz=UTC)
-        # 8日前のファイル。retention=7日 → 削除対象
-        file_8_days = _make_file("id1", "graph1.png", now - timedelta(days=8))
-        # 5日前のファイル。retention=7日 → 保持
-        file_5_days = _make_file("id2", "graph2.png", now - timedelta(days=5))
-
+        """Counts and deletes files according to the retention period. (保持期間に基づく削除)"""
         mock_drive_client.get_or_create_folder.return_value = "folder_123"
-        mock_drive_client.list_files.return_value = [file_8_days, file_5_days]
+        mock_drive_client.list_files.return_value = files
         mock_drive_client.delete_file.return_value = True
+        mock_drive_client.delete_file.side_effect = delete_effect
 
         result = cleanup_usecase.execute(
             folder_name="fishing-forecast-tide-graphs",
-            retention_days=7,
+            retention_days=retention_days,
+            dry_run=dry_run,
         )
 
-        assert result == CleanupResult(
-            total_found=2, total_expired=1, total_deleted=1, total_failed=0
-        )
-        mock_drive_client.delete_file.assert_called_once_with("id1")
+        assert result == expected
+        assert [c.args[0] for c in mock_drive_client.delete_file.call_args_list] == deleted_ids
@@ -17,20 +17,40 @@ from fishing_forecast_gcal.domain.models.calendar_event import CalendarEvent
 from fishing_forecast_gcal.domain.models.location import Location
 from fishing_forecast_gcal.domain.repositories.calendar_repository import ICalendarRepository
 
+# 削除対象が 1 件もない場合の結果
+EMPTY_RESET_RESULT = ResetResult(total_found=0, total_deleted=0, total_failed=0)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_calendar_repo() -> MagicMock:
-    """Mock ICalendarRepository instance."""
+    """Mock ICalendarRepository instance shared across the module.
+
+    spec の解析はモジュールで 1 回のみ行い、状態はテストごとにリセットします。
+    spec は存在しないメソッドの呼び出しを検出するため、手書きスタブには置き換えません。
+    """
     return MagicMock(spec=ICalendarRepository)
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_mock_calendar_repo(mock_calendar_repo: MagicMock) -> None:
+    """Reset the shared mock before each test.
+
+    delete_events delegates to the default implementation (one delete_event per ID).
+    """
+    repo = mock_calendar_repo
+    repo.reset_mock(return_value=True, side_effect=True)
+    repo.delete_events.side_effect = lambda event_ids: ICalendarRepository.delete_events(
+        repo, event_ids
+    )
+
+
+@pytest.fixture(scope="module")
 def reset_usecase(mock_calendar_repo: MagicMock) -> ResetTideUseCase:
     """ResetTideUseCase instance with mock repository."""
     return ResetTideUseCase(calendar_repo=mock_calendar_repo)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_location() -> Location:
     """Test location fixture."""
     return Location(
@@ -42,7 +62,7 @@ def sample_location() -> Location:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_events() -> list[CalendarEvent]:
     """Test calendar events fixture."""
     return [
@@ -73,25 +93,57 @@ def sample_events() -> list[CalendarEvent]:
 class TestResetTideUseCase:
     """ResetTideUseCase tests."""
 
-    def test_execute_deletes_all_events(
+    @pytest.mark.parametrize(
+        ("delete_effect", "dry_run", "expected", "delete_calls"),
+        [
+            (
+                [True, True, True],
+                False,
+                ResetResult(total_found=3, total_deleted=3, total_failed=0),
+                3,
+            ),
+            # dry-run では削除しない
+            (None, True, ResetResult(total_found=3, total_deleted=0, total_failed=0), 0),
+            (
+                [True, RuntimeError("API Error"), True],
+                False,
+                ResetResult(total_found=3, total_deleted=2, total_failed=1),
+                3,
+            ),
+            # 既に削除済み (False) も削除済みとしてカウント（冪等）
+            (
+                [False, False, False],
+                False,
+                ResetResult(total_found=3, total_deleted=3, total_failed=0),
+                3,
+            ),
+        ],
+        ids=["deletes_all_events", "dry_run", "partial_failure", "event_already_deleted"],
+    )
+    def test_execute_found_events(
         self,
         reset_usecase: ResetTideUseCase,
         mock_calendar_repo: MagicMock,
         sample_location: Location,
         sample_events: list[CalendarEvent],
+        delete_effect: list[bool | Exception] | None,
+        dry_run: bool,
+        expected: ResetResult,
+        delete_calls: int,
     ) -> None:
-        """Normal: deletes all found events. (正常系: 全イベント削除)"""
+        """Normal: counts the outcome for every found event. (正常系: 検出イベントの削除結果)"""
         mock_calendar_repo.list_events.return_value = sample_events
-        mock_calendar_repo.delete_event.return_value = True
+        mock_calendar_repo.delete_event.side_effect = delete_effect
 
         result = reset_usecase.execute(
             location=sample_location,
             start_date=date(2026, 2, 8),
             end_date=date(2026, 2, 10),
+            dry_run=dry_run,
         )
 
-        assert result == ResetResult(total_found=3, total_deleted=3, total_failed=0)
-        assert mock_calendar_repo.delete_event.call_count == 3
+        assert result == expected
+        assert mock_calendar_repo.delete_event.call_count == delete_calls
         mock_calendar_repo.list_events.assert_called_once_with(
             date(2026, 2, 8), date(2026, 2, 10), "tk"
         )
@@ -111,44 +163,20 @@ class TestResetTideUseCase:
             end_date=date(2026, 6, 30),
         )
 
-        assert result == ResetResult(total_found=0, total_deleted=0, total_failed=0)
-        mock_calendar_repo.delete_event.assert_not_called()
-
-    def test_execute_dry_run(
-        self,
-        reset_usecase: ResetTideUseCase,
-        mock_calendar_repo: MagicMock,
-        sample_location: Location,
-        sample_events: list[CalendarEvent],
-    ) -> None:
-        """Normal: dry-run does not delete. (正常系: dry-run では削除しない)"""
-        mock_calendar_repo.list_events.return_value = sample_events
-
-        result = reset_usecase.execute(
-            location=sample_location,
-            start_date=date(2026, 2, 8),
-            end_date=date(2026, 2, 10),
-            dry_run=True,
-        )
-
-        assert result == ResetResult(total_found=3, total_deleted=0, total_failed=0)
+        assert result == EMPTY_RESET_RESULT
         mock_calendar_repo.delete_event.assert_not_called()
 
-    def test_execute_partial_failure(
+    def test_execute_deletes_in_one_batch(
         self,
         reset_usecase: ResetTideUseCase,
         mock_calendar_repo: MagicMock,
         sample_location: Location,
         sample_events: list[CalendarEvent],
     ) -> None:
-        """Normal: partial deletion failure. (正常系: 一部削除失敗)"""
+        """Normal: all events of a location are deleted in one call. (正常系: 一括削除)"""
         mock_calendar_repo.list_events.return_value = sample_events
-        # First succeeds, second fails, third succeeds
-        mock_calendar_repo.delete_event.side_effect = [
-            True,
-            RuntimeError("API Error"),
-            True,
-        ]
+        mock_calendar_repo.delete_events.side_effect = None
+        mock_calendar_repo.delete_events.return_value = {"event2": RuntimeError("API Error")}
 
         result = reset_usecase.execute(
             location=sample_location,
@@ -157,18 +185,19 @@ class TestResetTideUseCase:
         )
 
         assert result == ResetResult(total_found=3, total_deleted=2, total_failed=1)
+        mock_calendar_repo.delete_events.assert_called_once_with(["event1", "event2", "event3"])
+        mock_calendar_repo.delete_event.assert_not_called()
 
-    def test_execute_event_already_deleted(
+    def test_execute_batch_error_fails_all(
         self,
         reset_usecase: ResetTideUseCase,
         mock_calendar_repo: MagicMock,
         sample_location: Location,
         sample_events: list[CalendarEvent],
     ) -> None:
-        """Normal: already deleted events count as success. (正常系: 既削除はカウント)"""
+        """Error: a failed batch counts every event as failed. (異常系: バッチ全体の失敗)"""
         mock_calendar_repo.list_events.return_value = sample_events
-        # delete_event returns False for already-deleted events
-        mock_calendar_repo.delete_event.return_value = False
+        mock_calendar_repo.delete_events.side_effect = RuntimeError("network down")
 
         result = reset_usecase.execute(
             location=sample_location,
@@ -176,8 +205,7 @@ class TestResetTideUseCase:
             end_date=date(2026, 2, 10),
         )
 
-        # All count as deleted (idempotent)
-        assert result == ResetResult(total_found=3, total_deleted=3, total_failed=0)
+        assert result == ResetResult(total_found=3, total_deleted=0, total_failed=3)
 
 
 class TestResetResult:
@@ -4,7 +4,7 @@
 Mockリポジトリを使用して、外部依存なしにロジックを検証します。
 """
 
-from datetime import UTC, date, datetime
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -14,6 +14,19 @@ from fishing_forecast_gcal.application.usecases.sync_tide_usecase import SyncTid
 from fishing_forecast_gcal.domain.models.calendar_event import CalendarEvent
 from fishing_forecast_gcal.domain.models.location import Location
 from fishing_forecast_gcal.domain.models.tide import Tide, TideEvent, TideType
+from fishing_forecast_gcal.domain.repositories.tide_data_repository import ITideDataRepository
+
+
+def _mock_tide_repo() -> Mock:
+    """Mockの潮汐データリポジトリ
+
+    get_tide_data_range はデフォルト実装（get_tide_data を1日ずつ呼び出す）に委譲します。
+    """
+    repo = Mock()
+    repo.get_tide_data_range.side_effect = lambda location, start_date, end_date: (
+        ITideDataRepository.get_tide_data_range(repo, location, start_date, end_date)
+    )
+    return repo
 
 
 class TestSyncTideUseCase:
@@ -73,7 +86,7 @@ class TestSyncTideUseCase:
     @pytest.fixture
     def mock_tide_repo(self, tide_data: Tide, target_date: date) -> Mock:
         """Mockの潮汐データリポジトリ"""
-        repo = Mock()
+        repo = _mock_tide_repo()
 
         # 複数日分のデータを返す（前後3日分 = 計7日）
         # 対象日のみ実データ、他の日は簡易的な大潮データを返す
@@ -118,7 +131,7 @@ class TestSyncTideUseCase:
     ) -> None:
         """新規イベントが作成されることを確認"""
         # 実行
-        usecase.execute(location, target_date)
+        result = usecase.execute(location, target_date)
 
         # 検証: 潮汐データが複数日分取得されたか（前後3日 + 対象日 = 7日）
         assert mock_tide_repo.get_tide_data.call_count == 7
@@ -142,6 +155,9 @@ class TestSyncTideUseCase:
         call_args = mock_calendar_repo.upsert_event.call_args
         event: CalendarEvent = call_args[0][0]
 
+        # 検証: 登録したイベントがそのまま返されること
+        assert result is event
+
         assert event.event_id == expected_event_id
         assert event.title == "🔴東京湾 (大潮)"  # 絵文字付き新形式
         assert event.date == target_date
@@ -398,7 +414,7 @@ class TestSyncTideUseCase:
         target_date = date(2026, 2, 10)
 
         # Mockリポジトリを手動設定
-        mock_tide_repo = Mock()
+        mock_tide_repo = _mock_tide_repo()
 
         def get_tide_data_side_effect(location: Location, d: date) -> Tide:
             # 2/9-2/11は大潮、他は中潮
@@ -452,7 +468,7 @@ class TestSyncTideUseCase:
         target_date = date(2026, 2, 9)
 
         # Mockリポジトリを手動設定
-        mock_tide_repo = Mock()
+        mock_tide_repo = _mock_tide_repo()
 
         def get_tide_data_side_effect(location: Location, d: date) -> Tide:
             # 2/9-2/11は大潮、他は中潮
@@ -506,7 +522,7 @@ class TestSyncTideUseCase:
         target_date = date(2026, 2, 10)
 
         # Mockリポジトリを手動設定
-        mock_tide_repo = Mock()
+        mock_tide_repo = _mock_tide_repo()
 
         def get_tide_data_side_effect(location: Location, d: date) -> Tide:
             # 2/9-2/11は中潮、他は小潮
@@ -550,6 +566,166 @@ class TestSyncTideUseCase:
         assert "⭐ 中央日" not in event.description
         assert "[TIDE]" in event.description
 
+    def test_get_date_range_spans_window(self) -> None:
+        """前後の日数を含む昇順の日付リストを返す（月跨ぎを含む）"""
+        result = SyncTideUseCase._get_date_range(date(2026, 3, 1), days_before=3, days_after=2)
+
+        assert result == [
+            date(2026, 2, 26),
+            date(2026, 2, 27),
+            date(2026, 2, 28),
+            date(2026, 3, 1),
+            date(2026, 3, 2),
+            date(2026, 3, 3),
+        ]
+
+
+class TestSyncTideUseCaseBatch:
+    """SyncTideUseCase.execute_batch のテスト"""
+
+    @pytest.fixture
+    def location(self) -> Location:
+        """テスト用の地点データ"""
+        return Location(
+            id="tokyo",
+            name="東京湾",
+            latitude=35.6762,
+            longitude=139.6503,
+            station_id="TK",
+        )
+
+    @pytest.fixture
+    def dates(self) -> list[date]:
+        """テスト用の対象日（2日分）"""
+        return [date(2026, 2, 10), date(2026, 2, 11)]
+
+    @pytest.fixture
+    def mock_tide_repo(self) -> Mock:
+        """Mockの潮汐データリポジトリ（全日付で大潮を返す）"""
+        repo = _mock_tide_repo()
+
+        def get_tide_data_side_effect(location: Location, d: date) -> Tide:
+            return Tide(
+                date=d,
+                tide_type=TideType.SPRING,
+                events=[
+                    TideEvent(
+                        time=datetime(d.year, d.month, d.day, 6, 0, tzinfo=UTC),
+                        height_cm=160.0,
+                        event_type="high",
+                    ),
+                ],
+            )
+
+        repo.get_tide_data.side_effect = get_tide_data_side_effect
+        return repo
+
+    @pytest.fixture
+    def mock_calendar_repo(self) -> Mock:
+        """Mockのカレンダーリポジトリ"""
+        repo = Mock()
+        repo.list_events.return_value = []
+        repo.upsert_events.return_value = {}
+        return repo
+
+    @pytest.fixture
+    def usecase(self, mock_tide_repo: Mock, mock_calendar_repo: Mock) -> SyncTideUseCase:
+        """テスト対象のユースケース"""
+        return SyncTideUseCase(tide_repo=mock_tide_repo, calendar_repo=mock_calendar_repo)
+
+    def test_execute_batch_fetches_each_day_once(
+        self,
+        usecase: SyncTideUseCase,
+        mock_tide_repo: Mock,
+        mock_calendar_repo: Mock,
+        location: Location,
+        dates: list[date],
+    ) -> None:
+        """潮汐データは前後3日を含む期間で各日1回だけ取得されること"""
+        failures = usecase.execute_batch(location, dates)
+
+        assert failures == {}
+        fetched = [c.args[1] for c in mock_tide_repo.get_tide_data.call_args_list]
+        assert fetched == [date(2026, 2, d) for d in range(7, 15)]
+        mock_calendar_repo.list_events.assert_called_once_with(
+            date(2026, 2, 10), date(2026, 2, 11), "tokyo"
+        )
+        mock_calendar_repo.get_event.assert_not_called()
+        mock_calendar_repo.upsert_event.assert_not_called()
+
+        events: list[CalendarEvent] = mock_calendar_repo.upsert_events.call_args.args[0]
+        assert [e.date for e in events] == dates
+        assert events[0].event_id == CalendarEvent.generate_event_id("tokyo", dates[0])
+
+    def test_execute_batch_preserves_notes_of_existing_events(
+        self,
+        usecase: SyncTideUseCase,
+        mock_calendar_repo: Mock,
+        location: Location,
+        dates: list[date],
+    ) -> None:
+        """既存イベントの[NOTES]を保持し、既存イベントを upsert_events に渡すこと"""
+        existing = CalendarEvent(
+            event_id=CalendarEvent.generate_event_id(location.id, dates[1]),
+            title="🟠東京湾 (中潮)",
+            description="[TIDE]\n古いデータ\n\n[NOTES]\nユーザーメモ",
+            date=dates[1],
+            location_id=location.id,
+        )
+        mock_calendar_repo.list_events.return_value = [existing]
+
+        usecase.execute_batch(location, dates)
+
+        call = mock_calendar_repo.upsert_events.call_args
+        events: list[CalendarEvent] = call.args[0]
+        assert "ユーザーメモ" in events[1].description
+        assert "ユーザーメモ" not in events[0].description
+        assert call.kwargs["existing"] == {existing.event_id: existing}
+
+    def test_execute_batch_reports_failures_by_date(
+        self,
+        usecase: SyncTideUseCase,
+        mock_tide_repo: Mock,
+        mock_calendar_repo: Mock,
+        location: Location,
+        dates: list[date],
+    ) -> None:
+        """潮汐取得・書き込みの失敗が日付ごとに返されること"""
+        original = mock_tide_repo.get_tide_data.side_effect
+
+        def get_tide_data_side_effect(loc: Location, d: date) -> Tide:
+            if d == dates[0]:
+                raise RuntimeError("tide error")
+            return original(loc, d)
+
+        mock_tide_repo.get_tide_data.side_effect = get_tide_data_side_effect
+        upsert_error = RuntimeError("API error")
+        mock_calendar_repo.upsert_events.return_value = {
+            CalendarEvent.generate_event_id(location.id, dates[1]): upsert_error
+        }
+
+        failures = usecase.execute_batch(location, dates)
+
+        assert set(failures) == set(dates)
+        assert failures[dates[1]] is upsert_error
+        events: list[CalendarEvent] = mock_calendar_repo.upsert_events.call_args.args[0]
+        assert [e.date for e in events] == [dates[1]]
+
+    def test_execute_batch_raises_when_listing_fails(
+        self,
+        usecase: SyncTideUseCase,
+        mock_calendar_repo: Mock,
+        location: Location,
+        dates: list[date],
+    ) -> None:
+        """既存イベントの取得に失敗した場合は RuntimeError を送出すること"""
+        mock_calendar_repo.list_events.side_effect = RuntimeError("API error")
+
+        with pytest.raises(RuntimeError, match="Failed to sync tide"):
+            usecase.execute_batch(location, dates)
+
+        mock_calendar_repo.upsert_events.assert_not_called()
+
 
 class TestSyncTideUseCaseTideGraph:
     """タイドグラフ画像の生成・アップロード統合テスト"""
@@ -596,7 +772,7 @@ class TestSyncTideUseCaseTideGraph:
     @pytest.fixture
     def mock_tide_repo(self, tide_data: Tide, target_date: date) -> Mock:
         """Mockの潮汐データリポジトリ"""
-        repo = Mock()
+        repo = _mock_tide_repo()
 
         def get_tide_data_side_effect(location: Location, d: date) -> Tide:
             if d == target_date:
@@ -650,6 +826,98 @@ class TestSyncTideUseCaseTideGraph:
         }
         return client
 
+    def test_execute_batch_passes_each_days_events_to_graph(
+        self,
+        mock_tide_repo: Mock,
+        mock_calendar_repo: Mock,
+        mock_tide_graph_service: Mock,
+        mock_drive_client: Mock,
+        location: Location,
+        target_date: date,
+        tide_data: Tide,
+    ) -> None:
+        """一括同期時、各日のグラフにはその日の潮汐イベントのみが渡される"""
+        mock_calendar_repo.list_events.return_value = []
+        mock_calendar_repo.upsert_events.return_value = {}
+        usecase = SyncTideUseCase(
+            tide_repo=mock_tide_repo,
+            calendar_repo=mock_calendar_repo,
+            tide_graph_service=mock_tide_graph_service,
+            drive_client=mock_drive_client,
+        )
+        next_date = date(2026, 2, 11)
+
+        usecase.execute_batch(location, [target_date, next_date])
+
+        # グラフ生成はスレッドで並行するため、呼び出し順ではなく対象日で照合する
+        calls = {
+            c.kwargs["target_date"]: c.kwargs
+            for c in mock_tide_graph_service.generate_graph.call_args_list
+        }
+        assert set(calls) == {target_date, next_date}
+        assert calls[target_date]["tide_events"] == tide_data.events
+        assert [e.time.date() for e in calls[next_date]["tide_events"]] == [next_date]
+        attachments = mock_calendar_repo.upsert_events.call_args.kwargs["attachments"]
+        assert set(attachments) == {
+            CalendarEvent.generate_event_id(location.id, d) for d in (target_date, next_date)
+        }
+
+    def test_execute_batch_resolves_drive_folder_once(
+        self,
+        mock_tide_repo: Mock,
+        mock_calendar_repo: Mock,
+        mock_tide_graph_service: Mock,
+        mock_drive_client: Mock,
+        location: Location,
+        target_date: date,
+    ) -> None:
+        """一括同期時、Drive フォルダは1回だけ取得し、各日の画像をアップロードする"""
+        mock_calendar_repo.list_events.return_value = []
+        mock_calendar_repo.upsert_events.return_value = {}
+        usecase = SyncTideUseCase(
+            tide_repo=mock_tide_repo,
+            calendar_repo=mock_calendar_repo,
+            tide_graph_service=mock_tide_graph_service,
+            drive_client=mock_drive_client,
+            drive_folder_name="test-folder",
+        )
+        dates = [target_date + timedelta(days=i) for i in range(5)]
+
+        usecase.execute_batch(location, dates)
+
+        mock_drive_client.get_or_create_folder.assert_called_once_with("test-folder")
+        upload_calls = mock_drive_client.upload_or_update_file.call_args_list
+        assert len(upload_calls) == 5
+        assert {c.kwargs["folder_id"] for c in upload_calls} == {"folder-id-123"}
+        attachments = mock_calendar_repo.upsert_events.call_args.kwargs["attachments"]
+        assert len(attachments) == 5
+
+    def test_execute_batch_folder_failure_continues_without_attachments(
+        self,
+        mock_tide_repo: Mock,
+        mock_calendar_repo: Mock,
+        mock_tide_graph_service: Mock,
+        mock_drive_client: Mock,
+        location: Location,
+        target_date: date,
+    ) -> None:
+        """Drive フォルダ取得に失敗しても、attachments なしで一括登録は継続される"""
+        mock_calendar_repo.list_events.return_value = []
+        mock_calendar_repo.upsert_events.return_value = {}
+        mock_drive_client.get_or_create_folder.side_effect = RuntimeError("Network error")
+        usecase = SyncTideUseCase(
+            tide_repo=mock_tide_repo,
+            calendar_repo=mock_calendar_repo,
+            tide_graph_service=mock_tide_graph_service,
+            drive_client=mock_drive_client,
+        )
+
+        failures = usecase.execute_batch(location, [target_date])
+
+        assert failures == {}
+        mock_tide_graph_service.generate_graph.assert_not_called()
+        assert mock_calendar_repo.upsert_events.call_args.kwargs["attachments"] == {}
+
     def test_graph_enabled_generates_and_uploads(
         self,
         mock_tide_repo: Mock,
@@ -261,6 +261,22 @@ class TestCalendarEvent:
         assert "[TIDE]" in updated_event.description
         assert "[NOTES]" in updated_event.description
 
+    def test_update_section_keeps_trailing_newline_and_literal_content(self) -> None:
+        """末尾の改行を保持し、内容はそのまま（エスケープ解釈なし）で置換されること"""
+        event = CalendarEvent(
+            event_id="test_event_123",
+            title="🔴東京湾 (大潮)",
+            description="[TIDE]\n- 満潮: 06:12 (162cm)\n\n[NOTES]\nメモ\n",
+            date=date(2026, 2, 8),
+            location_id="tokyo_bay",
+        )
+
+        updated_event = event.update_section("NOTES", r"- C:\data\1")
+
+        assert updated_event.description == (
+            "[TIDE]\n- 満潮: 06:12 (162cm)\n\n[NOTES]\n- C:\\data\\1\n"
+        )
+
     def test_update_section_non_existent_raises_error(self) -> None:
         """存在しないセクションを更新しようとするとエラーが発生すること"""
         description = """[TIDE]
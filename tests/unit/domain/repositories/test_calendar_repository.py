@@ -196,3 +196,118 @@ class TestICalendarRepositoryMock:
         assert retrieved is not None
         assert retrieved.title == "🟠東京湾 (中潮)"
         assert "07:30" in retrieved.description
+
+
+class TestICalendarRepositoryUpsertEvents:
+    """upsert_events のデフォルト実装をテスト"""
+
+    def test_default_upsert_events_delegates_to_upsert_event(self) -> None:
+        """upsert_event を1件ずつ呼び出し、失敗したIDだけを返すことを確認"""
+
+        class RecordingRepository(ICalendarRepository):
+            """呼び出しを記録するテスト用実装"""
+
+            def __init__(self) -> None:
+                self.calls: list[tuple[str, CalendarEvent | None, object]] = []
+
+            @override
+            def get_event(self, event_id: str) -> CalendarEvent | None:
+                return None
+
+            @override
+            def upsert_event(
+                self,
+                event: CalendarEvent,
+                *,
+                existing: CalendarEvent | None = None,
+                attachments: list[dict[str, str]] | None = None,
+            ) -> None:
+                if event.event_id == "event_002":
+                    raise RuntimeError("API error")
+                self.calls.append((event.event_id, existing, attachments))
+
+            @override
+            def list_events(
+                self, start_date: date, end_date: date, location_id: str
+            ) -> list[CalendarEvent]:
+                return []
+
+            @override
+            def delete_event(self, event_id: str) -> bool:
+                return False
+
+        event1 = CalendarEvent(
+            event_id="event_001",
+            title="🔴東京湾 (大潮)",
+            description="[TIDE]",
+            date=date(2026, 2, 8),
+            location_id="tokyo_bay",
+        )
+        event2 = CalendarEvent(
+            event_id="event_002",
+            title="🟠東京湾 (中潮)",
+            description="[TIDE]",
+            date=date(2026, 2, 9),
+            location_id="tokyo_bay",
+        )
+        attachments = [{"fileUrl": "https://example.com/a.png", "title": "a.png"}]
+        repository = RecordingRepository()
+
+        failures = repository.upsert_events(
+            [event1, event2],
+            existing={"event_001": event1},
+            attachments={"event_001": attachments},
+        )
+
+        assert repository.calls == [("event_001", event1, attachments)]
+        assert list(failures) == ["event_002"]
+        assert isinstance(failures["event_002"], RuntimeError)
+
+
+class TestICalendarRepositoryDeleteEvents:
+    """delete_events のデフォルト実装をテスト"""
+
+    def test_default_delete_events_delegates_to_delete_event(self) -> None:
+        """delete_event を1件ずつ呼び出し、失敗したIDだけを返すことを確認"""
+
+        class RecordingRepository(ICalendarRepository):
+            """呼び出しを記録するテスト用実装"""
+
+            def __init__(self) -> None:
+                self.deleted: list[str] = []
+
+            @override
+            def get_event(self, event_id: str) -> CalendarEvent | None:
+                return None
+
+            @override
+            def upsert_event(
+                self,
+                event: CalendarEvent,
+                *,
+                existing: CalendarEvent | None = None,
+                attachments: list[dict[str, str]] | None = None,
+            ) -> None:
+                pass
+
+            @override
+            def list_events(
+                self, start_date: date, end_date: date, location_id: str
+            ) -> list[CalendarEvent]:
+                return []
+
+            @override
+            def delete_event(self, event_id: str) -> bool:
+                if event_id == "event_002":
+                    raise RuntimeError("API error")
+                self.deleted.append(event_id)
+                # event_003 は既に削除済み（冪等）
+                return event_id != "event_003"
+
+        repository = RecordingRepository()
+
+        failures = repository.delete_events(["event_001", "event_002", "event_003"])
+
+        assert repository.deleted == ["event_001", "event_003"]
+        assert list(failures) == ["event_002"]
+        assert isinstance(failures["event_002"], RuntimeError)
@@ -93,3 +93,46 @@ class TestITideDataRepositoryMock:
         assert tide.events[0].height_cm == 162.0
         assert tide.events[1].event_type == "low"
         assert tide.events[1].height_cm == 58.0
+
+
+class TestITideDataRepositoryRange:
+    """get_tide_data_range のデフォルト実装をテスト"""
+
+    def test_default_range_calls_get_tide_data_per_day(self) -> None:
+        """1日ずつ get_tide_data を呼び出し、失敗した日は例外として返すことを確認"""
+
+        class DailyRepository(ITideDataRepository):
+            """日単位でのみ取得できるテスト用実装"""
+
+            @override
+            def get_tide_data(self, location: Location, target_date: date) -> Tide:
+                if target_date == date(2026, 2, 9):
+                    raise RuntimeError("calculation failed")
+                return Tide(
+                    date=target_date,
+                    tide_type=TideType.SPRING,
+                    events=[
+                        TideEvent(
+                            time=datetime(2026, 2, target_date.day, 6, 0, tzinfo=UTC),
+                            height_cm=160.0,
+                            event_type="high",
+                        )
+                    ],
+                )
+
+            @override
+            def get_hourly_heights(
+                self, location: Location, target_date: date
+            ) -> list[tuple[float, float]]:
+                return []
+
+        location = Location(
+            id="tokyo_bay", name="東京湾", latitude=35.6, longitude=139.8, station_id="TK"
+        )
+
+        tides, errors = DailyRepository().get_tide_data_range(
+            location, date(2026, 2, 8), date(2026, 2, 10)
+        )
+
+        assert list(tides) == [date(2026, 2, 8), date(2026, 2, 10)]
+        assert list(errors) == [date(2026, 2, 9)]
@@ -267,6 +267,25 @@ class TestTideCalculationService:
         assert result[1].time == base_time.replace(hour=9)
         assert result[1].event_type == "low"
 
+    def test_extract_high_low_tides_ignores_plateaus_at_edges(self) -> None:
+        """Ignore plateaus touching the start or end of the data.
+
+        データ両端に接するフラット区間は極値として扱わないことを確認します。
+        """
+        # Arrange: 先頭と末尾がフラットで、途中に満潮が 1 回あるケース
+        base_time = datetime(2026, 2, 8, 0, 0, 0, tzinfo=UTC)
+        heights = [100.0, 100.0, 120.0, 150.0, 120.0, 90.0, 90.0, 90.0]
+        data = [(base_time + timedelta(hours=i), h) for i, h in enumerate(heights)]
+        service = TideCalculationService()
+
+        # Act
+        result = service.extract_high_low_tides(data)
+
+        # Assert: 途中の満潮のみが抽出されること
+        assert len(result) == 1
+        assert result[0].time == base_time.replace(hour=3)
+        assert result[0].event_type == "high"
+
     def test_extract_high_low_tides_detects_end_boundary_low(self) -> None:
         """Detect a low tide near the day boundary.
 
@@ -4,6 +4,7 @@ import pickle
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
 import numpy as np
@@ -16,8 +17,7 @@ from fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter impo
     TideCalculationAdapter,
     generate_harmonics,
 )
-
-JST = ZoneInfo("Asia/Tokyo")
+from tests.support import JST
 
 
 def _create_sample_coefficients(
@@ -259,6 +259,62 @@ class TestCalculateTide:
             adapter.calculate_tide(unknown_location, date(2026, 2, 8))
 
 
+class TestCalculateTideRange:
+    """TideCalculationAdapter.calculate_tide_range のテスト."""
+
+    def test_range_matches_single_day_predictions(
+        self,
+        harmonics_dir: Path,
+        tokyo_bay_location: Location,
+    ) -> None:
+        """期間一括の予測結果が日ごとの calculate_tide と一致すること."""
+        adapter = TideCalculationAdapter(harmonics_dir)
+
+        result = adapter.calculate_tide_range(
+            tokyo_bay_location, date(2026, 2, 8), date(2026, 2, 10)
+        )
+
+        assert list(result) == [date(2026, 2, 8), date(2026, 2, 9), date(2026, 2, 10)]
+        for target_date, series in result.items():
+            single = adapter.calculate_tide(tokyo_bay_location, target_date)
+            assert [t for t, _ in series] == [t for t, _ in single]
+            np.testing.assert_allclose([h for _, h in series], [h for _, h in single], atol=1e-3)
+
+    def test_passes_utc_datetime64_to_reconstruct(
+        self,
+        harmonics_dir: Path,
+        tokyo_bay_location: Location,
+    ) -> None:
+        """UTide には UTC の datetime64 配列を 1 回で渡すこと."""
+        adapter = TideCalculationAdapter(harmonics_dir)
+        module = "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter"
+
+        with patch(f"{module}.utide.reconstruct", wraps=utide.reconstruct) as mock_reconstruct:
+            result = adapter.calculate_tide_range(
+                tokyo_bay_location, date(2026, 2, 8), date(2026, 2, 9)
+            )
+
+        mock_reconstruct.assert_called_once()
+        times = mock_reconstruct.call_args.args[0]
+        assert times.dtype.kind == "M"
+        first_time = result[date(2026, 2, 8)][0][0]
+        assert times[0] == np.datetime64(
+            first_time.astimezone(ZoneInfo("UTC")).replace(tzinfo=None)
+        )
+        assert mock_reconstruct.call_args.kwargs["verbose"] is False
+
+    def test_range_end_before_start_raises(
+        self,
+        harmonics_dir: Path,
+        tokyo_bay_location: Location,
+    ) -> None:
+        """終了日が開始日より前の場合 ValueError が発生すること."""
+        adapter = TideCalculationAdapter(harmonics_dir)
+
+        with pytest.raises(ValueError, match="終了日が開始日より前です"):
+            adapter.calculate_tide_range(tokyo_bay_location, date(2026, 2, 9), date(2026, 2, 8))
+
+
 class TestCoefficientsCache:
     """調和定数キャッシュのテスト."""
 
@@ -280,6 +336,34 @@ class TestCoefficientsCache:
         expected_points = (24 * 60) // adapter.PREDICTION_INTERVAL_MINUTES + 2
         assert len(result) == expected_points
 
+    def test_prepare_loads_coefficients_once(
+        self,
+        harmonics_dir: Path,
+        tokyo_bay_location: Location,
+    ) -> None:
+        """prepare で事前に読み込んだ調和定数が以降の予測で再利用されること."""
+        adapter = TideCalculationAdapter(harmonics_dir)
+        adapter.prepare(tokyo_bay_location)
+        assert "tokyo_bay" in adapter._coef_cache  # noqa: SLF001
+
+        (harmonics_dir / "tokyo_bay.pkl").unlink()
+        result = adapter.calculate_tide(tokyo_bay_location, date(2026, 2, 8))
+        assert len(result) > 0
+
+    def test_prepare_missing_file_raises(self, harmonics_dir: Path) -> None:
+        """prepare で調和定数ファイルの欠落が検出されること."""
+        adapter = TideCalculationAdapter(harmonics_dir)
+        unknown_location = Location(
+            id="unknown",
+            name="不明",
+            latitude=35.0,
+            longitude=139.0,
+            station_id="unknown",
+        )
+
+        with pytest.raises(FileNotFoundError, match="調和定数ファイルが見つかりません"):
+            adapter.prepare(unknown_location)
+
     def test_clear_cache(
         self,
         harmonics_dir: Path,
@@ -293,6 +377,59 @@ class TestCoefficientsCache:
         adapter.clear_cache()
         assert len(adapter._coef_cache) == 0  # noqa: SLF001
 
+    def test_adapters_share_process_cache(
+        self,
+        harmonics_dir: Path,
+        tokyo_bay_location: Location,
+    ) -> None:
+        """同じプロセスの別アダプターは pickle を読み直さないこと."""
+        TideCalculationAdapter(harmonics_dir).prepare(tokyo_bay_location)
+
+        with patch(
+            "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter.pickle.load",
+            side_effect=AssertionError("pickle should not be loaded again"),
+        ):
+            second = TideCalculationAdapter(harmonics_dir)
+            second.prepare(tokyo_bay_location)
+
+        assert "tokyo_bay" in second._coef_cache  # noqa: SLF001
+
+    def test_process_cache_reloads_updated_file(
+        self,
+        harmonics_dir: Path,
+        tokyo_bay_location: Location,
+        sample_coef: dict[str, Any],
+    ) -> None:
+        """ファイルが更新された場合は別アダプターで読み直すこと."""
+        TideCalculationAdapter(harmonics_dir).prepare(tokyo_bay_location)
+
+        updated = dict(sample_coef, marker="updated")
+        with open(harmonics_dir / "tokyo_bay.pkl", "wb") as f:
+            pickle.dump(updated, f)
+
+        second = TideCalculationAdapter(harmonics_dir)
+        second.prepare(tokyo_bay_location)
+
+        assert second._coef_cache["tokyo_bay"]["marker"] == "updated"  # noqa: SLF001
+
+    def test_clear_cache_drops_process_cache(
+        self,
+        harmonics_dir: Path,
+        tokyo_bay_location: Location,
+    ) -> None:
+        """clear_cache 後は別アダプターでもファイルから読み直すこと."""
+        adapter = TideCalculationAdapter(harmonics_dir)
+        adapter.prepare(tokyo_bay_location)
+        adapter.clear_cache()
+
+        with patch(
+            "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter.pickle.load",
+            wraps=pickle.load,
+        ) as mock_load:
+            TideCalculationAdapter(harmonics_dir).prepare(tokyo_bay_location)
+
+        mock_load.assert_called_once()
+
 
 class TestLoadCoefficientsValidation:
     """調和定数ファイルのバリデーションテスト."""
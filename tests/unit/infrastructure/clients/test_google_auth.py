@@ -7,6 +7,7 @@
 
 import json
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -14,13 +15,24 @@ import pytest
 from google.auth.exceptions import RefreshError
 
 from fishing_forecast_gcal.infrastructure.clients.google_auth import (
+    HTTP_TIMEOUT_SECONDS,
     SCOPES,
     authenticate,
+    authorized_http,
+    clear_credentials_cache,
 )
 
 _AUTH_MODULE = "fishing_forecast_gcal.infrastructure.clients.google_auth"
 
 
+@pytest.fixture(autouse=True)
+def _clear_credentials_cache() -> Iterator[None]:
+    """テスト間でプロセス内の認証キャッシュを共有しない."""
+    clear_credentials_cache()
+    yield
+    clear_credentials_cache()
+
+
 class TestScopes:
     """SCOPES 定数のテスト"""
 
@@ -116,6 +128,31 @@ class TestAuthenticate:
             assert mock_token_path.exists()
             assert mock_token_path.read_text() == '{"token": "refreshed"}'
 
+    def test_failed_token_write_keeps_previous_token(
+        self, mock_credentials_path: Path, mock_token_path: Path
+    ) -> None:
+        """書き込みに失敗しても既存トークンは壊れず、一時ファイルも残らない."""
+        original = json.dumps({"token": "mock", "refresh_token": "mock_refresh"})
+        mock_token_path.write_text(original)
+
+        with (
+            patch(f"{_AUTH_MODULE}.Credentials") as mock_creds_cls,
+            patch(f"{_AUTH_MODULE}.Request"),
+        ):
+            mock_creds = MagicMock()
+            mock_creds.valid = False
+            mock_creds.expired = True
+            mock_creds.refresh_token = "mock_refresh"
+            mock_creds.to_json.side_effect = OSError("disk full")
+            mock_creds_cls.from_authorized_user_file.return_value = mock_creds
+
+            with pytest.raises(OSError, match="disk full"):
+                authenticate(str(mock_credentials_path), str(mock_token_path))
+
+        assert mock_token_path.read_text() == original
+        leftovers = mock_token_path.parent.glob(f".{mock_token_path.name}.*")
+        assert list(leftovers) == []
+
     def test_authenticate_new_oauth_flow(
         self, mock_credentials_path: Path, mock_token_path: Path
     ) -> None:
@@ -172,6 +209,111 @@ class TestAuthenticate:
             assert nested_token_path.exists()
 
 
+class TestCredentialsCache:
+    """プロセス内認証キャッシュのテスト"""
+
+    @pytest.fixture
+    def token_path(self, tmp_path: Path) -> Path:
+        """既存トークンのフィクスチャ."""
+        path = tmp_path / "token.json"
+        path.write_text(json.dumps({"token": "mock", "refresh_token": "mock_refresh"}))
+        return path
+
+    def test_reuses_valid_credentials(self, tmp_path: Path, token_path: Path) -> None:
+        """同じパスの2回目以降はトークンを読み直さない."""
+        with patch(f"{_AUTH_MODULE}.Credentials") as mock_creds_cls:
+            mock_creds = MagicMock()
+            mock_creds.valid = True
+            mock_creds.scopes = set(SCOPES)
+            mock_creds_cls.from_authorized_user_file.return_value = mock_creds
+
+            first = authenticate(str(tmp_path / "credentials.json"), str(token_path))
+            second = authenticate(str(tmp_path / "credentials.json"), str(token_path))
+
+            assert first is second is mock_creds
+            mock_creds_cls.from_authorized_user_file.assert_called_once()
+
+    def test_reloads_when_cached_credentials_invalid(
+        self, tmp_path: Path, token_path: Path
+    ) -> None:
+        """キャッシュが無効になった場合は再度読み込む."""
+        with patch(f"{_AUTH_MODULE}.Credentials") as mock_creds_cls:
+            stale = MagicMock()
+            stale.valid = True
+            stale.scopes = set(SCOPES)
+            fresh = MagicMock()
+            fresh.valid = True
+            fresh.scopes = set(SCOPES)
+            mock_creds_cls.from_authorized_user_file.side_effect = [stale, fresh]
+
+            authenticate(str(tmp_path / "credentials.json"), str(token_path))
+            stale.valid = False
+            result = authenticate(str(tmp_path / "credentials.json"), str(token_path))
+
+            assert result is fresh
+            assert mock_creds_cls.from_authorized_user_file.call_count == 2
+
+    def test_clear_credentials_cache(self, tmp_path: Path, token_path: Path) -> None:
+        """clear_credentials_cache 後は再度読み込む."""
+        with patch(f"{_AUTH_MODULE}.Credentials") as mock_creds_cls:
+            mock_creds = MagicMock()
+            mock_creds.valid = True
+            mock_creds.scopes = set(SCOPES)
+            mock_creds_cls.from_authorized_user_file.return_value = mock_creds
+
+            authenticate(str(tmp_path / "credentials.json"), str(token_path))
+            clear_credentials_cache()
+            authenticate(str(tmp_path / "credentials.json"), str(token_path))
+
+            assert mock_creds_cls.from_authorized_user_file.call_count == 2
+
+    def test_calendar_and_drive_clients_share_one_refresh(
+        self, tmp_path: Path, token_path: Path
+    ) -> None:
+        """Calendar と Drive のクライアントは同じ認証情報を共有し、リフレッシュは1回."""
+        from fishing_forecast_gcal.infrastructure.clients.google_calendar_client import (
+            GoogleCalendarClient,
+        )
+        from fishing_forecast_gcal.infrastructure.clients.google_drive_client import (
+            GoogleDriveClient,
+        )
+
+        calendar_module = "fishing_forecast_gcal.infrastructure.clients.google_calendar_client"
+        drive_module = "fishing_forecast_gcal.infrastructure.clients.google_drive_client"
+        paths = {
+            "credentials_path": str(tmp_path / "credentials.json"),
+            "token_path": str(token_path),
+        }
+        with (
+            patch(f"{_AUTH_MODULE}.Credentials") as mock_creds_cls,
+            patch(f"{_AUTH_MODULE}.Request"),
+            patch(f"{calendar_module}.authorized_http") as calendar_http,
+            patch(f"{calendar_module}.build"),
+            patch(f"{drive_module}.authorized_http") as drive_http,
+            patch(f"{drive_module}.build"),
+        ):
+            mock_creds = MagicMock()
+            mock_creds.valid = False
+            mock_creds.expired = True
+            mock_creds.refresh_token = "mock_refresh"
+            mock_creds.scopes = set(SCOPES)
+            mock_creds.to_json.return_value = "{}"
+
+            def refresh(_request: object) -> None:
+                mock_creds.valid = True
+
+            mock_creds.refresh.side_effect = refresh
+            mock_creds_cls.from_authorized_user_file.return_value = mock_creds
+
+            GoogleCalendarClient(**paths).authenticate()
+            GoogleDriveClient(**paths).authenticate()
+
+        mock_creds_cls.from_authorized_user_file.assert_called_once()
+        mock_creds.refresh.assert_called_once()
+        calendar_http.assert_called_once_with(mock_creds)
+        drive_http.assert_called_once_with(mock_creds)
+
+
 class TestScopeMismatch:
     """スコープ不一致時の再認証フローのテスト"""
 
@@ -386,3 +528,22 @@ class TestRefreshErrorFallback:
             authenticate(str(mock_credentials_path), str(mock_token_path))
 
             assert mock_token_path.read_text() == '{"token": "reauthed_saved"}'
+
+
+class TestAuthorizedHttp:
+    """authorized_http のテスト"""
+
+    def test_wraps_http_with_timeout(self) -> None:
+        """タイムアウト付き httplib2.Http を認証情報でラップする."""
+        creds = MagicMock()
+
+        http = authorized_http(creds)
+
+        assert http.credentials is creds
+        assert http.http.timeout == HTTP_TIMEOUT_SECONDS
+
+    def test_returns_new_transport_per_call(self) -> None:
+        """呼び出しごとに独立したトランスポートを返す（スレッド間で共有しない）."""
+        creds = MagicMock()
+
+        assert authorized_http(creds).http is not authorized_http(creds).http
@@ -6,7 +6,8 @@ Google Calendar API の呼び出しをモック化して、クライアントの
 
 from datetime import date
 from pathlib import Path
-from unittest.mock import MagicMock, Mock
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -46,6 +47,53 @@ class TestGoogleCalendarClient:
         client._service = mock_service  # pyright: ignore[reportPrivateUsage]
         return client
 
+    def test_authenticate_builds_service_with_persistent_http(
+        self, client: GoogleCalendarClient
+    ) -> None:
+        """接続を保持する HTTP と同梱のディスカバリ文書でサービスを構築する."""
+        module = "fishing_forecast_gcal.infrastructure.clients.google_calendar_client"
+        with (
+            patch(f"{module}._authenticate") as mock_auth,
+            patch(f"{module}.authorized_http") as mock_http,
+            patch(f"{module}.build") as mock_build,
+        ):
+            client.authenticate()
+
+        mock_http.assert_called_once_with(mock_auth.return_value)
+        mock_build.assert_called_once_with(
+            "calendar",
+            "v3",
+            http=mock_http.return_value,
+            static_discovery=True,
+            cache_discovery=False,
+        )
+        assert client.get_service() is mock_build.return_value
+
+    def test_requests_share_transport_built_at_authenticate(
+        self, client: GoogleCalendarClient
+    ) -> None:
+        """認証時に構築した 1 つのトランスポートを以降のリクエストで使い回す."""
+        import json
+
+        from googleapiclient.http import HttpMockSequence
+
+        module = "fishing_forecast_gcal.infrastructure.clients.google_calendar_client"
+        http = HttpMockSequence(
+            [
+                ({"status": "200"}, json.dumps({"id": "event1"})),
+                ({"status": "200"}, json.dumps({"id": "event2"})),
+            ]
+        )
+        with (
+            patch(f"{module}._authenticate"),
+            patch(f"{module}.authorized_http", return_value=http) as mock_http,
+        ):
+            client.authenticate()
+
+        assert client.get_event("test@calendar.com", "event1") == {"id": "event1"}
+        assert client.get_event("test@calendar.com", "event2") == {"id": "event2"}
+        mock_http.assert_called_once()
+
     # ========================================
     # イベント作成のテスト
     # ========================================
@@ -272,6 +320,29 @@ class TestGoogleCalendarClient:
                 calendar_id=calendar_id, event_id=event_id, summary="New Summary"
             )
 
+    def test_patch_event_sends_only_given_fields_without_get(
+        self, authenticated_client: GoogleCalendarClient
+    ) -> None:
+        """正常系: 存在確認なしで指定フィールドのみを部分更新する"""
+        mock_service = authenticated_client._service  # pyright: ignore[reportPrivateUsage]
+        mock_events = mock_service.events.return_value
+        mock_events.patch.return_value.execute.return_value = {"id": "test-event-id"}
+
+        result = authenticated_client.patch_event(
+            calendar_id="test@calendar.com",
+            event_id="test-event-id",
+            description="New Description",
+        )
+
+        assert result == {"id": "test-event-id"}
+        mock_events.get.assert_not_called()
+        mock_events.patch.assert_called_once_with(
+            calendarId="test@calendar.com",
+            eventId="test-event-id",
+            body={"description": "New Description"},
+            supportsAttachments=True,
+        )
+
     # ========================================
     # エラーハンドリングのテスト
     # ========================================
@@ -352,6 +423,21 @@ class TestGoogleCalendarClient:
         # Assert
         assert result is False
 
+    def test_delete_event_already_deleted(self, authenticated_client: GoogleCalendarClient) -> None:
+        """Normal: delete already-deleted event returns False. (正常系: 削除済みイベント)"""
+        from googleapiclient.errors import HttpError
+
+        mock_service = authenticated_client._service  # pyright: ignore[reportPrivateUsage]
+        mock_service.events().delete().execute.side_effect = HttpError(
+            Mock(status=410), b"Resource has been deleted"
+        )
+
+        result = authenticated_client.delete_event(
+            calendar_id="test@calendar.com", event_id="deleted-id"
+        )
+
+        assert result is False
+
     def test_delete_event_api_error(self, authenticated_client: GoogleCalendarClient) -> None:
         """Error: delete event raises HttpError on API failure. (異常系: APIエラー)"""
         from googleapiclient.errors import HttpError
@@ -440,6 +526,56 @@ class TestGoogleCalendarClient:
         call_args = mock_service.events.return_value.list.call_args
         assert call_args[1]["privateExtendedProperty"] == "location_id=tk"
 
+    def test_list_events_with_fields_projection(
+        self, authenticated_client: GoogleCalendarClient
+    ) -> None:
+        """Normal: fields projection and page size are sent on every page. (正常系: 部分レスポンス)"""
+        mock_service = authenticated_client._service  # pyright: ignore[reportPrivateUsage]
+        mock_service.events().list().execute.side_effect = [
+            {"items": [{"id": "event1"}], "nextPageToken": "token123"},
+            {"items": [{"id": "event2"}]},
+        ]
+        mock_service.events.return_value.list.reset_mock()
+
+        authenticated_client.list_events(
+            calendar_id="test@calendar.com",
+            start_date=date(2026, 2, 1),
+            end_date=date(2026, 2, 28),
+            fields="items(id),nextPageToken",
+        )
+
+        calls = mock_service.events.return_value.list.call_args_list
+        assert len(calls) == 2
+        for call in calls:
+            assert call.kwargs["fields"] == "items(id),nextPageToken"
+            assert call.kwargs["maxResults"] == 2500
+
+    def test_list_event_changes_returns_next_sync_token(
+        self, authenticated_client: GoogleCalendarClient
+    ) -> None:
+        """Normal: changes are collected across pages with the final sync token. (正常系: 増分同期)"""
+        mock_service = authenticated_client._service  # pyright: ignore[reportPrivateUsage]
+        mock_service.events().list().execute.side_effect = [
+            {"items": [{"id": "event1"}], "nextPageToken": "page2"},
+            {"items": [{"id": "event2", "status": "cancelled"}], "nextSyncToken": "sync-2"},
+        ]
+        mock_service.events.return_value.list.reset_mock()
+
+        items, next_token = authenticated_client.list_event_changes(
+            calendar_id="test@calendar.com", sync_token="sync-1"
+        )
+
+        assert [item["id"] for item in items] == ["event1", "event2"]
+        assert next_token == "sync-2"
+        calls = mock_service.events.return_value.list.call_args_list
+        assert [call.kwargs["syncToken"] for call in calls] == ["sync-1", "sync-1"]
+        assert calls[1].kwargs["pageToken"] == "page2"
+        # syncToken と併用できない絞り込みパラメータは送らない
+        assert "timeMin" not in calls[0].kwargs
+        assert "privateExtendedProperty" not in calls[0].kwargs
+        # 繰り返しイベントは展開せず、シリーズ単位で受け取る
+        assert calls[0].kwargs["singleEvents"] is False
+
     def test_list_events_pagination(self, authenticated_client: GoogleCalendarClient) -> None:
         """Normal: list events handles pagination. (正常系: ページネーション)"""
         calendar_id = "test@calendar.com"
@@ -464,6 +600,155 @@ class TestGoogleCalendarClient:
 
         assert len(result) == 2
 
+    def test_iter_events_fetches_pages_lazily(
+        self, authenticated_client: GoogleCalendarClient
+    ) -> None:
+        """Normal: iter_events requests the next page on demand. (正常系: ページを遅延取得)"""
+        mock_service = authenticated_client._service  # pyright: ignore[reportPrivateUsage]
+        mock_execute = mock_service.events().list().execute
+        mock_execute.side_effect = [
+            {"items": [{"id": "event1"}], "nextPageToken": "token123"},
+            {"items": [{"id": "event2"}]},
+        ]
+        mock_execute.reset_mock()
+
+        events = authenticated_client.iter_events(
+            calendar_id="test@calendar.com",
+            start_date=date(2026, 2, 1),
+            end_date=date(2026, 2, 28),
+        )
+
+        assert next(events) == {"id": "event1"}
+        assert mock_execute.call_count == 1
+        assert list(events) == [{"id": "event2"}]
+        assert mock_execute.call_count == 2
+
+    def test_execute_batch_chunks_requests(
+        self, authenticated_client: GoogleCalendarClient
+    ) -> None:
+        """正常系: 50件ごとにバッチ送信し、個別の結果を返す"""
+        mock_service = authenticated_client._service  # pyright: ignore[reportPrivateUsage]
+        batches: list[MagicMock] = []
+        error = Exception("409 conflict")
+
+        def new_batch(callback: Any) -> MagicMock:
+            batch = MagicMock()
+            added: list[str] = []
+            batch.add.side_effect = lambda request, request_id: added.append(request_id)
+            batch.execute.side_effect = lambda: [
+                callback(rid, {}, error if rid == "event-7" else None) for rid in added
+            ]
+            batches.append(batch)
+            return batch
+
+        mock_service.new_batch_http_request.side_effect = new_batch
+        requests = {f"event-{i}": MagicMock() for i in range(120)}
+
+        results = authenticated_client.execute_batch(requests)
+
+        assert [b.add.call_count for b in batches] == [50, 50, 20]
+        assert len(results) == 120
+        assert results["event-7"] is error
+        assert results["event-8"] is None
+
+    def test_execute_applies_rate_limiter_and_retries(
+        self, mock_credentials_path: Path, mock_token_path: Path
+    ) -> None:
+        """正常系: 単発リクエストごとにトークンを取得し、再試行付きで実行する"""
+        limiter = Mock()
+        client = GoogleCalendarClient(
+            credentials_path=str(mock_credentials_path),
+            token_path=str(mock_token_path),
+            rate_limiter=limiter,
+        )
+        mock_service = MagicMock()
+        client._service = mock_service  # pyright: ignore[reportPrivateUsage]
+        mock_delete = mock_service.events.return_value.delete
+
+        assert client.delete_event("test@calendar.com", "event1") is True
+
+        limiter.acquire.assert_called_once_with()
+        mock_delete.return_value.execute.assert_called_once_with(
+            num_retries=GoogleCalendarClient.NUM_RETRIES
+        )
+
+    def test_execute_batch_acquires_tokens_per_request(
+        self, mock_credentials_path: Path, mock_token_path: Path
+    ) -> None:
+        """正常系: バッチ送信ではバッチ内のリクエスト件数分のトークンを取得する"""
+        limiter = Mock()
+        client = GoogleCalendarClient(
+            credentials_path=str(mock_credentials_path),
+            token_path=str(mock_token_path),
+            rate_limiter=limiter,
+        )
+        client._service = MagicMock()  # pyright: ignore[reportPrivateUsage]
+
+        client.execute_batch({f"event-{i}": MagicMock() for i in range(60)})
+
+        assert [c.args for c in limiter.acquire.call_args_list] == [(50,), (10,)]
+
+    def test_delete_events_treats_not_found_as_success(
+        self, authenticated_client: GoogleCalendarClient
+    ) -> None:
+        """正常系: バッチで削除し、404 は成功、それ以外の失敗は個別に返す"""
+        from googleapiclient.errors import HttpError
+
+        not_found = HttpError(Mock(status=404), b"Not Found")
+        server_error = HttpError(Mock(status=500), b"Internal Server Error")
+        mock_service = authenticated_client._service  # pyright: ignore[reportPrivateUsage]
+        mock_delete = mock_service.events.return_value.delete
+
+        with patch.object(
+            authenticated_client,
+            "execute_batch",
+            return_value={"event1": None, "event2": not_found, "event3": server_error},
+        ) as mock_execute_batch:
+            results = authenticated_client.delete_events(
+                "test@calendar.com", ["event1", "event2", "event3"]
+            )
+
+        assert results == {"event1": None, "event2": None, "event3": server_error}
+        assert list(mock_execute_batch.call_args.args[0]) == ["event1", "event2", "event3"]
+        assert mock_delete.call_args.kwargs == {
+            "calendarId": "test@calendar.com",
+            "eventId": "event3",
+        }
+        mock_delete.return_value.execute.assert_not_called()
+
+    def test_delete_events_treats_gone_as_success(
+        self, authenticated_client: GoogleCalendarClient
+    ) -> None:
+        """正常系: 既に削除済み (410) のイベントも成功扱い"""
+        from googleapiclient.errors import HttpError
+
+        gone = HttpError(Mock(status=410), b"Resource has been deleted")
+
+        with patch.object(authenticated_client, "execute_batch", return_value={"event1": gone}):
+            results = authenticated_client.delete_events("test@calendar.com", ["event1"])
+
+        assert results == {"event1": None}
+
+    def test_build_insert_request_does_not_execute(
+        self, authenticated_client: GoogleCalendarClient
+    ) -> None:
+        """正常系: insert リクエストを構築するだけで実行しない"""
+        mock_service = authenticated_client._service  # pyright: ignore[reportPrivateUsage]
+        mock_insert = mock_service.events.return_value.insert
+
+        request = authenticated_client.build_insert_request(
+            calendar_id="test@calendar.com",
+            event_id="event1",
+            summary="title",
+            description="desc",
+            start_date=date(2026, 2, 8),
+            end_date=date(2026, 2, 9),
+        )
+
+        assert request is mock_insert.return_value
+        mock_insert.return_value.execute.assert_not_called()
+        assert mock_insert.call_args.kwargs["body"]["start"]["date"] == "2026-02-08"
+
     # ========================================
     # attachments 対応のテスト
     # ========================================
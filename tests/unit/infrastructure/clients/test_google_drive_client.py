@@ -3,6 +3,7 @@
 Google Drive API の呼び出しをモック化して、クライアントのロジックを検証する。
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -55,6 +56,7 @@ class TestAuthentication(TestGoogleDriveClient):
         """認証が google_auth.authenticate に委譲される."""
         with (
             patch(f"{_DRIVE_MODULE}._authenticate") as mock_auth,
+            patch(f"{_DRIVE_MODULE}.authorized_http") as mock_http,
             patch(f"{_DRIVE_MODULE}.build") as mock_build,
         ):
             mock_creds = MagicMock()
@@ -68,7 +70,14 @@ class TestAuthentication(TestGoogleDriveClient):
                 client._credentials_path,  # pyright: ignore[reportPrivateUsage]
                 client._token_path,  # pyright: ignore[reportPrivateUsage]
             )
-            mock_build.assert_called_once_with("drive", "v3", credentials=mock_creds)
+            mock_http.assert_called_once_with(mock_creds)
+            mock_build.assert_called_once_with(
+                "drive",
+                "v3",
+                http=mock_http.return_value,
+                static_discovery=True,
+                cache_discovery=False,
+            )
             assert client._service is mock_service  # pyright: ignore[reportPrivateUsage]
 
     def test_authenticate_missing_credentials_file(self, tmp_path: Path) -> None:
@@ -86,6 +95,35 @@ class TestAuthentication(TestGoogleDriveClient):
         with pytest.raises(RuntimeError, match="Drive service not initialized"):
             client.get_service()
 
+    def test_get_service_builds_separate_service_per_thread(
+        self, client: GoogleDriveClient
+    ) -> None:
+        """認証スレッド以外では同じ認証情報からスレッドごとのサービスを構築する."""
+        with (
+            patch(f"{_DRIVE_MODULE}._authenticate") as mock_auth,
+            patch(f"{_DRIVE_MODULE}.authorized_http") as mock_http,
+            patch(f"{_DRIVE_MODULE}.build") as mock_build,
+        ):
+            mock_http.side_effect = lambda creds: MagicMock()
+            mock_build.side_effect = lambda *args, **kwargs: MagicMock()
+            client.authenticate()
+            main_service = client.get_service()
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                worker_services = executor.submit(
+                    lambda: (client.get_service(), client.get_service())
+                ).result()
+
+        assert client.get_service() is main_service
+        assert worker_services[0] is worker_services[1]
+        assert worker_services[0] is not main_service
+        assert mock_build.call_count == 2
+        # スレッドごとに同じ認証情報から別の HTTP トランスポートを使う
+        assert mock_http.call_count == 2
+        assert mock_http.call_args.args[0] is mock_auth.return_value
+        transports = [c.kwargs["http"] for c in mock_build.call_args_list]
+        assert transports[0] is not transports[1]
+
 
 class TestUploadFile(TestGoogleDriveClient):
     """upload_file のテスト"""
@@ -0,0 +1,81 @@
+"""Unit tests for RateLimiter.
+
+トークンバケット方式のレートリミッターのユニットテストを提供する。
+時刻と sleep をモック化し、バースト・補充・待機時間を検証する。
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from fishing_forecast_gcal.infrastructure.clients.rate_limiter import RateLimiter
+
+_MODULE = "fishing_forecast_gcal.infrastructure.clients.rate_limiter"
+
+
+class TestRateLimiter:
+    """RateLimiter のテスト"""
+
+    def test_burst_proceeds_without_waiting(self) -> None:
+        """バースト数までのリクエストは待機しないこと."""
+        with (
+            patch(f"{_MODULE}.time.monotonic", return_value=100.0),
+            patch(f"{_MODULE}.time.sleep") as mock_sleep,
+        ):
+            limiter = RateLimiter(rate_per_sec=8.0, burst=5)
+            waits = [limiter.acquire() for _ in range(5)]
+
+        assert waits == [0.0] * 5
+        mock_sleep.assert_not_called()
+
+    def test_waits_when_bucket_is_empty(self) -> None:
+        """バケットが空の場合、補充されるまで待機すること."""
+        with (
+            patch(f"{_MODULE}.time.monotonic", return_value=100.0),
+            patch(f"{_MODULE}.time.sleep") as mock_sleep,
+        ):
+            limiter = RateLimiter(rate_per_sec=8.0, burst=5)
+            for _ in range(5):
+                limiter.acquire()
+            first = limiter.acquire()
+            second = limiter.acquire()
+
+        assert first == pytest.approx(1 / 8)
+        assert second == pytest.approx(2 / 8)
+        assert mock_sleep.call_count == 2
+
+    def test_refills_over_time(self) -> None:
+        """経過時間に応じてトークンが補充されること（上限はバースト数）."""
+        clock = [100.0]
+        with (
+            patch(f"{_MODULE}.time.monotonic", side_effect=lambda: clock[0]),
+            patch(f"{_MODULE}.time.sleep") as mock_sleep,
+        ):
+            limiter = RateLimiter(rate_per_sec=8.0, burst=5)
+            for _ in range(5):
+                limiter.acquire()
+            clock[0] += 60.0
+            waits = [limiter.acquire() for _ in range(5)]
+            overflow = limiter.acquire()
+
+        assert waits == [0.0] * 5
+        assert overflow == pytest.approx(1 / 8)
+        mock_sleep.assert_called_once()
+
+    def test_acquire_multiple_tokens(self) -> None:
+        """バースト数を超える件数を要求した場合、超過分を待機すること."""
+        with (
+            patch(f"{_MODULE}.time.monotonic", return_value=100.0),
+            patch(f"{_MODULE}.time.sleep") as mock_sleep,
+        ):
+            limiter = RateLimiter(rate_per_sec=10.0, burst=5)
+            wait = limiter.acquire(20)
+
+        assert wait == pytest.approx(1.5)
+        mock_sleep.assert_called_once_with(wait)
+
+    @pytest.mark.parametrize(("rate", "burst"), [(0.0, 5), (-1.0, 5), (8.0, 0)])
+    def test_invalid_parameters(self, rate: float, burst: int) -> None:
+        """rate_per_sec / burst が正でない場合 ValueError を送出すること."""
+        with pytest.raises(ValueError):
+            RateLimiter(rate_per_sec=rate, burst=burst)
@@ -3,17 +3,21 @@
 GoogleCalendarClient をモック化して CalendarRepository の動作を検証します。
 """
 
+import json
 from datetime import date
+from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, Mock
 
 import pytest
+from googleapiclient.errors import HttpError
 
 from fishing_forecast_gcal.domain.models.calendar_event import CalendarEvent
 from fishing_forecast_gcal.infrastructure.clients.google_calendar_client import (
     GoogleCalendarClient,
 )
 from fishing_forecast_gcal.infrastructure.repositories.calendar_repository import (
+    CalendarEventReplica,
     CalendarRepository,
 )
 
@@ -271,7 +275,7 @@ class TestListEvents:
         self, calendar_repository: CalendarRepository, mock_client: MagicMock
     ) -> None:
         """Normal: returns CalendarEvent list from API events. (正常系: API→ドメインモデル変換)"""
-        mock_client.list_events.return_value = [
+        mock_client.iter_events.return_value = [
             {
                 "id": "event1",
                 "summary": "🔴横須賀 (大潮)",
@@ -295,18 +299,19 @@ class TestListEvents:
         assert len(result) == 2
         assert result[0].event_id == "event1"
         assert result[1].event_id == "event2"
-        mock_client.list_events.assert_called_once_with(
+        mock_client.iter_events.assert_called_once_with(
             calendar_id="test-calendar-id",
             start_date=date(2026, 2, 1),
             end_date=date(2026, 2, 28),
             private_extended_property="location_id=yokosuka",
+            fields=("items(id,summary,description,start,extendedProperties/private),nextPageToken"),
         )
 
     def test_list_events_empty(
         self, calendar_repository: CalendarRepository, mock_client: MagicMock
     ) -> None:
         """Normal: returns empty list when no events found. (正常系: イベントなし)"""
-        mock_client.list_events.return_value = []
+        mock_client.iter_events.return_value = []
 
         result = calendar_repository.list_events(
             start_date=date(2026, 2, 1), end_date=date(2026, 2, 28), location_id="yokosuka"
@@ -319,7 +324,7 @@ class TestListEvents:
     ) -> None:
         """Normal: results sorted by date. (正常系: 日付順にソート)"""
         # Return events in reverse order
-        mock_client.list_events.return_value = [
+        mock_client.iter_events.return_value = [
             {
                 "id": "event2",
                 "summary": "Event 2",
@@ -348,7 +353,7 @@ class TestListEvents:
         self, calendar_repository: CalendarRepository, mock_client: MagicMock
     ) -> None:
         """Normal: skips events with invalid format. (正常系: 不正イベントをスキップ)"""
-        mock_client.list_events.return_value = [
+        mock_client.iter_events.return_value = [
             {
                 "id": "valid",
                 "summary": "Valid Event",
@@ -373,13 +378,110 @@ class TestListEvents:
         self, calendar_repository: CalendarRepository, mock_client: MagicMock
     ) -> None:
         """Error: raises RuntimeError on API failure. (異常系: APIエラー)"""
-        mock_client.list_events.side_effect = Exception("API Error")
+        mock_client.iter_events.side_effect = Exception("API Error")
 
         with pytest.raises(RuntimeError, match="Failed to list events"):
             calendar_repository.list_events(
                 start_date=date(2026, 2, 1), end_date=date(2026, 2, 28), location_id="yokosuka"
             )
 
+    def test_iter_events_yields_in_api_order(
+        self, calendar_repository: CalendarRepository, mock_client: MagicMock
+    ) -> None:
+        """Normal: iter_events streams events unsorted. (正常系: API順に逐次返す)"""
+        mock_client.iter_events.return_value = iter(
+            [
+                {
+                    "id": "event2",
+                    "summary": "Event 2",
+                    "start": {"date": "2026-02-15"},
+                    "extendedProperties": {"private": {"location_id": "yokosuka"}},
+                },
+                {"id": "invalid"},
+                {
+                    "id": "event1",
+                    "summary": "Event 1",
+                    "start": {"date": "2026-02-01"},
+                    "extendedProperties": {"private": {"location_id": "yokosuka"}},
+                },
+            ]
+        )
+
+        events = calendar_repository.iter_events(
+            start_date=date(2026, 2, 1), end_date=date(2026, 2, 28), location_id="yokosuka"
+        )
+
+        assert [e.event_id for e in events] == ["event2", "event1"]
+
+
+class TestUpsertEvents:
+    """upsert_events method tests. (upsert_events メソッドのテスト)"""
+
+    def test_upsert_events_batches_insert_and_patch(
+        self,
+        calendar_repository: CalendarRepository,
+        mock_client: MagicMock,
+        sample_calendar_event: CalendarEvent,
+    ) -> None:
+        """Normal: existing events are patched, new ones inserted. (正常系: バッチ送信)"""
+        new_event = CalendarEvent(
+            event_id="new123",
+            title="🔵横須賀 (小潮)",
+            description="[TIDE]",
+            date=date(2026, 2, 9),
+            location_id="yokosuka",
+        )
+        mock_client.execute_batch.return_value = {"abc123": None, "new123": None}
+        attachments = [{"fileUrl": "https://example.com/a.png", "title": "a.png"}]
+
+        failures = calendar_repository.upsert_events(
+            [sample_calendar_event, new_event],
+            existing={"abc123": sample_calendar_event},
+            attachments={"new123": attachments},
+        )
+
+        assert failures == {}
+        mock_client.get_event.assert_not_called()
+        mock_client.build_patch_request.assert_called_once()
+        assert mock_client.build_patch_request.call_args.kwargs["event_id"] == "abc123"
+        insert_kwargs = mock_client.build_insert_request.call_args.kwargs
+        assert insert_kwargs["event_id"] == "new123"
+        assert insert_kwargs["end_date"] == date(2026, 2, 10)
+        assert insert_kwargs["attachments"] == attachments
+        requests = mock_client.execute_batch.call_args.args[0]
+        assert list(requests) == ["abc123", "new123"]
+
+    def test_upsert_events_returns_failures(
+        self,
+        calendar_repository: CalendarRepository,
+        mock_client: MagicMock,
+        sample_calendar_event: CalendarEvent,
+    ) -> None:
+        """Error: per-event failures are returned, not raised. (異常系: 個別失敗)"""
+        mock_client.execute_batch.return_value = {"abc123": Exception("403")}
+
+        failures = calendar_repository.upsert_events([sample_calendar_event], existing={})
+
+        assert list(failures) == ["abc123"]
+        assert isinstance(failures["abc123"], RuntimeError)
+
+    def test_upsert_events_checks_existence_without_mapping(
+        self,
+        calendar_repository: CalendarRepository,
+        mock_client: MagicMock,
+        sample_calendar_event: CalendarEvent,
+        sample_api_event: dict[str, Any],
+    ) -> None:
+        """Normal: falls back to get_event when existing is None. (正常系: 存在確認)"""
+        mock_client.get_event.return_value = sample_api_event
+        mock_client.execute_batch.return_value = {"abc123": None}
+
+        calendar_repository.upsert_events([sample_calendar_event])
+
+        mock_client.get_event.assert_called_once_with("test-calendar-id", "abc123")
+        mock_client.build_patch_request.assert_called_once()
+        mock_client.build_insert_request.assert_not_called()
+
 
 class TestDeleteEvent:
     """delete_event method tests. (delete_event メソッドのテスト)"""
@@ -415,6 +517,212 @@ class TestDeleteEvent:
             calendar_repository.delete_event("abc123")
 
 
+class TestDeleteEvents:
+    """delete_events method tests. (delete_events メソッドのテスト)"""
+
+    def test_delete_events_sends_batch(
+        self, calendar_repository: CalendarRepository, mock_client: MagicMock
+    ) -> None:
+        """Normal: deletes are sent in one client batch call. (正常系: バッチ送信)"""
+        mock_client.delete_events.return_value = {"abc123": None, "def456": None}
+
+        failures = calendar_repository.delete_events(["abc123", "def456"])
+
+        assert failures == {}
+        mock_client.delete_events.assert_called_once_with("test-calendar-id", ["abc123", "def456"])
+        mock_client.delete_event.assert_not_called()
+
+    def test_delete_events_returns_failures(
+        self, calendar_repository: CalendarRepository, mock_client: MagicMock
+    ) -> None:
+        """Error: per-event failures are returned, not raised. (異常系: 個別失敗)"""
+        mock_client.delete_events.return_value = {"abc123": Exception("403"), "def456": None}
+
+        failures = calendar_repository.delete_events(["abc123", "def456"])
+
+        assert list(failures) == ["abc123"]
+        assert isinstance(failures["abc123"], RuntimeError)
+
+    def test_delete_events_batch_error(
+        self, calendar_repository: CalendarRepository, mock_client: MagicMock
+    ) -> None:
+        """Error: a failed batch raises RuntimeError. (異常系: バッチ全体の失敗)"""
+        mock_client.delete_events.side_effect = Exception("network down")
+
+        with pytest.raises(RuntimeError, match="Failed to delete events"):
+            calendar_repository.delete_events(["abc123"])
+
+
+def _api_event(event_id: str, event_date: str, location_id: str = "yokosuka") -> dict[str, Any]:
+    """増分同期テスト用の API 形式イベント"""
+    return {
+        "id": event_id,
+        "status": "confirmed",
+        "summary": f"event {event_id}",
+        "start": {"date": event_date},
+        "extendedProperties": {"private": {"location_id": location_id}},
+    }
+
+
+class TestIncrementalSync:
+    """同期トークンによる増分同期のテスト"""
+
+    @pytest.fixture
+    def cache_path(self, tmp_path: Path) -> Path:
+        return tmp_path / ".cache" / "sync_token_test.json"
+
+    @pytest.fixture
+    def synced_repository(self, mock_client: MagicMock, cache_path: Path) -> CalendarRepository:
+        return CalendarRepository(
+            client=mock_client,
+            calendar_id="test-calendar-id",
+            event_replica=CalendarEventReplica(cache_path, "test-calendar-id"),
+        )
+
+    def test_first_listing_is_full_sync_filtered_locally(
+        self, synced_repository: CalendarRepository, mock_client: MagicMock, cache_path: Path
+    ) -> None:
+        """Normal: first call lists everything once and filters by period/location."""
+        mock_client.list_event_changes.return_value = (
+            [
+                _api_event("in", "2026-02-08"),
+                _api_event("other_loc", "2026-02-08", location_id="tk"),
+                _api_event("out_of_range", "2026-03-01"),
+            ],
+            "token-1",
+        )
+
+        events = synced_repository.list_events(date(2026, 2, 1), date(2026, 2, 28), "yokosuka")
+
+        assert [e.event_id for e in events] == ["in"]
+        assert mock_client.list_event_changes.call_args.kwargs["sync_token"] is None
+        mock_client.iter_events.assert_not_called()
+        assert cache_path.exists()
+
+    def test_next_listing_applies_only_changes(
+        self, mock_client: MagicMock, cache_path: Path
+    ) -> None:
+        """Normal: a later run sends the stored token and applies the delta."""
+        mock_client.list_event_changes.return_value = (
+            [_api_event("a", "2026-02-08"), _api_event("b", "2026-02-09")],
+            "token-1",
+        )
+        CalendarRepository(
+            mock_client,
+            "test-calendar-id",
+            event_replica=CalendarEventReplica(cache_path, "test-calendar-id"),
+        ).list_events(date(2026, 2, 1), date(2026, 2, 28), "yokosuka")
+
+        mock_client.list_event_changes.return_value = (
+            [{"id": "a", "status": "cancelled"}, _api_event("c", "2026-02-10")],
+            "token-2",
+        )
+        events = CalendarRepository(
+            mock_client,
+            "test-calendar-id",
+            event_replica=CalendarEventReplica(cache_path, "test-calendar-id"),
+        ).list_events(date(2026, 2, 1), date(2026, 2, 28), "yokosuka")
+
+        assert [e.event_id for e in events] == ["b", "c"]
+        assert mock_client.list_event_changes.call_args.kwargs["sync_token"] == "token-1"
+
+    def test_expired_token_falls_back_to_full_sync(
+        self, synced_repository: CalendarRepository, mock_client: MagicMock, cache_path: Path
+    ) -> None:
+        """Normal: 410 Gone discards the stale copy and lists everything again."""
+        mock_client.list_event_changes.return_value = ([_api_event("a", "2026-02-08")], "token-1")
+        synced_repository.list_events(date(2026, 2, 1), date(2026, 2, 28), "yokosuka")
+        # 次回の実行（新しい複製）で保存済みトークンが失効している
+        synced_repository.event_replica = CalendarEventReplica(cache_path, "test-calendar-id")
+
+        gone = Mock()
+        gone.status = 410
+        mock_client.list_event_changes.side_effect = [
+            HttpError(gone, b"Gone"),
+            ([_api_event("b", "2026-02-09")], "token-2"),
+        ]
+
+        events = synced_repository.list_events(date(2026, 2, 1), date(2026, 2, 28), "yokosuka")
+
+        assert [e.event_id for e in events] == ["b"]
+        tokens = [c.kwargs["sync_token"] for c in mock_client.list_event_changes.call_args_list]
+        assert tokens == [None, "token-1", None]
+
+    def test_corrupted_cache_triggers_full_sync(
+        self, synced_repository: CalendarRepository, mock_client: MagicMock, cache_path: Path
+    ) -> None:
+        """Normal: an unreadable cache file is ignored."""
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text("not json")
+        mock_client.list_event_changes.return_value = ([_api_event("a", "2026-02-08")], "token-1")
+
+        events = synced_repository.list_events(date(2026, 2, 1), date(2026, 2, 28), "yokosuka")
+
+        assert [e.event_id for e in events] == ["a"]
+        assert mock_client.list_event_changes.call_args.kwargs["sync_token"] is None
+
+    def test_foreign_events_are_not_persisted(
+        self, synced_repository: CalendarRepository, mock_client: MagicMock, cache_path: Path
+    ) -> None:
+        """Normal: events without a private location_id are not written to the cache."""
+        personal = {
+            "id": "personal",
+            "summary": "歯医者",
+            "description": "個人的な予定",
+            "start": {"date": "2026-02-08"},
+        }
+        mock_client.list_event_changes.return_value = (
+            [personal, _api_event("tool", "2026-02-08")],
+            "token-1",
+        )
+
+        synced_repository.list_events(date(2026, 2, 1), date(2026, 2, 28), "yokosuka")
+
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        assert list(cached["events"]) == ["tool"]
+        assert "個人的な予定" not in cache_path.read_text(encoding="utf-8")
+
+    def test_replica_is_synced_once_for_all_locations(
+        self, mock_client: MagicMock, cache_path: Path
+    ) -> None:
+        """Normal: repositories sharing a replica sync once and filter per location."""
+        mock_client.list_event_changes.return_value = (
+            [
+                _api_event("yk", "2026-02-08"),
+                _api_event("tk", "2026-02-08", location_id="tk"),
+            ],
+            "token-1",
+        )
+        replica = CalendarEventReplica(cache_path, "test-calendar-id")
+        repositories = [
+            CalendarRepository(mock_client, "test-calendar-id", event_replica=replica)
+            for _ in range(2)
+        ]
+
+        yk_events = repositories[0].list_events(date(2026, 2, 1), date(2026, 2, 28), "yokosuka")
+        tk_events = repositories[1].list_events(date(2026, 2, 1), date(2026, 2, 28), "tk")
+
+        assert [e.event_id for e in yk_events] == ["yk"]
+        assert [e.event_id for e in tk_events] == ["tk"]
+        mock_client.list_event_changes.assert_called_once()
+
+    def test_deleted_events_are_removed_from_replica(
+        self, synced_repository: CalendarRepository, mock_client: MagicMock
+    ) -> None:
+        """Normal: events deleted in this run no longer appear in later listings."""
+        mock_client.list_event_changes.return_value = (
+            [_api_event("a", "2026-02-08"), _api_event("b", "2026-02-09")],
+            "token-1",
+        )
+        mock_client.delete_events.return_value = {"a": None, "b": Exception("boom")}
+        synced_repository.list_events(date(2026, 2, 1), date(2026, 2, 28), "yokosuka")
+
+        synced_repository.delete_events(["a", "b"])
+        events = synced_repository.list_events(date(2026, 2, 1), date(2026, 2, 28), "yokosuka")
+
+        assert [e.event_id for e in events] == ["b"]
+
+
 class TestAPIFormatConversion:
     """API形式変換のテスト"""
 
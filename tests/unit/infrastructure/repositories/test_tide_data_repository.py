@@ -4,7 +4,8 @@
 TideCalculationAdapter をモック化して、リポジトリのロジックを検証します。
 """
 
-from datetime import UTC, date, datetime
+import math
+from datetime import UTC, date, datetime, timedelta
 from unittest.mock import Mock
 
 import pytest
@@ -23,6 +24,17 @@ from fishing_forecast_gcal.infrastructure.repositories.tide_data_repository impo
 )
 
 
+class _SineAdapter:
+    """正弦波の合成潮位を返すアダプター（期間取得テスト用）"""
+
+    def calculate_tide(self, location: Location, target_date: date) -> list[tuple[datetime, float]]:
+        base = datetime(target_date.year, target_date.month, target_date.day, tzinfo=UTC)
+        return [
+            (base + timedelta(minutes=10 * i), 100.0 + 50.0 * math.sin(2 * math.pi * i / 74.5))
+            for i in range(145)
+        ]
+
+
 class TestTideDataRepository:
     """TideDataRepository のユニットテスト"""
 
@@ -240,3 +252,66 @@ class TestTideDataRepository:
         assert repo._type_classifier is custom_classifier
         assert repo._prime_time_finder is custom_finder
         assert repo._moon_age_calculator is custom_moon
+
+
+class TestGetTideDataRange:
+    """get_tide_data_range のユニットテスト"""
+
+    @pytest.fixture
+    def location(self) -> Location:
+        """サンプル地点のフィクスチャ"""
+        return Location(id="tk", name="東京", latitude=35.65, longitude=139.77, station_id="TK")
+
+    def test_range_uses_single_adapter_call(self, location: Location) -> None:
+        """正常系: アダプターを1回だけ呼び出し、日ごとの結果が個別取得と一致すること"""
+        sine = _SineAdapter()
+        mock_adapter = Mock(spec=TideCalculationAdapter)
+        mock_adapter.calculate_tide_range.side_effect = lambda loc, start, end: {
+            start + timedelta(days=i): sine.calculate_tide(loc, start + timedelta(days=i))
+            for i in range((end - start).days + 1)
+        }
+        repository = TideDataRepository(adapter=mock_adapter)
+        reference = TideDataRepository(adapter=sine)  # type: ignore[arg-type]
+
+        tides, errors = repository.get_tide_data_range(
+            location, date(2026, 2, 8), date(2026, 2, 10)
+        )
+
+        assert errors == {}
+        mock_adapter.calculate_tide_range.assert_called_once_with(
+            location, date(2026, 2, 8), date(2026, 2, 10)
+        )
+        mock_adapter.calculate_tide.assert_not_called()
+        assert list(tides) == [date(2026, 2, d) for d in (8, 9, 10)]
+        for target_date, tide in tides.items():
+            assert tide == reference.get_tide_data(location, target_date)
+
+    def test_range_records_per_day_failures(self, location: Location) -> None:
+        """異常系: 満干潮が検出できない日だけが失敗として記録されること"""
+        sine = _SineAdapter()
+        base = datetime(2026, 2, 9, tzinfo=UTC)
+        mock_adapter = Mock(spec=TideCalculationAdapter)
+        mock_adapter.calculate_tide_range.return_value = {
+            date(2026, 2, 8): sine.calculate_tide(location, date(2026, 2, 8)),
+            date(2026, 2, 9): [(base, 100.0), (base.replace(hour=1), 110.0)],
+        }
+        repository = TideDataRepository(adapter=mock_adapter)
+
+        tides, errors = repository.get_tide_data_range(location, date(2026, 2, 8), date(2026, 2, 9))
+
+        assert list(tides) == [date(2026, 2, 8)]
+        assert list(errors) == [date(2026, 2, 9)]
+        assert isinstance(errors[date(2026, 2, 9)], RuntimeError)
+        assert "No high/low tide events found" in str(errors[date(2026, 2, 9)])
+
+    def test_range_adapter_failure_marks_every_day(self, location: Location) -> None:
+        """異常系: 予測計算自体の失敗は期間内の全日付に記録されること"""
+        mock_adapter = Mock(spec=TideCalculationAdapter)
+        mock_adapter.calculate_tide_range.side_effect = FileNotFoundError("Harmonics missing")
+        repository = TideDataRepository(adapter=mock_adapter)
+
+        tides, errors = repository.get_tide_data_range(location, date(2026, 2, 8), date(2026, 2, 9))
+
+        assert tides == {}
+        assert list(errors) == [date(2026, 2, 8), date(2026, 2, 9)]
+        assert all(isinstance(e, FileNotFoundError) for e in errors.values())
@@ -8,15 +8,13 @@ import struct
 import zlib
 from datetime import date, datetime
 from pathlib import Path
-from zoneinfo import ZoneInfo
+from typing import Any
 
 import pytest
 
 from fishing_forecast_gcal.domain.models.tide import TideEvent, TideType
 from fishing_forecast_gcal.infrastructure.services.tide_graph_renderer import TideGraphRenderer
-
-JST = ZoneInfo("Asia/Tokyo")
-
+from tests.support import JST
 
 # ---- Fixtures ----
 
@@ -513,6 +511,191 @@ class TestErrorHandling:
 
         assert result.exists()
 
+    def test_event_markers_grouped_by_type(
+        self,
+        service: TideGraphRenderer,
+        target_date: date,
+        sample_hourly_heights: list[tuple[float, float]],
+        sample_tide_events: list[TideEvent],
+        tmp_path: Path,
+    ) -> None:
+        """Markers are drawn as one collection per event type, skipping other dates."""
+        from matplotlib.collections import PathCollection
+
+        events = [
+            *sample_tide_events,
+            TideEvent(
+                time=datetime(2026, 2, 16, 4, 0, tzinfo=JST),
+                height_cm=168.0,
+                event_type="high",
+            ),
+        ]
+
+        service.generate_graph(
+            target_date=target_date,
+            hourly_heights=sample_hourly_heights,
+            tide_events=events,
+            location_name="東京",
+            tide_type=TideType.SPRING,
+            output_dir=tmp_path,
+        )
+
+        ax = service._ax  # pyright: ignore[reportPrivateUsage]
+        assert ax is not None
+        markers = [c for c in ax.collections if isinstance(c, PathCollection)]
+        assert [len(c.get_offsets()) for c in markers] == [2, 2]
+        assert len(ax.texts) == 4
+
+
+# ---- Test: Figure reuse ----
+
+
+class TestFigureReuse:
+    """Test figure caching across generate_graph calls."""
+
+    def test_reused_figure_matches_fresh_render(
+        self,
+        target_date: date,
+        sample_hourly_heights: list[tuple[float, float]],
+        sample_tide_events: list[TideEvent],
+        tmp_path: Path,
+    ) -> None:
+        """A reused figure produces the same pixels as a fresh renderer."""
+        from PIL import Image
+
+        reused = TideGraphRenderer()
+        reused.generate_graph(
+            target_date=target_date,
+            hourly_heights=[(h, ht + 30.0) for h, ht in sample_hourly_heights],
+            tide_events=[],
+            location_name="横須賀",
+            tide_type=TideType.NEAP,
+            output_dir=tmp_path / "first",
+        )
+        fig_before = reused._fig  # pyright: ignore[reportPrivateUsage]
+
+        kwargs: dict[str, Any] = {
+            "target_date": target_date,
+            "hourly_heights": sample_hourly_heights,
+            "tide_events": sample_tide_events,
+            "location_name": "東京",
+            "tide_type": TideType.SPRING,
+            "location_id": "tk",
+        }
+        second = reused.generate_graph(**kwargs, output_dir=tmp_path / "reused")
+        fresh = TideGraphRenderer().generate_graph(**kwargs, output_dir=tmp_path / "fresh")
+
+        assert reused._fig is fig_before  # pyright: ignore[reportPrivateUsage]
+        assert fig_before is not None
+        assert fig_before.canvas is reused._canvas  # pyright: ignore[reportPrivateUsage]
+        assert Image.open(second).tobytes() == Image.open(fresh).tobytes()
+
+    def test_xticks_cover_full_day(
+        self,
+        service: TideGraphRenderer,
+        target_date: date,
+        sample_hourly_heights: list[tuple[float, float]],
+        tmp_path: Path,
+    ) -> None:
+        """X-axis ticks are the shared 3-hour labels."""
+        service.generate_graph(
+            target_date=target_date,
+            hourly_heights=sample_hourly_heights,
+            tide_events=[],
+            location_name="東京",
+            tide_type=TideType.SPRING,
+            output_dir=tmp_path,
+        )
+
+        ax = service._ax  # pyright: ignore[reportPrivateUsage]
+        assert ax is not None
+        assert list(ax.get_xticks()) == list(range(0, 25, 3))
+        assert [t.get_text() for t in ax.get_xticklabels()] == [
+            "00:00",
+            "03:00",
+            "06:00",
+            "09:00",
+            "12:00",
+            "15:00",
+            "18:00",
+            "21:00",
+            "24:00",
+        ]
+
+    def test_close_releases_figure(
+        self,
+        service: TideGraphRenderer,
+        target_date: date,
+        sample_hourly_heights: list[tuple[float, float]],
+        tmp_path: Path,
+    ) -> None:
+        """close() drops the cached figure."""
+        service.generate_graph(
+            target_date=target_date,
+            hourly_heights=sample_hourly_heights,
+            tide_events=[],
+            location_name="東京",
+            tide_type=TideType.SPRING,
+            output_dir=tmp_path,
+        )
+
+        service.close()
+
+        assert service._fig is None  # pyright: ignore[reportPrivateUsage]
+
+
+# ---- Test: Style ----
+
+
+class TestStyle:
+    """Test lazy style setup."""
+
+    def test_style_does_not_mutate_global_rcparams(
+        self,
+        target_date: date,
+        sample_hourly_heights: list[tuple[float, float]],
+        tmp_path: Path,
+    ) -> None:
+        """Rendering applies the theme locally without touching global rcParams."""
+        import matplotlib
+
+        before = dict(matplotlib.rcParams)
+
+        TideGraphRenderer().generate_graph(
+            target_date=target_date,
+            hourly_heights=sample_hourly_heights,
+            tide_events=[],
+            location_name="東京",
+            tide_type=TideType.SPRING,
+            output_dir=tmp_path,
+        )
+
+        assert dict(matplotlib.rcParams) == before
+
+    def test_style_is_built_once(self) -> None:
+        """Renderers share a single cached style dict."""
+        style = TideGraphRenderer()._style  # pyright: ignore[reportPrivateUsage]
+
+        assert TideGraphRenderer()._style is style  # pyright: ignore[reportPrivateUsage]
+        assert "axes.facecolor" in style
+
+    def test_annotation_font_uses_styled_family(self) -> None:
+        """The cached annotation font resolves to the themed (Japanese) family."""
+        import matplotlib
+
+        from fishing_forecast_gcal.infrastructure.services.tide_graph_renderer import (
+            _annotation_font,  # pyright: ignore[reportPrivateUsage]
+            _ensure_style,  # pyright: ignore[reportPrivateUsage]
+        )
+
+        font = _annotation_font()
+
+        assert _annotation_font() is font
+        assert font.get_weight() == "bold"
+        assert font.get_size() == 10
+        with matplotlib.rc_context(_ensure_style()):
+            assert font.get_family() == list(matplotlib.rcParams["font.family"])
+
 
 # ---- Test: Filename ----
 
@@ -597,3 +780,9 @@ class TestDatetimeToHours:
         dt = datetime(2026, 2, 16, 1, 0, tzinfo=JST)
         result = TideGraphRenderer._datetime_to_hours(dt, date(2026, 2, 15))
         assert result == 25.0
+
+    def test_with_seconds(self) -> None:
+        """Seconds are included in the fractional hours."""
+        dt = datetime(2026, 2, 15, 6, 0, 36, tzinfo=JST)
+        result = TideGraphRenderer._datetime_to_hours(dt, date(2026, 2, 15))
+        assert result == pytest.approx(6.01)
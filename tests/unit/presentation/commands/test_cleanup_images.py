@@ -74,8 +74,10 @@ class TestCleanupImagesRun:
 
         return mock_config
 
-    @patch("fishing_forecast_gcal.presentation.commands.cleanup_images.GoogleDriveClient")
-    @patch("fishing_forecast_gcal.presentation.commands.cleanup_images.CleanupDriveImagesUseCase")
+    @patch("fishing_forecast_gcal.infrastructure.clients.google_drive_client.GoogleDriveClient")
+    @patch(
+        "fishing_forecast_gcal.application.usecases.cleanup_drive_images_usecase.CleanupDriveImagesUseCase"
+    )
     def test_run_basic_flow(
         self,
         mock_usecase_class: Mock,
@@ -106,8 +108,10 @@ class TestCleanupImagesRun:
             dry_run=False,
         )
 
-    @patch("fishing_forecast_gcal.presentation.commands.cleanup_images.GoogleDriveClient")
-    @patch("fishing_forecast_gcal.presentation.commands.cleanup_images.CleanupDriveImagesUseCase")
+    @patch("fishing_forecast_gcal.infrastructure.clients.google_drive_client.GoogleDriveClient")
+    @patch(
+        "fishing_forecast_gcal.application.usecases.cleanup_drive_images_usecase.CleanupDriveImagesUseCase"
+    )
     def test_run_dry_run(
         self,
         mock_usecase_class: Mock,
@@ -137,8 +141,10 @@ class TestCleanupImagesRun:
             dry_run=True,
         )
 
-    @patch("fishing_forecast_gcal.presentation.commands.cleanup_images.GoogleDriveClient")
-    @patch("fishing_forecast_gcal.presentation.commands.cleanup_images.CleanupDriveImagesUseCase")
+    @patch("fishing_forecast_gcal.infrastructure.clients.google_drive_client.GoogleDriveClient")
+    @patch(
+        "fishing_forecast_gcal.application.usecases.cleanup_drive_images_usecase.CleanupDriveImagesUseCase"
+    )
     def test_run_with_failures_exits_1(
         self,
         mock_usecase_class: Mock,
@@ -165,8 +171,10 @@ class TestCleanupImagesRun:
 
         assert exc_info.value.code == 1
 
-    @patch("fishing_forecast_gcal.presentation.commands.cleanup_images.GoogleDriveClient")
-    @patch("fishing_forecast_gcal.presentation.commands.cleanup_images.CleanupDriveImagesUseCase")
+    @patch("fishing_forecast_gcal.infrastructure.clients.google_drive_client.GoogleDriveClient")
+    @patch(
+        "fishing_forecast_gcal.application.usecases.cleanup_drive_images_usecase.CleanupDriveImagesUseCase"
+    )
     def test_run_custom_retention(
         self,
         mock_usecase_class: Mock,
@@ -4,7 +4,10 @@
 """
 
 import argparse
+import io
+import logging
 from datetime import date
+from logging.handlers import MemoryHandler
 from unittest.mock import Mock, patch
 
 import pytest
@@ -12,8 +15,10 @@ import pytest
 from fishing_forecast_gcal.presentation.commands.common import (
     add_common_arguments,
     add_period_arguments,
+    flush_logging,
     parse_date,
     setup_logging,
+    unbuffer_logging,
 )
 
 
@@ -38,6 +43,59 @@ class TestSetupLogging:
         call_kwargs = mock_basic_config.call_args[1]
         assert call_kwargs["level"] == 10  # logging.DEBUG
 
+    @patch("fishing_forecast_gcal.presentation.commands.common.logging.basicConfig")
+    def test_setup_logging_buffers_records(self, mock_basic_config: Mock) -> None:
+        """Records are buffered and flushed immediately from ERROR."""
+        setup_logging()
+
+        (handler,) = mock_basic_config.call_args[1]["handlers"]
+        assert isinstance(handler, MemoryHandler)
+        assert handler.capacity == 256
+        assert handler.flushLevel == logging.ERROR
+        assert isinstance(handler.target, logging.StreamHandler)
+        assert handler.target.formatter is not None
+
+
+class TestFlushLogging:
+    """flush_logging / unbuffer_logging tests."""
+
+    def _buffered_logger(self, stream: io.StringIO) -> tuple[logging.Logger, MemoryHandler]:
+        root = logging.Logger("test-root")
+        handler = MemoryHandler(256, target=logging.StreamHandler(stream))
+        root.addHandler(handler)
+        return root, handler
+
+    def test_flush_logging_writes_buffer(self) -> None:
+        """Buffered records are written out."""
+        stream = io.StringIO()
+        root, _ = self._buffered_logger(stream)
+        root.warning("hello")
+        assert stream.getvalue() == ""
+
+        with patch(
+            "fishing_forecast_gcal.presentation.commands.common.logging.getLogger",
+            return_value=root,
+        ):
+            flush_logging()
+
+        assert stream.getvalue() == "hello\n"
+
+    def test_unbuffer_logging_discards_inherited_buffer(self) -> None:
+        """Inherited records are dropped and later records are written directly."""
+        stream = io.StringIO()
+        root, handler = self._buffered_logger(stream)
+        root.warning("parent")
+
+        with patch(
+            "fishing_forecast_gcal.presentation.commands.common.logging.getLogger",
+            return_value=root,
+        ):
+            unbuffer_logging()
+        root.warning("worker")
+
+        assert root.handlers == [handler.target]
+        assert stream.getvalue() == "worker\n"
+
 
 class TestParseDate:
     """parse_date function tests."""
@@ -57,6 +115,16 @@ class TestParseDate:
         with pytest.raises(ValueError):
             parse_date("2026-02-30")
 
+    def test_parse_date_caches_result(self) -> None:
+        """Repeated calls with the same string return the cached date."""
+        assert parse_date("2026-03-01") is parse_date("2026-03-01")
+
+    def test_parse_date_does_not_cache_errors(self) -> None:
+        """Invalid input raises on every call."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid date format"):
+                parse_date("not-a-date")
+
 
 class TestAddCommonArguments:
     """add_common_arguments function tests."""
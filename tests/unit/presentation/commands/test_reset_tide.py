@@ -3,6 +3,7 @@
 reset-tide コマンドの引数定義と実行ロジックのテスト。
 """
 
+import logging
 from datetime import date
 from unittest.mock import Mock, patch
 
@@ -52,9 +53,13 @@ class TestResetTideAddArguments:
 class TestResetTideRun:
     """reset_tide.run tests."""
 
-    @patch("fishing_forecast_gcal.presentation.commands.reset_tide.GoogleCalendarClient")
-    @patch("fishing_forecast_gcal.presentation.commands.reset_tide.CalendarRepository")
-    @patch("fishing_forecast_gcal.presentation.commands.reset_tide.ResetTideUseCase")
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.calendar_repository.CalendarRepository"
+    )
+    @patch("fishing_forecast_gcal.application.usecases.reset_tide_usecase.ResetTideUseCase")
     def test_run_basic_flow_with_force(
         self,
         mock_usecase_class: Mock,
@@ -97,9 +102,13 @@ class TestResetTideRun:
         call_kwargs = mock_usecase.execute.call_args
         assert call_kwargs[1]["dry_run"] is False
 
-    @patch("fishing_forecast_gcal.presentation.commands.reset_tide.GoogleCalendarClient")
-    @patch("fishing_forecast_gcal.presentation.commands.reset_tide.CalendarRepository")
-    @patch("fishing_forecast_gcal.presentation.commands.reset_tide.ResetTideUseCase")
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.calendar_repository.CalendarRepository"
+    )
+    @patch("fishing_forecast_gcal.application.usecases.reset_tide_usecase.ResetTideUseCase")
     def test_run_dry_run(
         self,
         mock_usecase_class: Mock,
@@ -140,9 +149,13 @@ class TestResetTideRun:
         call_kwargs = mock_usecase.execute.call_args
         assert call_kwargs[1]["dry_run"] is True
 
-    @patch("fishing_forecast_gcal.presentation.commands.reset_tide.GoogleCalendarClient")
-    @patch("fishing_forecast_gcal.presentation.commands.reset_tide.CalendarRepository")
-    @patch("fishing_forecast_gcal.presentation.commands.reset_tide.ResetTideUseCase")
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.calendar_repository.CalendarRepository"
+    )
+    @patch("fishing_forecast_gcal.application.usecases.reset_tide_usecase.ResetTideUseCase")
     def test_run_with_failures_exits_1(
         self,
         mock_usecase_class: Mock,
@@ -183,6 +196,48 @@ class TestResetTideRun:
 
         assert exc_info.value.code == 1
 
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.calendar_repository.CalendarRepository"
+    )
+    @patch("fishing_forecast_gcal.application.usecases.reset_tide_usecase.ResetTideUseCase")
+    def test_run_multiple_locations_uses_own_client_per_thread(
+        self,
+        mock_usecase_class: Mock,
+        mock_calendar_repo_class: Mock,
+        mock_calendar_client_class: Mock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Locations are reset on threads, one client per thread, and totals summed."""
+        mock_args = Mock()
+        mock_args.dry_run = False
+        mock_args.force = True
+
+        locations = [Mock(id=f"loc_{i}") for i in range(3)]
+
+        mock_usecase = Mock()
+        mock_usecase.execute.return_value = ResetResult(
+            total_found=2, total_deleted=2, total_failed=0
+        )
+        mock_usecase_class.return_value = mock_usecase
+
+        with caplog.at_level(logging.INFO, logger=reset_tide.__name__):
+            reset_tide.run(
+                mock_args,
+                Mock(),
+                locations,
+                date(2026, 3, 1),
+                date(2026, 3, 3),
+            )
+
+        # スレッド数（= 地点数）ぶん認証済みクライアントを構築する
+        assert mock_calendar_client_class.call_count == 3
+        reset_ids = {call.kwargs["location"].id for call in mock_usecase.execute.call_args_list}
+        assert reset_ids == {"loc_0", "loc_1", "loc_2"}
+        assert "  Deleted: 6 event(s)" in [record.getMessage() for record in caplog.records]
+
     @patch("builtins.input", return_value="n")
     def test_run_confirmation_declined(self, mock_input: Mock) -> None:
         """Exits when user declines confirmation."""
@@ -207,9 +262,13 @@ class TestResetTideRun:
 
         assert exc_info.value.code == 0
 
-    @patch("fishing_forecast_gcal.presentation.commands.reset_tide.GoogleCalendarClient")
-    @patch("fishing_forecast_gcal.presentation.commands.reset_tide.CalendarRepository")
-    @patch("fishing_forecast_gcal.presentation.commands.reset_tide.ResetTideUseCase")
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.calendar_repository.CalendarRepository"
+    )
+    @patch("fishing_forecast_gcal.application.usecases.reset_tide_usecase.ResetTideUseCase")
     @patch("builtins.input", return_value="y")
     def test_run_confirmation_accepted(
         self,
@@ -251,9 +310,13 @@ class TestResetTideRun:
 
         mock_usecase.execute.assert_called_once()
 
-    @patch("fishing_forecast_gcal.presentation.commands.reset_tide.GoogleCalendarClient")
-    @patch("fishing_forecast_gcal.presentation.commands.reset_tide.CalendarRepository")
-    @patch("fishing_forecast_gcal.presentation.commands.reset_tide.ResetTideUseCase")
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.calendar_repository.CalendarRepository"
+    )
+    @patch("fishing_forecast_gcal.application.usecases.reset_tide_usecase.ResetTideUseCase")
     def test_run_dry_run_skips_confirmation(
         self,
         mock_usecase_class: Mock,
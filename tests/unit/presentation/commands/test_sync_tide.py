@@ -3,6 +3,9 @@
 sync-tide コマンドの引数定義と実行ロジックのテスト。
 """
 
+import logging
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from unittest.mock import Mock, patch
 
@@ -64,16 +67,36 @@ class TestSyncTideAddArguments:
         assert args.end_date == "2026-03-08"
         assert args.days == 30
         assert args.dry_run is True
+        assert args.workers == 1
+
+    def test_sync_tide_has_workers_argument(self) -> None:
+        """sync-tide accepts --workers."""
+        import argparse
+
+        parser = argparse.ArgumentParser()
+        subparsers = parser.add_subparsers(dest="command")
+        sync_tide.add_arguments(subparsers)
+
+        args = parser.parse_args(["sync-tide", "--workers", "4"])
+        assert args.workers == 4
 
 
 class TestSyncTideRun:
     """sync_tide.run tests."""
 
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.GoogleCalendarClient")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.TideCalculationAdapter")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.TideDataRepository")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.CalendarRepository")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.SyncTideUseCase")
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter.TideCalculationAdapter"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.tide_data_repository.TideDataRepository"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.calendar_repository.CalendarRepository"
+    )
+    @patch("fishing_forecast_gcal.application.usecases.sync_tide_usecase.SyncTideUseCase")
     def test_run_basic_flow(
         self,
         mock_usecase_class: Mock,
@@ -85,6 +108,7 @@ class TestSyncTideRun:
         """Basic flow: builds dependencies and executes for each date."""
         mock_args = Mock()
         mock_args.dry_run = False
+        mock_args.workers = 1
 
         mock_location = Mock()
         mock_location.id = "test_loc"
@@ -103,6 +127,7 @@ class TestSyncTideRun:
         mock_calendar_client_class.return_value = mock_calendar_client
 
         mock_usecase = Mock()
+        mock_usecase.execute_batch.return_value = {}
         mock_usecase_class.return_value = mock_usecase
 
         sync_tide.run(
@@ -114,13 +139,24 @@ class TestSyncTideRun:
         )
 
         mock_calendar_client.authenticate.assert_called_once()
-        assert mock_usecase.execute.call_count == 2
+        mock_tide_adapter_class.return_value.prepare.assert_called_once_with(mock_location)
+        mock_usecase.execute_batch.assert_called_once_with(
+            mock_location, (date(2026, 2, 8), date(2026, 2, 9))
+        )
 
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.GoogleCalendarClient")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.TideCalculationAdapter")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.TideDataRepository")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.CalendarRepository")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.SyncTideUseCase")
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter.TideCalculationAdapter"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.tide_data_repository.TideDataRepository"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.calendar_repository.CalendarRepository"
+    )
+    @patch("fishing_forecast_gcal.application.usecases.sync_tide_usecase.SyncTideUseCase")
     def test_run_dry_run_skips_execute(
         self,
         mock_usecase_class: Mock,
@@ -129,9 +165,10 @@ class TestSyncTideRun:
         mock_tide_adapter_class: Mock,
         mock_calendar_client_class: Mock,
     ) -> None:
-        """Dry-run mode does not call usecase.execute."""
+        """Dry-run mode neither authenticates nor calls usecase.execute."""
         mock_args = Mock()
         mock_args.dry_run = True
+        mock_args.workers = 1
 
         mock_location = Mock()
         mock_location.id = "test_loc"
@@ -161,12 +198,168 @@ class TestSyncTideRun:
         )
 
         mock_usecase.execute.assert_not_called()
+        mock_usecase.execute_batch.assert_not_called()
+        # dry-run では認証しないが、調和定数の読み込み確認は行う
+        mock_calendar_client_class.assert_not_called()
+        mock_calendar_client.authenticate.assert_not_called()
+        mock_tide_adapter_class.return_value.prepare.assert_called_once_with(mock_location)
+
+    @patch("fishing_forecast_gcal.infrastructure.clients.google_drive_client.GoogleDriveClient")
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter.TideCalculationAdapter"
+    )
+    def test_run_dry_run_skips_drive_client_with_tide_graph(
+        self,
+        mock_tide_adapter_class: Mock,
+        mock_calendar_client_class: Mock,
+        mock_drive_client_class: Mock,
+    ) -> None:
+        """Dry-run builds no Google API client even when tide graphs are enabled."""
+        mock_args = Mock()
+        mock_args.dry_run = True
+        mock_args.workers = 1
+
+        mock_config = Mock()
+        mock_config.tide_graph.enabled = True
 
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.GoogleCalendarClient")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.TideCalculationAdapter")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.TideDataRepository")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.CalendarRepository")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.SyncTideUseCase")
+        sync_tide.run(
+            mock_args,
+            mock_config,
+            [Mock(id="test_loc")],
+            date(2026, 2, 8),
+            date(2026, 2, 8),
+        )
+
+        mock_calendar_client_class.assert_not_called()
+        mock_drive_client_class.assert_not_called()
+
+    @patch("fishing_forecast_gcal.presentation.commands.sync_tide._run_threaded")
+    @patch("fishing_forecast_gcal.presentation.commands.sync_tide._run_parallel")
+    @patch(
+        "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter.TideCalculationAdapter"
+    )
+    def test_run_dry_run_selected_before_execution_strategy(
+        self,
+        mock_tide_adapter_class: Mock,
+        mock_run_parallel: Mock,
+        mock_run_threaded: Mock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Dry-run only logs each pair, even with several workers and locations."""
+        mock_args = Mock()
+        mock_args.dry_run = True
+        mock_args.workers = 4
+
+        with caplog.at_level(logging.INFO, logger=sync_tide.__name__):
+            sync_tide.run(
+                mock_args,
+                Mock(),
+                [Mock(id="loc_a"), Mock(id="loc_b")],
+                date(2026, 2, 8),
+                date(2026, 2, 9),
+            )
+
+        mock_run_parallel.assert_not_called()
+        mock_run_threaded.assert_not_called()
+        messages = [record.getMessage() for record in caplog.records]
+        assert [m for m in messages if m.startswith("[DRY-RUN] Would sync")] == [
+            "[DRY-RUN] Would sync: loc_a 2026-02-08",
+            "[DRY-RUN] Would sync: loc_a 2026-02-09",
+            "[DRY-RUN] Would sync: loc_b 2026-02-08",
+            "[DRY-RUN] Would sync: loc_b 2026-02-09",
+        ]
+        assert "  Processed: 4 days" in messages
+
+    @patch(
+        "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter.TideCalculationAdapter"
+    )
+    def test_run_dry_run_skips_per_date_records_when_info_disabled(
+        self,
+        mock_tide_adapter_class: Mock,
+    ) -> None:
+        """Dry-run builds no per-date log records when INFO is disabled."""
+        mock_args = Mock()
+        mock_args.dry_run = True
+        mock_args.workers = 1
+
+        with (
+            patch.object(sync_tide.logger, "isEnabledFor", return_value=False),
+            patch.object(sync_tide.logger, "info") as mock_info,
+        ):
+            sync_tide.run(
+                mock_args,
+                Mock(),
+                [Mock(id="loc_a"), Mock(id="loc_b")],
+                date(2026, 2, 8),
+                date(2026, 2, 9),
+            )
+
+        logged = [call.args[0] for call in mock_info.call_args_list]
+        assert not [m for m in logged if m.startswith("[DRY-RUN] Would sync")]
+
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter.TideCalculationAdapter"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.tide_data_repository.TideDataRepository"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.calendar_repository.CalendarRepository"
+    )
+    @patch("fishing_forecast_gcal.application.usecases.sync_tide_usecase.SyncTideUseCase")
+    def test_run_logs_summary_without_per_location_info(
+        self,
+        mock_usecase_class: Mock,
+        mock_calendar_repo_class: Mock,
+        mock_tide_repo_class: Mock,
+        mock_tide_adapter_class: Mock,
+        mock_calendar_client_class: Mock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Locations are reported once in the summary; debug logs stay silent at INFO."""
+        mock_args = Mock()
+        mock_args.dry_run = False
+        mock_args.workers = 1
+
+        mock_config = Mock()
+        mock_config.tide_graph.enabled = False
+
+        mock_usecase = Mock()
+        mock_usecase.execute_batch.return_value = {}
+        mock_usecase_class.return_value = mock_usecase
+
+        with caplog.at_level(logging.INFO, logger=sync_tide.__name__):
+            sync_tide.run(
+                mock_args,
+                mock_config,
+                [Mock(id="loc_a"), Mock(id="loc_b")],
+                date(2026, 2, 8),
+                date(2026, 2, 9),
+            )
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert "  Locations: loc_a, loc_b" in messages
+        assert not any(m.startswith(("Processing location", "Synced")) for m in messages)
+
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter.TideCalculationAdapter"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.tide_data_repository.TideDataRepository"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.calendar_repository.CalendarRepository"
+    )
+    @patch("fishing_forecast_gcal.application.usecases.sync_tide_usecase.SyncTideUseCase")
     def test_run_with_errors_exits_1(
         self,
         mock_usecase_class: Mock,
@@ -178,6 +371,7 @@ class TestSyncTideRun:
         """Exits with code 1 when sync errors occur."""
         mock_args = Mock()
         mock_args.dry_run = False
+        mock_args.workers = 1
 
         mock_location = Mock()
         mock_location.id = "test_loc"
@@ -196,7 +390,7 @@ class TestSyncTideRun:
         mock_calendar_client_class.return_value = mock_calendar_client
 
         mock_usecase = Mock()
-        mock_usecase.execute.side_effect = RuntimeError("API error")
+        mock_usecase.execute_batch.return_value = {date(2026, 2, 8): RuntimeError("API error")}
         mock_usecase_class.return_value = mock_usecase
 
         with pytest.raises(SystemExit) as exc_info:
@@ -210,13 +404,170 @@ class TestSyncTideRun:
 
         assert exc_info.value.code == 1
 
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.GoogleDriveClient")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.TideGraphRenderer")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.GoogleCalendarClient")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.TideCalculationAdapter")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.TideDataRepository")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.CalendarRepository")
-    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.SyncTideUseCase")
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter.TideCalculationAdapter"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.tide_data_repository.TideDataRepository"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.calendar_repository.CalendarRepository"
+    )
+    @patch("fishing_forecast_gcal.application.usecases.sync_tide_usecase.SyncTideUseCase")
+    def test_run_multiple_locations_syncs_each_with_own_client(
+        self,
+        mock_usecase_class: Mock,
+        mock_calendar_repo_class: Mock,
+        mock_tide_repo_class: Mock,
+        mock_tide_adapter_class: Mock,
+        mock_calendar_client_class: Mock,
+    ) -> None:
+        """Multiple locations are synced on threads, one client per thread."""
+        mock_args = Mock()
+        mock_args.dry_run = False
+        mock_args.workers = 1
+
+        locations = []
+        for i in range(3):
+            location = Mock()
+            location.id = f"loc_{i}"
+            locations.append(location)
+
+        mock_config = Mock()
+        mock_config.tide_graph.enabled = False
+
+        mock_usecase = Mock()
+        mock_usecase.execute_batch.return_value = {}
+        mock_usecase_class.return_value = mock_usecase
+
+        sync_tide.run(mock_args, mock_config, locations, date(2026, 2, 8), date(2026, 2, 9))
+
+        # スレッド数（= 地点数）ぶん認証済みクライアントを構築する
+        assert mock_calendar_client_class.call_count == 3
+        # 調和定数は 1 つのアダプターで一度だけ読み込み、全スレッドで共有する
+        mock_tide_adapter_class.assert_called_once()
+        assert mock_tide_adapter_class.return_value.prepare.call_count == 3
+        assert {call.kwargs["adapter"] for call in mock_tide_repo_class.call_args_list} == {
+            mock_tide_adapter_class.return_value
+        }
+        synced = {call.args[0].id for call in mock_usecase.execute_batch.call_args_list}
+        assert synced == {"loc_0", "loc_1", "loc_2"}
+
+    @patch("fishing_forecast_gcal.infrastructure.services.tide_graph_renderer.TideGraphRenderer")
+    @patch("fishing_forecast_gcal.infrastructure.clients.google_drive_client.GoogleDriveClient")
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter.TideCalculationAdapter"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.tide_data_repository.TideDataRepository"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.calendar_repository.CalendarRepository"
+    )
+    @patch("fishing_forecast_gcal.application.usecases.sync_tide_usecase.SyncTideUseCase")
+    def test_run_multiple_locations_share_drive_client(
+        self,
+        mock_usecase_class: Mock,
+        mock_calendar_repo_class: Mock,
+        mock_tide_repo_class: Mock,
+        mock_tide_adapter_class: Mock,
+        mock_calendar_client_class: Mock,
+        mock_drive_client_class: Mock,
+        mock_renderer_class: Mock,
+    ) -> None:
+        """One authenticated Drive client is shared by every thread's UseCase."""
+        mock_args = Mock()
+        mock_args.dry_run = False
+        mock_args.workers = 1
+
+        locations = [Mock(id=f"loc_{i}") for i in range(3)]
+
+        mock_config = Mock()
+        mock_config.tide_graph.enabled = True
+        mock_config.tide_graph.drive_folder_name = "tide-graphs"
+
+        mock_usecase_class.return_value.execute_batch.return_value = {}
+
+        sync_tide.run(mock_args, mock_config, locations, date(2026, 2, 8), date(2026, 2, 9))
+
+        # Calendar はスレッドごと、Drive はスレッドごとのサービスを内部で持つため 1 つを共有する
+        assert mock_calendar_client_class.call_count == 3
+        mock_drive_client_class.assert_called_once()
+        mock_drive_client_class.return_value.authenticate.assert_called_once()
+        drive_clients = {call.kwargs["drive_client"] for call in mock_usecase_class.call_args_list}
+        assert drive_clients == {mock_drive_client_class.return_value}
+
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter.TideCalculationAdapter"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.tide_data_repository.TideDataRepository"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.calendar_repository.CalendarRepository"
+    )
+    @patch("fishing_forecast_gcal.application.usecases.sync_tide_usecase.SyncTideUseCase")
+    def test_run_multiple_locations_aggregates_errors(
+        self,
+        mock_usecase_class: Mock,
+        mock_calendar_repo_class: Mock,
+        mock_tide_repo_class: Mock,
+        mock_tide_adapter_class: Mock,
+        mock_calendar_client_class: Mock,
+    ) -> None:
+        """Failures from any location thread are counted and exit with code 1."""
+        mock_args = Mock()
+        mock_args.dry_run = False
+        mock_args.workers = 1
+
+        locations = []
+        for i in range(3):
+            location = Mock()
+            location.id = f"loc_{i}"
+            locations.append(location)
+
+        mock_config = Mock()
+        mock_config.tide_graph.enabled = False
+
+        def execute_batch(location: Mock, dates: list[date]) -> dict[date, Exception]:
+            if location.id == "loc_1":
+                raise RuntimeError("API error")
+            return {}
+
+        mock_usecase = Mock()
+        mock_usecase.execute_batch.side_effect = execute_batch
+        mock_usecase_class.return_value = mock_usecase
+
+        with pytest.raises(SystemExit) as exc_info:
+            sync_tide.run(mock_args, mock_config, locations, date(2026, 2, 8), date(2026, 2, 9))
+
+        assert exc_info.value.code == 1
+        assert mock_usecase.execute_batch.call_count == 3
+
+    @patch("fishing_forecast_gcal.infrastructure.clients.google_drive_client.GoogleDriveClient")
+    @patch("fishing_forecast_gcal.infrastructure.services.tide_graph_renderer.TideGraphRenderer")
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter.TideCalculationAdapter"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.tide_data_repository.TideDataRepository"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.calendar_repository.CalendarRepository"
+    )
+    @patch("fishing_forecast_gcal.application.usecases.sync_tide_usecase.SyncTideUseCase")
     def test_run_with_tide_graph_enabled(
         self,
         mock_usecase_class: Mock,
@@ -230,6 +581,7 @@ class TestSyncTideRun:
         """Tide graph dependencies are built when enabled."""
         mock_args = Mock()
         mock_args.dry_run = False
+        mock_args.workers = 1
 
         mock_location = Mock()
         mock_location.id = "test_loc"
@@ -252,6 +604,7 @@ class TestSyncTideRun:
         mock_drive_client_class.return_value = mock_drive_client
 
         mock_usecase = Mock()
+        mock_usecase.execute_batch.return_value = {}
         mock_usecase_class.return_value = mock_usecase
 
         sync_tide.run(
@@ -264,4 +617,232 @@ class TestSyncTideRun:
 
         mock_drive_client.authenticate.assert_called_once()
         mock_tide_graph_class.assert_called_once()
-        mock_usecase.execute.assert_called_once()
+        mock_usecase.execute_batch.assert_called_once()
+
+    @patch(
+        "fishing_forecast_gcal.presentation.commands.sync_tide.ProcessPoolExecutor",
+        ThreadPoolExecutor,
+    )
+    @patch("fishing_forecast_gcal.infrastructure.clients.google_auth.authenticate")
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter.TideCalculationAdapter"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.tide_data_repository.TideDataRepository"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.calendar_repository.CalendarRepository"
+    )
+    @patch("fishing_forecast_gcal.application.usecases.sync_tide_usecase.SyncTideUseCase")
+    def test_run_parallel_dispatches_all_pairs(
+        self,
+        mock_usecase_class: Mock,
+        mock_calendar_repo_class: Mock,
+        mock_tide_repo_class: Mock,
+        mock_tide_adapter_class: Mock,
+        mock_calendar_client_class: Mock,
+        mock_authenticate: Mock,
+    ) -> None:
+        """--workers > 1 dispatches every (location, date) pair to the pool in date chunks."""
+        mock_args = Mock()
+        mock_args.dry_run = False
+        mock_args.workers = 2
+
+        locations = [Mock(id="loc_a"), Mock(id="loc_b")]
+
+        mock_config = Mock()
+        mock_config.tide_graph.enabled = False
+
+        mock_usecase = Mock()
+        mock_usecase.execute_batch.return_value = {}
+        mock_usecase_class.return_value = mock_usecase
+
+        sync_tide.run(
+            mock_args,
+            mock_config,
+            locations,
+            date(2026, 2, 8),
+            date(2026, 2, 10),
+        )
+
+        synced = [
+            (loc, target_date)
+            for loc, chunk in (call.args for call in mock_usecase.execute_batch.call_args_list)
+            for target_date in chunk
+        ]
+        assert sorted(synced, key=lambda pair: (pair[0].id, pair[1])) == [
+            (loc, date(2026, 2, day)) for loc in locations for day in (8, 9, 10)
+        ]
+        mock_usecase.execute.assert_not_called()
+        # トークンの更新は親プロセスで一度だけ行う
+        mock_authenticate.assert_called_once_with(
+            mock_config.settings.google_credentials_path, mock_config.settings.google_token_path
+        )
+
+    @patch("fishing_forecast_gcal.presentation.commands.sync_tide._run_parallel")
+    @patch("fishing_forecast_gcal.presentation.commands.sync_tide._build_drive_client")
+    @patch("fishing_forecast_gcal.presentation.commands.sync_tide._build_usecase")
+    @patch(
+        "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter.TideCalculationAdapter"
+    )
+    def test_run_parallel_skips_main_process_usecase(
+        self,
+        mock_tide_adapter_class: Mock,
+        mock_build_usecase: Mock,
+        mock_build_drive_client: Mock,
+        mock_run_parallel: Mock,
+    ) -> None:
+        """--workers > 1 leaves client setup to the workers. (並列時は親で UseCase を構築しない)"""
+        mock_args = Mock()
+        mock_args.dry_run = False
+        mock_args.workers = 2
+        mock_run_parallel.return_value = (6, 0)
+
+        sync_tide.run(
+            mock_args,
+            Mock(),
+            [Mock(id="loc_a"), Mock(id="loc_b")],
+            date(2026, 2, 8),
+            date(2026, 2, 10),
+        )
+
+        mock_run_parallel.assert_called_once()
+        mock_build_usecase.assert_not_called()
+        mock_build_drive_client.assert_not_called()
+
+    @patch(
+        "fishing_forecast_gcal.presentation.commands.sync_tide.ProcessPoolExecutor",
+        ThreadPoolExecutor,
+    )
+    @patch("fishing_forecast_gcal.infrastructure.clients.google_auth.authenticate")
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter.TideCalculationAdapter"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.tide_data_repository.TideDataRepository"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.calendar_repository.CalendarRepository"
+    )
+    @patch("fishing_forecast_gcal.application.usecases.sync_tide_usecase.SyncTideUseCase")
+    def test_run_parallel_with_errors_exits_1(
+        self,
+        mock_usecase_class: Mock,
+        mock_calendar_repo_class: Mock,
+        mock_tide_repo_class: Mock,
+        mock_tide_adapter_class: Mock,
+        mock_calendar_client_class: Mock,
+        mock_authenticate: Mock,
+    ) -> None:
+        """Worker failures are counted and cause exit code 1."""
+        mock_args = Mock()
+        mock_args.dry_run = False
+        mock_args.workers = 2
+
+        mock_config = Mock()
+        mock_config.tide_graph.enabled = False
+
+        mock_usecase = Mock()
+        mock_usecase.execute_batch.side_effect = RuntimeError("API error")
+        mock_usecase_class.return_value = mock_usecase
+
+        with (
+            patch.object(sync_tide.logger, "info") as mock_info,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            sync_tide.run(
+                mock_args,
+                mock_config,
+                [Mock(id="loc_a")],
+                date(2026, 2, 8),
+                date(2026, 2, 9),
+            )
+
+        assert exc_info.value.code == 1
+        # 失敗したタスクの日数ぶんをエラーとして数える
+        mock_info.assert_any_call("  Errors: %d", 2)
+
+    @patch(
+        "fishing_forecast_gcal.presentation.commands.sync_tide.ProcessPoolExecutor",
+        ThreadPoolExecutor,
+    )
+    @patch("fishing_forecast_gcal.infrastructure.clients.google_auth.authenticate")
+    @patch(
+        "fishing_forecast_gcal.infrastructure.clients.google_calendar_client.GoogleCalendarClient"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.adapters.tide_calculation_adapter.TideCalculationAdapter"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.tide_data_repository.TideDataRepository"
+    )
+    @patch(
+        "fishing_forecast_gcal.infrastructure.repositories.calendar_repository.CalendarRepository"
+    )
+    @patch("fishing_forecast_gcal.application.usecases.sync_tide_usecase.SyncTideUseCase")
+    def test_run_parallel_counts_partial_chunk_failures(
+        self,
+        mock_usecase_class: Mock,
+        mock_calendar_repo_class: Mock,
+        mock_tide_repo_class: Mock,
+        mock_tide_adapter_class: Mock,
+        mock_calendar_client_class: Mock,
+        mock_authenticate: Mock,
+    ) -> None:
+        """Dates failed inside a chunk are counted individually."""
+        mock_args = Mock()
+        mock_args.dry_run = False
+        mock_args.workers = 2
+
+        mock_config = Mock()
+        mock_config.tide_graph.enabled = False
+
+        def execute_batch(location: Mock, dates: Sequence[date]) -> dict[date, Exception]:
+            return {d: RuntimeError("API error") for d in dates if d == date(2026, 2, 9)}
+
+        mock_usecase = Mock()
+        mock_usecase.execute_batch.side_effect = execute_batch
+        mock_usecase_class.return_value = mock_usecase
+
+        with (
+            patch.object(sync_tide.logger, "info") as mock_info,
+            pytest.raises(SystemExit),
+        ):
+            sync_tide.run(
+                mock_args,
+                mock_config,
+                [Mock(id="loc_a")],
+                date(2026, 2, 8),
+                date(2026, 2, 10),
+            )
+
+        mock_info.assert_any_call("  Processed: %d days", 2)
+        mock_info.assert_any_call("  Errors: %d", 1)
+
+    @patch("fishing_forecast_gcal.presentation.commands.sync_tide._build_usecase")
+    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.unbuffer_logging")
+    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.setup_logging")
+    def test_init_worker_sets_up_logging_before_unbuffering(
+        self,
+        mock_setup_logging: Mock,
+        mock_unbuffer_logging: Mock,
+        mock_build_usecase: Mock,
+    ) -> None:
+        """Workers started without fork configure logging before dropping the buffer."""
+        calls = Mock()
+        calls.attach_mock(mock_setup_logging, "setup_logging")
+        calls.attach_mock(mock_unbuffer_logging, "unbuffer_logging")
+        config = Mock()
+        locations = [Mock(id="loc_a")]
+
+        sync_tide._init_worker(config, locations, True)  # pyright: ignore[reportPrivateUsage]
+
+        assert [c[0] for c in calls.mock_calls] == ["setup_logging", "unbuffer_logging"]
+        mock_setup_logging.assert_called_once_with(True)
+        mock_build_usecase.assert_called_once_with(config, locations)
@@ -5,12 +5,16 @@ cli.py が薄いディスパッチャーとして正しく機能することを
 各コマンドの実行ロジックは commands/ 配下のテストで検証します。
 """
 
+import subprocess
+import sys
 from datetime import date
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
 from fishing_forecast_gcal.presentation.cli import (
+    _build_parser,
     _resolve_locations,
     _resolve_period,
     main,
@@ -115,12 +119,51 @@ class TestParseArgs:
             with pytest.raises(SystemExit):
                 parse_args()
 
+    def test_parse_args_workers_zero_error(self) -> None:
+        """--workers 0 raises error."""
+        with patch("sys.argv", ["prog", "sync-tide", "--workers", "0"]):
+            with pytest.raises(SystemExit):
+                parse_args()
+
     def test_parse_args_no_subcommand(self) -> None:
         """No subcommand raises error."""
         with patch("sys.argv", ["prog"]):
             with pytest.raises(SystemExit):
                 parse_args()
 
+    def test_parser_is_built_once(self) -> None:
+        """The parser is reused across parse_args calls."""
+        assert _build_parser() is _build_parser()
+        with patch("sys.argv", ["prog", "sync-tide", "--days", "3"]):
+            first = parse_args()
+        with patch("sys.argv", ["prog", "sync-tide"]):
+            second = parse_args()
+        assert first.days == 3
+        assert second.days is None
+
+
+class TestLazyImports:
+    """Heavy dependencies are not imported for argument parsing."""
+
+    def test_help_does_not_import_heavy_dependencies(self) -> None:
+        """--help loads no UTide / matplotlib / Google API / YAML modules."""
+        code = (
+            "import sys\n"
+            "sys.argv = ['fishing-forecast-gcal', 'sync-tide', '--help']\n"
+            "from fishing_forecast_gcal.presentation.cli import parse_args\n"
+            "try:\n"
+            "    parse_args()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "heavy = ('utide', 'matplotlib', 'googleapiclient', 'yaml')\n"
+            "print('HEAVY:' + ','.join(m for m in heavy if m in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert "HEAVY:\n" in result.stdout
+
 
 class TestParseArgsResetTide:
     """reset-tide subcommand argument parsing tests."""
@@ -340,14 +383,14 @@ class TestMain:
 
     @patch("fishing_forecast_gcal.presentation.cli.parse_args")
     @patch("fishing_forecast_gcal.presentation.cli.common.setup_logging")
-    @patch("fishing_forecast_gcal.presentation.cli.load_config")
-    @patch("fishing_forecast_gcal.presentation.cli.Path")
+    @patch("fishing_forecast_gcal.presentation.config_loader.validate_runtime_paths")
+    @patch("fishing_forecast_gcal.presentation.config_loader.load_config")
     @patch("fishing_forecast_gcal.presentation.commands.sync_tide.run")
     def test_main_dispatches_sync_tide(
         self,
         mock_sync_run: Mock,
-        mock_path: Mock,
         mock_load_config: Mock,
+        mock_validate_paths: Mock,
         mock_setup_logging: Mock,
         mock_parse_args: Mock,
     ) -> None:
@@ -363,10 +406,6 @@ class TestMain:
         mock_args.verbose = False
         mock_parse_args.return_value = mock_args
 
-        mock_config_path = Mock()
-        mock_config_path.exists.return_value = True
-        mock_path.return_value = mock_config_path
-
         mock_location = Mock()
         mock_location.id = "test_loc"
         mock_location.name = "Test Location"
@@ -390,14 +429,14 @@ class TestMain:
 
     @patch("fishing_forecast_gcal.presentation.cli.parse_args")
     @patch("fishing_forecast_gcal.presentation.cli.common.setup_logging")
-    @patch("fishing_forecast_gcal.presentation.cli.load_config")
-    @patch("fishing_forecast_gcal.presentation.cli.Path")
+    @patch("fishing_forecast_gcal.presentation.config_loader.validate_runtime_paths")
+    @patch("fishing_forecast_gcal.presentation.config_loader.load_config")
     @patch("fishing_forecast_gcal.presentation.commands.cleanup_images.run")
     def test_main_dispatches_cleanup_images(
         self,
         mock_cleanup_run: Mock,
-        mock_path: Mock,
         mock_load_config: Mock,
+        mock_validate_paths: Mock,
         mock_setup_logging: Mock,
         mock_parse_args: Mock,
     ) -> None:
@@ -408,10 +447,6 @@ class TestMain:
         mock_args.verbose = False
         mock_parse_args.return_value = mock_args
 
-        mock_config_path = Mock()
-        mock_config_path.exists.return_value = True
-        mock_path.return_value = mock_config_path
-
         mock_settings = Mock()
         mock_settings.timezone = "Asia/Tokyo"
         mock_settings.calendar_id = "test-calendar-id-12345"
@@ -426,27 +461,51 @@ class TestMain:
 
     @patch("fishing_forecast_gcal.presentation.cli.parse_args")
     @patch("fishing_forecast_gcal.presentation.cli.common.setup_logging")
-    @patch("fishing_forecast_gcal.presentation.cli.Path")
     def test_main_config_file_not_found(
         self,
-        mock_path: Mock,
         mock_setup_logging: Mock,
         mock_parse_args: Mock,
+        tmp_path: Path,
     ) -> None:
         """Exits when config file is not found."""
         mock_args = Mock()
-        mock_args.config = "missing.yaml"
+        mock_args.config = str(tmp_path / "missing.yaml")
         mock_args.verbose = False
         mock_parse_args.return_value = mock_args
 
-        mock_config_path = Mock()
-        mock_config_path.exists.return_value = False
-        mock_path.return_value = mock_config_path
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 1
+
+    @patch("fishing_forecast_gcal.presentation.cli.parse_args")
+    @patch("fishing_forecast_gcal.presentation.cli.common.setup_logging")
+    @patch("fishing_forecast_gcal.presentation.config_loader.validate_runtime_paths")
+    @patch("fishing_forecast_gcal.presentation.config_loader.load_config")
+    @patch("fishing_forecast_gcal.presentation.commands.sync_tide.run")
+    def test_main_validates_runtime_paths_once(
+        self,
+        mock_sync_run: Mock,
+        mock_load_config: Mock,
+        mock_validate_paths: Mock,
+        mock_setup_logging: Mock,
+        mock_parse_args: Mock,
+    ) -> None:
+        """Runtime paths are validated once and a failure exits before dispatch."""
+        mock_args = Mock()
+        mock_args.command = "sync-tide"
+        mock_args.config = "config/config.yaml"
+        mock_args.verbose = False
+        mock_parse_args.return_value = mock_args
+        mock_validate_paths.side_effect = ValueError("Google credentials file not found: x")
 
         with pytest.raises(SystemExit) as exc_info:
             main()
 
         assert exc_info.value.code == 1
+        mock_load_config.assert_called_once_with("config/config.yaml")
+        mock_validate_paths.assert_called_once_with(mock_load_config.return_value)
+        mock_sync_run.assert_not_called()
 
     @patch("fishing_forecast_gcal.presentation.cli.parse_args")
     @patch("fishing_forecast_gcal.presentation.cli.common.setup_logging")
@@ -465,14 +524,14 @@ class TestMain:
 
     @patch("fishing_forecast_gcal.presentation.cli.parse_args")
     @patch("fishing_forecast_gcal.presentation.cli.common.setup_logging")
-    @patch("fishing_forecast_gcal.presentation.cli.load_config")
-    @patch("fishing_forecast_gcal.presentation.cli.Path")
+    @patch("fishing_forecast_gcal.presentation.config_loader.validate_runtime_paths")
+    @patch("fishing_forecast_gcal.presentation.config_loader.load_config")
     @patch("fishing_forecast_gcal.presentation.commands.sync_tide.run")
     def test_main_days_option_calculates_end_date(
         self,
         mock_sync_run: Mock,
-        mock_path: Mock,
         mock_load_config: Mock,
+        mock_validate_paths: Mock,
         mock_setup_logging: Mock,
         mock_parse_args: Mock,
     ) -> None:
@@ -488,10 +547,6 @@ class TestMain:
         mock_args.verbose = False
         mock_parse_args.return_value = mock_args
 
-        mock_config_path = Mock()
-        mock_config_path.exists.return_value = True
-        mock_path.return_value = mock_config_path
-
         mock_location = Mock()
         mock_location.id = "test_loc"
         mock_location.name = "Test Location"
@@ -515,12 +570,12 @@ class TestMain:
 
     @patch("fishing_forecast_gcal.presentation.cli.parse_args")
     @patch("fishing_forecast_gcal.presentation.cli.common.setup_logging")
-    @patch("fishing_forecast_gcal.presentation.cli.load_config")
-    @patch("fishing_forecast_gcal.presentation.cli.Path")
+    @patch("fishing_forecast_gcal.presentation.config_loader.validate_runtime_paths")
+    @patch("fishing_forecast_gcal.presentation.config_loader.load_config")
     def test_main_location_id_not_found(
         self,
-        mock_path: Mock,
         mock_load_config: Mock,
+        mock_validate_paths: Mock,
         mock_setup_logging: Mock,
         mock_parse_args: Mock,
     ) -> None:
@@ -532,10 +587,6 @@ class TestMain:
         mock_args.verbose = False
         mock_parse_args.return_value = mock_args
 
-        mock_config_path = Mock()
-        mock_config_path.exists.return_value = True
-        mock_path.return_value = mock_config_path
-
         mock_location = Mock()
         mock_location.id = "existing_loc"
 
@@ -555,14 +606,14 @@ class TestMain:
 
     @patch("fishing_forecast_gcal.presentation.cli.parse_args")
     @patch("fishing_forecast_gcal.presentation.cli.common.setup_logging")
-    @patch("fishing_forecast_gcal.presentation.cli.load_config")
-    @patch("fishing_forecast_gcal.presentation.cli.Path")
+    @patch("fishing_forecast_gcal.presentation.config_loader.validate_runtime_paths")
+    @patch("fishing_forecast_gcal.presentation.config_loader.load_config")
     @patch("fishing_forecast_gcal.presentation.commands.reset_tide.run")
     def test_main_dispatches_reset_tide(
         self,
         mock_reset_run: Mock,
-        mock_path: Mock,
         mock_load_config: Mock,
+        mock_validate_paths: Mock,
         mock_setup_logging: Mock,
         mock_parse_args: Mock,
     ) -> None:
@@ -578,10 +629,6 @@ class TestMain:
         mock_args.verbose = False
         mock_parse_args.return_value = mock_args
 
-        mock_config_path = Mock()
-        mock_config_path.exists.return_value = True
-        mock_path.return_value = mock_config_path
-
         mock_location = Mock()
         mock_location.id = "test_loc"
         mock_location.name = "Test Location"
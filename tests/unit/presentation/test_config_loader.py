@@ -1,7 +1,10 @@
 """Unit tests for config_loader."""
 
+import json
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -11,10 +14,20 @@ from fishing_forecast_gcal.presentation.config_loader import (
     AppConfig,
     AppSettings,
     FishingConditionSettings,
+    clear_config_cache,
     load_config,
+    validate_runtime_paths,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_config_cache() -> Iterator[None]:
+    """Do not share in-process memoized configs between tests."""
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
 @pytest.fixture
 def valid_config_dict() -> dict[str, Any]:
     """Valid configuration dictionary."""
@@ -84,7 +97,7 @@ class TestLoadConfig:
         assert settings.update_interval_hours == 3
         assert settings.forecast_window_days == 7
         assert settings.tide_register_months == 12
-        assert settings.high_priority_hours == [4, 5, 6, 7, 20, 21, 22, 23]
+        assert settings.high_priority_hours == (4, 5, 6, 7, 20, 21, 22, 23)
         assert settings.calendar_id == "test@group.calendar.google.com"
 
     def test_location_mapping(self, temp_config_file: Path) -> None:
@@ -98,6 +111,13 @@ class TestLoadConfig:
         assert location.longitude == 139.0
         assert location.station_id == "TK"
 
+    def test_location_labels(self, temp_config_file: Path) -> None:
+        """Test that location labels are formatted once and reused."""
+        config = load_config(str(temp_config_file))
+
+        assert config.location_labels == "Home (loc_home)"
+        assert config.location_labels is config.location_labels
+
     def test_fishing_conditions_values(self, temp_config_file: Path) -> None:
         """Test that fishing conditions are correctly parsed."""
         config = load_config(str(temp_config_file))
@@ -105,7 +125,17 @@ class TestLoadConfig:
 
         assert conditions.prime_time_offset_hours == 2
         assert conditions.max_wind_speed_ms == 10.0
-        assert conditions.preferred_tide_types == ["大潮", "中潮"]
+        assert conditions.preferred_tide_types == frozenset({"大潮", "中潮"})
+
+    def test_uses_libyaml_loader(self, temp_config_file: Path) -> None:
+        """YAML is parsed with the C-accelerated safe loader when available."""
+        with patch(
+            "fishing_forecast_gcal.presentation.config_loader.yaml.load",
+            wraps=yaml.load,
+        ) as mock_load:
+            load_config(str(temp_config_file), use_cache=False)
+
+        assert mock_load.call_args.kwargs["Loader"] is yaml.CSafeLoader
 
     def test_file_not_found(self) -> None:
         """Test error when config file does not exist."""
@@ -191,14 +221,34 @@ class TestSettingsValidation:
     def test_credentials_file_not_found(
         self, valid_config_dict: dict[str, Any], tmp_path: Path
     ) -> None:
-        """Test error when credentials file does not exist."""
+        """Missing credentials file is reported by validate_runtime_paths, not load_config."""
         valid_config_dict["settings"]["google_credentials_path"] = "nonexistent.json"
 
         config_path = tmp_path / "config.yaml"
         config_path.write_text(yaml.dump(valid_config_dict))
 
+        config = load_config(str(config_path))
+
         with pytest.raises(ValueError, match="Google credentials file not found"):
-            load_config(str(config_path))
+            validate_runtime_paths(config)
+
+    def test_validate_runtime_paths_passes(self, temp_config_file: Path) -> None:
+        """Existing credentials file passes validation."""
+        validate_runtime_paths(load_config(str(temp_config_file)))
+
+    def test_app_settings_validates_on_construction(self) -> None:
+        """AppSettings rejects out-of-range values however it is built."""
+        with pytest.raises(ValueError, match="forecast_window_days must be >= 1"):
+            AppSettings(
+                timezone="Asia/Tokyo",
+                update_interval_hours=3,
+                forecast_window_days=0,
+                tide_register_months=12,
+                high_priority_hours=(4,),
+                google_credentials_path="config/credentials.json",
+                google_token_path="config/token.json",
+                calendar_id="test@group.calendar.google.com",
+            )
 
 
 class TestLocationsValidation:
@@ -307,7 +357,7 @@ class TestFishingConditionsValidation:
         # Check defaults
         assert conditions.prime_time_offset_hours == 2
         assert conditions.max_wind_speed_ms == 10.0
-        assert conditions.preferred_tide_types == ["大潮", "中潮"]
+        assert conditions.preferred_tide_types == frozenset({"大潮", "中潮"})
 
     def test_partial_fishing_conditions(
         self, valid_config_dict: dict[str, Any], tmp_path: Path
@@ -330,7 +380,7 @@ class TestFishingConditionsValidation:
         # Check override and defaults
         assert conditions.prime_time_offset_hours == 3
         assert conditions.max_wind_speed_ms == 10.0
-        assert conditions.preferred_tide_types == ["大潮", "中潮"]
+        assert conditions.preferred_tide_types == frozenset({"大潮", "中潮"})
 
     def test_invalid_prime_time_offset(
         self, valid_config_dict: dict[str, Any], tmp_path: Path
@@ -363,3 +413,121 @@ class TestFishingConditionsValidation:
 
         with pytest.raises(ValueError, match="max_wind_speed_ms must be >= 0"):
             load_config(str(config_path))
+
+    def test_fishing_condition_settings_validates_on_construction(self) -> None:
+        """FishingConditionSettings rejects out-of-range values however it is built."""
+        with pytest.raises(ValueError, match="prime_time_offset_hours must be >= 1"):
+            FishingConditionSettings(
+                prime_time_offset_hours=0,
+                max_wind_speed_ms=10.0,
+                preferred_tide_types=frozenset({"大潮"}),
+            )
+
+
+class TestConfigCache:
+    """Tests for the parsed-config sidecar cache."""
+
+    def test_cache_written_and_reused(self, temp_config_file: Path) -> None:
+        """Second load reads the sidecar without parsing YAML."""
+        first = load_config(str(temp_config_file))
+        cache_file = temp_config_file.with_name("config.yaml.cache.json")
+        assert cache_file.exists()
+        clear_config_cache()
+
+        with patch(
+            "fishing_forecast_gcal.presentation.config_loader.yaml.load",
+            side_effect=AssertionError("YAML should not be parsed"),
+        ):
+            second = load_config(str(temp_config_file))
+
+        assert second == first
+
+    def test_cache_invalidated_when_config_changes(
+        self, temp_config_file: Path, valid_config_dict: dict[str, Any]
+    ) -> None:
+        """A modified config file is parsed again."""
+        load_config(str(temp_config_file))
+
+        data = yaml.safe_load(temp_config_file.read_text())
+        data["settings"]["calendar_id"] = "changed@group.calendar.google.com"
+        temp_config_file.write_text(yaml.dump(data))
+
+        config = load_config(str(temp_config_file))
+
+        assert config.settings.calendar_id == "changed@group.calendar.google.com"
+
+    def test_cache_hit_does_not_stat_credentials(self, temp_config_file: Path) -> None:
+        """A cache hit does not check the credentials file; validation does."""
+        config = load_config(str(temp_config_file))
+        Path(config.settings.google_credentials_path).unlink()
+        clear_config_cache()
+
+        cached = load_config(str(temp_config_file))
+
+        assert cached == config
+        with pytest.raises(ValueError, match="Google credentials file not found"):
+            validate_runtime_paths(cached)
+
+    def test_corrupted_cache_is_ignored(self, temp_config_file: Path) -> None:
+        """An unreadable sidecar falls back to parsing and is rewritten."""
+        cache_file = temp_config_file.with_name("config.yaml.cache.json")
+        cache_file.write_bytes(b"not json")
+
+        config = load_config(str(temp_config_file))
+
+        assert config.settings.timezone == "Asia/Tokyo"
+        assert cache_file.read_bytes() != b"not json"
+
+    def test_cache_holds_plain_json_and_is_revalidated(self, temp_config_file: Path) -> None:
+        """The sidecar stores plain data; a cache hit still validates it."""
+        load_config(str(temp_config_file))
+        cache_file = temp_config_file.with_name("config.yaml.cache.json")
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        data["config"]["locations"] = []
+        cache_file.write_text(json.dumps(data), encoding="utf-8")
+        clear_config_cache()
+
+        with pytest.raises(ValueError, match="locations must not be empty"):
+            load_config(str(temp_config_file))
+
+    def test_use_cache_false_skips_sidecar(self, temp_config_file: Path) -> None:
+        """use_cache=False neither reads nor writes the sidecar."""
+        load_config(str(temp_config_file), use_cache=False)
+
+        assert not temp_config_file.with_name("config.yaml.cache.json").exists()
+
+    def test_repeated_load_reuses_instance(self, temp_config_file: Path) -> None:
+        """An unchanged file is served from memory without reading the sidecar."""
+        first = load_config(str(temp_config_file))
+
+        with patch(
+            "fishing_forecast_gcal.presentation.config_loader._read_config_cache",
+            side_effect=AssertionError("sidecar should not be read"),
+        ):
+            second = load_config(str(temp_config_file))
+
+        assert second is first
+
+    def test_memoized_containers_are_immutable(self, temp_config_file: Path) -> None:
+        """The shared config exposes its sequences as tuples."""
+        config = load_config(str(temp_config_file))
+
+        assert isinstance(config.locations, tuple)
+        assert isinstance(config.settings.high_priority_hours, tuple)
+        with pytest.raises(AttributeError):
+            config.locations.append(config.locations[0])  # type: ignore[attr-defined]
+        with pytest.raises(AttributeError):
+            config.settings.high_priority_hours.append(0)  # type: ignore[attr-defined]
+
+    def test_memo_invalidated_when_config_changes(self, temp_config_file: Path) -> None:
+        """A modified file is reloaded even after an in-process hit."""
+        first = load_config(str(temp_config_file))
+
+        data = yaml.safe_load(temp_config_file.read_text())
+        data["settings"]["timezone"] = "UTC"
+        temp_config_file.write_text(yaml.dump(data))
+
+        second = load_config(str(temp_config_file))
+
+        assert second is not first
+        assert second.settings.timezone == "UTC"
@@ -6,10 +6,15 @@ JMA推算テキストパーサーの単体テストです。
 from __future__ import annotations
 
 from datetime import date, time
+from pathlib import Path
 
 import pytest
 
-from tests.support.jma_suisan_parser import JMASuisanDaily, parse_jma_suisan_text
+from tests.support.jma_suisan_parser import (
+    JMASuisanDaily,
+    load_jma_suisan_file,
+    parse_jma_suisan_text,
+)
 
 
 class TestJMASuisanDaily:
@@ -184,3 +189,21 @@ class TestParseJMASuisanText:
         # Invalid times should be skipped
         assert len(daily.highs) == 0
         assert len(daily.lows) == 1
+
+
+class TestLoadJMASuisanFile:
+    """Tests for load_jma_suisan_file."""
+
+    def test_parses_file_once_per_path_and_station(self, tmp_path: Path) -> None:
+        """Test repeated loads reuse the parsed result."""
+        fixture = Path(__file__).resolve().parents[2] / "integration" / "fixtures"
+        source = fixture / "jma_suisan_TK_2024_11_03.txt"
+        path = tmp_path / "suisan.txt"
+        path.write_text(source.read_text(encoding="utf-8"), encoding="utf-8")
+
+        first = load_jma_suisan_file(path, "TK")
+        second = load_jma_suisan_file(path, "TK")
+
+        assert second is first
+        assert first == parse_jma_suisan_text(path.read_text(encoding="utf-8"), "TK")
+        assert load_jma_suisan_file(path, "XX") is not first